@@ -0,0 +1,3 @@
+"""
+Benchmarks __init__
+"""
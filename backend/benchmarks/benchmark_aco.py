@@ -0,0 +1,216 @@
+"""
+ACO Benchmarks
+Measures the path finding engines on synthetic road-like grid graphs
+
+Run from the backend directory:
+    python -m benchmarks.benchmark_aco islands --colonies 1 2 4 8
+    python -m benchmarks.benchmark_aco sampling
+    python -m benchmarks.benchmark_aco vectorized --ants 15 50 200
+    python -m benchmarks.benchmark_aco local-search --routes 10 --budget 50
+"""
+import argparse
+import random
+import time
+from typing import Callable, List
+from src.domain.entities import Graph, Node, Edge
+from src.infrastructure.algorithms import (
+    AntColonyOptimization,
+    DijkstraAlgorithm,
+    IslandModelACO,
+    VectorizedAntColonyOptimization
+)
+from src.infrastructure.algorithms.pheromone_store import PheromoneStore
+from src.infrastructure.algorithms.roulette_sampler import RouletteSampler
+
+
+def build_grid_graph(size: int, seed: int = 1) -> Graph:
+    """Build a size x size grid with bidirectional edges of random length"""
+    rng = random.Random(seed)
+    graph = Graph()
+    for row in range(size):
+        for col in range(size):
+            graph.add_node(Node(
+                id=f"{row}_{col}",
+                latitude=21.0 + row * 0.001,
+                longitude=105.8 + col * 0.001,
+                name=f"Junction {row}_{col}"
+            ))
+    for row in range(size):
+        for col in range(size):
+            for d_row, d_col in ((0, 1), (1, 0), (0, -1), (-1, 0)):
+                n_row, n_col = row + d_row, col + d_col
+                if 0 <= n_row < size and 0 <= n_col < size:
+                    graph.add_edge(Edge(
+                        from_node=f"{row}_{col}",
+                        to_node=f"{n_row}_{n_col}",
+                        weight=round(0.12 + rng.random() * 0.1, 3)
+                    ))
+    return graph
+
+
+def timed(function: Callable[[], object], repeat: int) -> float:
+    """Best wall-clock time of several runs, in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def benchmark_islands(graph: Graph, start: str, end: str, colonies: List[int], repeat: int) -> None:
+    """Wall-clock scaling of the island model across worker processes"""
+    print(f"Island model: {len(graph.nodes)} nodes, {len(graph.edges)} edges, {start} -> {end}")
+    print(f"{'colonies':>8} {'wall s':>8} {'colony runs/s':>14} {'scaling':>8} {'distance':>9}")
+    baseline = None
+    for n_colonies in colonies:
+        aco = IslandModelACO(n_colonies=n_colonies, migration_interval=5)
+        try:
+            aco.find_optimal_path(graph, start, end)  # start the worker pool
+            result = {}
+            seconds = timed(
+                lambda: result.update(path=aco.find_optimal_path(graph, start, end)),
+                repeat
+            )
+        finally:
+            aco.shutdown()
+        throughput = n_colonies / seconds
+        baseline = baseline or throughput
+        print(
+            f"{n_colonies:>8} {seconds:>8.3f} {throughput:>14.2f} "
+            f"{throughput / baseline:>7.2f}x {result['path'].distance:>9.3f}"
+        )
+
+
+def benchmark_vectorized(
+    graph: Graph,
+    start: str,
+    end: str,
+    ant_counts: List[int],
+    iterations: int,
+    repeat: int
+) -> None:
+    """Ant throughput of the NumPy lockstep engine against the per-ant one"""
+    print(f"Vectorized engine: {len(graph.nodes)} nodes, {start} -> {end}, "
+          f"{iterations} iterations, no convergence stop")
+    print(f"{'ants':>6} {'per-ant ants/s':>15} {'lockstep ants/s':>16} {'ratio':>7}")
+    for n_ants in ant_counts:
+        throughput = []
+        for engine in (AntColonyOptimization, VectorizedAntColonyOptimization):
+            aco = engine(n_ants=n_ants, n_iterations=iterations)
+            aco.find_optimal_path(graph, start, end)  # build the cached tables
+            seconds = timed(lambda: aco.find_optimal_path(graph, start, end), repeat)
+            throughput.append(n_ants * iterations / seconds)
+        print(
+            f"{n_ants:>6} {throughput[0]:>15.0f} {throughput[1]:>16.0f} "
+            f"{throughput[1] / throughput[0]:>6.2f}x"
+        )
+
+
+def benchmark_sampling(graph: Graph, steps: int, repeat: int) -> None:
+    """Per-decision cost of the next-edge selection kernels"""
+    compiled = graph.compile()
+    aco = AntColonyOptimization()
+    rng = random.Random(1)
+
+    # A trail that has seen some iterations: lazily evaporated deposits
+    pheromone = PheromoneStore(compiled.edge_count)
+    for _ in range(20):
+        pheromone.evaporate(0.5)
+        pheromone.deposit(rng.sample(range(compiled.edge_count), 50), rng.random())
+    nodes = [rng.randrange(compiled.node_count) for _ in range(steps)]
+    sampler = RouletteSampler(compiled, aco.alpha, aco.beta)
+    sampler.refresh(pheromone)
+
+    def explicit() -> None:
+        for node in nodes:
+            aco._select_next_node(sampler, pheromone, compiled.open_slots(node))
+
+    def cumulative() -> None:
+        sampler.refresh(pheromone)
+        for node in nodes:
+            sampler.draw(pheromone, node)
+
+    print(f"Next-edge selection: {compiled.node_count} nodes, {steps} decisions")
+    print(f"{'kernel':>22} {'ns/step':>9} {'speedup':>8}")
+    baseline = None
+    for name, kernel in (("weights + choices", explicit), ("cumulative + bisect", cumulative)):
+        seconds = timed(kernel, repeat)
+        baseline = baseline or seconds
+        print(f"{name:>22} {seconds / steps * 1e9:>9.0f} {baseline / seconds:>7.2f}x")
+
+
+def benchmark_local_search(graph: Graph, routes: int, repeat: int, budget_ms: float) -> None:
+    """Path quality with and without local search, per route and per equal time budget"""
+    rng = random.Random(1)
+    node_ids = list(graph.nodes)
+    pairs = [tuple(rng.sample(node_ids, 2)) for _ in range(routes)]
+    exact = DijkstraAlgorithm()
+    optimum = [exact.find_optimal_path(graph, start, end).distance for start, end in pairs]
+
+    print(f"Local search: {len(graph.nodes)} nodes, {routes} random routes, unseeded colony")
+    print(f"{'stage':>14} {'ms/route':>9} {'gap to optimum %':>17}")
+    for name, local_search in (("ants only", False), ("local search", True)):
+        aco = AntColonyOptimization(local_search=local_search)
+        seconds = 0.0
+        gaps = []
+        for _ in range(repeat):
+            for (start, end), best in zip(pairs, optimum):
+                started = time.perf_counter()
+                path = aco.find_optimal_path(graph, start, end)
+                seconds += time.perf_counter() - started
+                # Ants that never reach the end count as a 100% gap
+                gaps.append(min(path.distance / best - 1.0, 1.0) if path.nodes else 1.0)
+        ms = seconds / (routes * repeat) * 1000.0
+        gap = sum(gaps) / len(gaps) * 100.0
+        print(f"{name:>14} {ms:>9.1f} {gap:>17.2f}")
+
+    # Same wall time for both: the colony without local search spends the
+    # time local search costs on more iterations
+    print(f"Equal wall time: {budget_ms:.0f} ms per route")
+    print(f"{'stage':>14} {'iterations':>10} {'gap to optimum %':>17}")
+    for name, local_search in (("ants only", False), ("local search", True)):
+        aco = AntColonyOptimization(local_search=local_search)
+        iterations = 0
+        gaps = []
+        for _ in range(repeat):
+            for (start, end), best in zip(pairs, optimum):
+                path = aco.find_optimal_path(graph, start, end, deadline_ms=budget_ms)
+                iterations += aco.get_run_info()["iterations_used"]
+                gaps.append(min(path.distance / best - 1.0, 1.0) if path.nodes else 1.0)
+        gap = sum(gaps) / len(gaps) * 100.0
+        print(f"{name:>14} {iterations / len(gaps):>10.1f} {gap:>17.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "section", choices=["islands", "vectorized", "sampling", "local-search"]
+    )
+    parser.add_argument("--size", type=int, default=40, help="grid side length")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--colonies", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--ants", type=int, nargs="+", default=[15, 50, 200])
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--steps", type=int, default=100000, help="sampling decisions")
+    parser.add_argument("--routes", type=int, default=10, help="local search routes")
+    parser.add_argument(
+        "--budget", type=float, default=50.0, help="local search time budget per route in ms"
+    )
+    args = parser.parse_args()
+
+    graph = build_grid_graph(args.size)
+    start, end = "0_0", f"{args.size // 4}_{args.size // 4}"
+
+    if args.section == "islands":
+        benchmark_islands(graph, start, end, args.colonies, args.repeat)
+    elif args.section == "vectorized":
+        benchmark_vectorized(graph, start, end, args.ants, args.iterations, args.repeat)
+    elif args.section == "sampling":
+        benchmark_sampling(graph, args.steps, args.repeat)
+    elif args.section == "local-search":
+        benchmark_local_search(graph, args.routes, args.repeat, args.budget)
+
+
+if __name__ == "__main__":
+    main()
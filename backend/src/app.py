@@ -36,7 +36,7 @@ def create_app(config_name: str = 'development') -> Flask:
     })
 
     # Setup dependency injection
-    container = DependencyContainer()
+    container = DependencyContainer(config)
 
     # Get controller with all dependencies injected
     controller = container.get_route_controller()
@@ -2,6 +2,25 @@
 Application Use Cases __init__
 """
 from .find_optimal_path_use_case import FindOptimalPathUseCase
+from .batch_find_optimal_path_use_case import BatchFindOptimalPathUseCase, RouteQuery
+from .reoptimize_route_use_case import ReoptimizeRouteUseCase
+from .stream_optimal_path_use_case import StreamOptimalPathUseCase
+from .get_distance_matrix_use_case import GetDistanceMatrixUseCase
 from .get_graph_use_case import GetGraphUseCase
+from .get_metrics_use_case import GetMetricsUseCase
+from .submit_optimization_job_use_case import JobQueueFullError, SubmitOptimizationJobUseCase
+from .get_optimization_job_use_case import GetOptimizationJobUseCase
 
-__all__ = ['FindOptimalPathUseCase', 'GetGraphUseCase']
+__all__ = [
+    'FindOptimalPathUseCase',
+    'BatchFindOptimalPathUseCase',
+    'RouteQuery',
+    'ReoptimizeRouteUseCase',
+    'StreamOptimalPathUseCase',
+    'GetDistanceMatrixUseCase',
+    'GetGraphUseCase',
+    'GetMetricsUseCase',
+    'SubmitOptimizationJobUseCase',
+    'GetOptimizationJobUseCase',
+    'JobQueueFullError'
+]
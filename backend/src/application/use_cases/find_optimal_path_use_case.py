@@ -2,9 +2,16 @@
 Find Optimal Path Use Case
 SOLID - Single Responsibility: Only coordinates path finding business logic
 """
-from typing import List, Optional
-from ...domain.interfaces import IGraphRepository, IPathFinderAlgorithm
-from ...domain.entities import OptimizationResult, Path
+from dataclasses import replace
+from typing import Any, Callable, Dict, List, Optional
+from ...domain.interfaces import (
+    HISTORY_LEVELS,
+    IConnectivityIndex,
+    IGraphRepository,
+    IPathFinderAlgorithm,
+    IResultRepository
+)
+from ...domain.entities import GraphOverlay, OptimizationResult, Path, RouteRecord
 
 
 class FindOptimalPathUseCase:
@@ -16,19 +23,43 @@ class FindOptimalPathUseCase:
     def __init__(
         self,
         graph_repository: IGraphRepository,
-        path_finder: IPathFinderAlgorithm
+        path_finder: IPathFinderAlgorithm,
+        default_deadline_ms: Optional[float] = None,
+        path_finders: Optional[Dict[str, IPathFinderAlgorithm]] = None,
+        default_algorithm: str = "aco",
+        connectivity: Optional[IConnectivityIndex] = None,
+        result_repository: Optional[IResultRepository] = None,
+        default_history: str = "none"
     ):
         """
         Constructor injection for dependencies (DIP)
+
+        path_finders maps the algorithm names a request may select to their
+        implementations; path_finder serves default_algorithm. With a
+        connectivity index, unreachable pairs are rejected before any
+        path finder runs. With a result repository, found routes are stored
+        and the result carries their ID. default_history is the iteration
+        history level of requests that do not choose one.
         """
         self._repository = graph_repository
         self._path_finder = path_finder
+        self._default_deadline_ms = default_deadline_ms
+        self._default_algorithm = default_algorithm
+        self._path_finders = dict(path_finders or {})
+        self._path_finders[default_algorithm] = path_finder
+        self._connectivity = connectivity
+        self._results = result_repository
+        self._default_history = default_history
 
     def execute(
         self,
         start_node_id: str,
         end_node_id: str,
-        blocked_edges: Optional[List[tuple]] = None
+        blocked_edges: Optional[List[tuple]] = None,
+        deadline_ms: Optional[float] = None,
+        algorithm: Optional[str] = None,
+        history: Optional[str] = None,
+        on_iteration: Optional[Callable[[Dict[str, Any]], None]] = None
     ) -> OptimizationResult:
         """
         Execute the use case
@@ -37,59 +68,131 @@ class FindOptimalPathUseCase:
             start_node_id: Starting node ID
             end_node_id: Ending node ID
             blocked_edges: List of blocked edges (disaster simulation)
+            deadline_ms: Latency budget in milliseconds (anytime mode);
+                defaults to the configured budget
+            algorithm: Name of the path finder to use, e.g. "aco",
+                "astar" or "dijkstra"; defaults to the configured one
+            history: Iteration history to return, one of "none",
+                "summary", "paths" or "full"; defaults to the configured one
+            on_iteration: Receives each iteration's record as it is
+                produced; the result's history then stays empty
 
         Returns:
             OptimizationResult with best path and iteration history
         """
+        # Work on a copy-on-write overlay of the shared graph; only the
+        # per-request blocked edges are stored, the base is never modified
+        graph = GraphOverlay.over(self._repository.get_graph(), blocked_edges)
+        return self.execute_on(
+            graph, start_node_id, end_node_id,
+            deadline_ms=deadline_ms, algorithm=algorithm, history=history,
+            on_iteration=on_iteration
+        )
+
+    def execute_on(
+        self,
+        graph: GraphOverlay,
+        start_node_id: str,
+        end_node_id: str,
+        deadline_ms: Optional[float] = None,
+        algorithm: Optional[str] = None,
+        store_result: bool = True,
+        history: Optional[str] = None,
+        on_iteration: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> OptimizationResult:
+        """
+        Execute the use case on an overlay that already carries the blocked edges
+
+        Lets callers share one overlay, and its compiled snapshot, between
+        queries with the same blocked edges. The overlay is not modified.
+        store_result=False keeps intermediate routes out of the result
+        repository.
+        """
         # Validate inputs
         if not start_node_id or not end_node_id:
             raise ValueError("Start and end nodes must be provided")
 
+        algorithm = algorithm or self._default_algorithm
+        path_finder = self._path_finders.get(algorithm)
+        if path_finder is None:
+            raise ValueError(
+                f"Unknown algorithm '{algorithm}', expected one of: "
+                + ", ".join(sorted(self._path_finders))
+            )
+
+        history = history or self._default_history
+        if history not in HISTORY_LEVELS:
+            raise ValueError(
+                f"Unknown history level '{history}', expected one of: "
+                + ", ".join(HISTORY_LEVELS)
+            )
+
         if start_node_id == end_node_id:
             # Same start and end - return direct path
             return OptimizationResult(
                 best_path=Path(nodes=[start_node_id], distance=0.0),
                 iterations_history=[],
                 total_iterations=0,
-                ants_per_iteration=0
+                ants_per_iteration=0,
+                algorithm=algorithm
             )
 
-        # Get graph from repository and create a working copy
-        # This prevents modifying the original graph (fixes persistence bug)
-        original_graph = self._repository.get_graph()
-        graph = original_graph.copy()
-
         # Validate nodes exist
         if start_node_id not in graph.nodes:
             raise ValueError(f"Start node '{start_node_id}' not found in graph")
         if end_node_id not in graph.nodes:
             raise ValueError(f"End node '{end_node_id}' not found in graph")
 
-        # Block edges if specified (disaster scenario)
-        if blocked_edges:
-            for from_node, to_node in blocked_edges:
-                try:
-                    graph.block_edge(from_node, to_node)
-                except Exception as e:
-                    print(f"Warning: Could not block edge {from_node}-{to_node}: {e}")
+        # Reject pairs without any route before spending the search budget
+        if self._connectivity is not None and not self._connectivity.is_reachable(
+            graph, start_node_id, end_node_id
+        ):
+            raise ValueError(
+                f"No route from '{start_node_id}' to '{end_node_id}'"
+                + (" with the given blocked edges" if graph.blocked_pairs else "")
+            )
 
-        # Find optimal path using algorithm
-        best_path = self._path_finder.find_optimal_path(
+        # Find optimal path using algorithm; the overlay already carries
+        # the blocked edges, so they are not passed again
+        best_path = path_finder.find_optimal_path(
             graph=graph,
             start_node=start_node_id,
             end_node=end_node_id,
-            blocked_edges=blocked_edges
+            deadline_ms=deadline_ms if deadline_ms is not None else self._default_deadline_ms,
+            history=history,
+            on_iteration=on_iteration
         )
 
-        # Get iteration history from algorithm
-        iterations_history = self._path_finder.get_iterations_history()
+        # Get iteration history and run details from algorithm
+        iterations_history = path_finder.get_iterations_history()
+        run_info = path_finder.get_run_info()
+        # The history may be off or hold only the most recent iterations
+        iterations_used = run_info.get("iterations_used", len(iterations_history))
 
         # Create result
         result = OptimizationResult(
             best_path=best_path,
             iterations_history=iterations_history,
-            total_iterations=len(iterations_history),
-            ants_per_iteration=self._path_finder.n_ants
+            total_iterations=iterations_used,
+            ants_per_iteration=getattr(path_finder, "n_ants", 0),
+            stop_reason=run_info.get("stop_reason", "max_iterations"),
+            iterations_used=iterations_used,
+            elapsed_ms=run_info.get("elapsed_ms", 0.0),
+            warm_start=run_info.get("warm_start"),
+            algorithm=algorithm,
+            seed_distance=run_info.get("seed_distance"),
+            improved_on_seed=run_info.get("improved_on_seed"),
+            corridor_nodes=run_info.get("corridor_nodes"),
+            corridor_edges=run_info.get("corridor_edges")
         )
 
+        if store_result and self._results is not None and best_path.is_valid():
+            result = replace(result, result_id=self._results.save(RouteRecord(
+                start=start_node_id,
+                end=end_node_id,
+                blocked_edges=graph.blocked_edges,
+                path=best_path,
+                algorithm=algorithm
+            )))
+
         return result
@@ -0,0 +1,51 @@
+"""
+Get Distance Matrix Use Case
+SOLID - Single Responsibility: Only coordinates many-to-many distance queries
+"""
+from typing import List, Optional
+from ...domain.interfaces import IDistanceMatrixCalculator, IGraphRepository
+from ...domain.entities import DistanceMatrix, GraphOverlay
+
+
+class GetDistanceMatrixUseCase:
+    """
+    Use case for shortest distances between sets of sources and targets
+    Bounds the matrix size and applies the request's blocked edges
+    """
+
+    def __init__(
+        self,
+        graph_repository: IGraphRepository,
+        calculator: IDistanceMatrixCalculator,
+        max_cells: int = 10000
+    ):
+        self._repository = graph_repository
+        self._calculator = calculator
+        self._max_cells = max_cells
+
+    def execute(
+        self,
+        sources: List[str],
+        targets: List[str],
+        blocked_edges: Optional[List[tuple]] = None,
+        include_paths: bool = False
+    ) -> DistanceMatrix:
+        """
+        Execute the use case
+
+        Args:
+            sources: Node IDs of the matrix rows
+            targets: Node IDs of the matrix columns
+            blocked_edges: List of blocked edges (disaster simulation)
+            include_paths: Also return the node path of every cell
+
+        Returns:
+            DistanceMatrix in row-major order
+        """
+        if not sources or not targets:
+            raise ValueError("Sources and targets must be provided")
+        if len(sources) * len(targets) > self._max_cells:
+            raise ValueError(f"At most {self._max_cells} matrix cells per request")
+
+        graph = GraphOverlay.over(self._repository.get_graph(), blocked_edges)
+        return self._calculator.compute(graph, sources, targets, include_paths)
@@ -0,0 +1,24 @@
+"""
+Get Metrics Use Case
+SOLID - Single Responsibility: Only collects runtime statistics
+"""
+from typing import Any, Dict
+
+
+class GetMetricsUseCase:
+    """
+    Use case for reporting runtime statistics
+    Each source is any object exposing a stats() dictionary
+    """
+
+    def __init__(self, sources: Dict[str, Any]):
+        self._sources = sources
+
+    def execute(self) -> Dict[str, Any]:
+        """
+        Execute the use case
+
+        Returns:
+            Dictionary of statistics keyed by source name
+        """
+        return {name: source.stats() for name, source in self._sources.items()}
@@ -0,0 +1,26 @@
+"""
+Get Optimization Job Use Case
+SOLID - Single Responsibility: Only looks up background optimization jobs
+"""
+from typing import Optional
+from ...domain.interfaces import IJobRepository
+from ...domain.entities import OptimizationJob
+
+
+class GetOptimizationJobUseCase:
+    """Use case for reading the state and result of a submitted job"""
+
+    def __init__(self, job_repository: IJobRepository):
+        self._jobs = job_repository
+
+    def execute(self, job_id: str) -> Optional[OptimizationJob]:
+        """
+        Execute the use case
+
+        Args:
+            job_id: ID returned when the job was submitted
+
+        Returns:
+            The job's current state, or None if unknown or expired
+        """
+        return self._jobs.get(job_id)
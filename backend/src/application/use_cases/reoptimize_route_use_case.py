@@ -0,0 +1,162 @@
+"""
+Reoptimize Route Use Case
+SOLID - Single Responsibility: Only coordinates repairs of earlier routes
+"""
+from dataclasses import replace
+from typing import List, Optional
+from ...domain.interfaces import IGraphRepository, IResultRepository
+from ...domain.entities import GraphOverlay, OptimizationResult, Path, RouteRecord
+from .find_optimal_path_use_case import FindOptimalPathUseCase
+
+
+class ReoptimizeRouteUseCase:
+    """
+    Use case for updating an earlier route after more edges are blocked
+
+    A route that avoids every blocked edge is returned as is. Otherwise
+    only the broken stretch, from the node before its first unusable edge
+    to the node after its last one, is searched again and spliced in; the
+    whole route is recomputed only when that stretch cannot be repaired.
+    Path finders warm-start from the pheromone cache, which keeps the
+    earlier runs of the route.
+    """
+
+    def __init__(
+        self,
+        graph_repository: IGraphRepository,
+        find_optimal_path_use_case: FindOptimalPathUseCase,
+        result_repository: IResultRepository,
+        default_deadline_ms: Optional[float] = None
+    ):
+        self._repository = graph_repository
+        self._find_optimal_path = find_optimal_path_use_case
+        self._results = result_repository
+        self._default_deadline_ms = default_deadline_ms
+
+    def execute(
+        self,
+        result_id: Optional[str] = None,
+        previous: Optional[RouteRecord] = None,
+        blocked_edges: Optional[List[tuple]] = None,
+        deadline_ms: Optional[float] = None,
+        algorithm: Optional[str] = None
+    ) -> OptimizationResult:
+        """
+        Execute the use case
+
+        Args:
+            result_id: ID of a stored result to start from
+            previous: Earlier route, when no result_id is given
+            blocked_edges: Edges blocked since the earlier route
+            deadline_ms: Latency budget of the repair search; defaults to
+                the configured budget
+            algorithm: Path finder of the repair search; defaults to the
+                one of the earlier route
+
+        Returns:
+            OptimizationResult of the updated route, with a new result_id
+        """
+        if previous is None:
+            if not result_id:
+                raise ValueError("A result ID or previous route must be provided")
+            previous = self._results.get(result_id)
+            if previous is None:
+                raise ValueError(f"Unknown or expired result ID '{result_id}'")
+
+        blocked = previous.blocked_edges | RouteRecord.pairs(blocked_edges or ())
+        graph = GraphOverlay.over(self._repository.get_graph(), blocked)
+        algorithm = algorithm or previous.algorithm
+        if deadline_ms is None:
+            deadline_ms = self._default_deadline_ms
+        nodes = list(previous.path.nodes)
+
+        broken = [
+            i for i, (from_node, to_node) in enumerate(zip(nodes, nodes[1:]))
+            if self._edge_weight(graph, from_node, to_node) is None
+        ]
+        if not broken:
+            distance = sum(
+                self._edge_weight(graph, from_node, to_node)
+                for from_node, to_node in zip(nodes, nodes[1:])
+            )
+            result = OptimizationResult(
+                best_path=Path(nodes=nodes, distance=distance),
+                iterations_history=[],
+                total_iterations=0,
+                ants_per_iteration=0,
+                stop_reason="unchanged",
+                algorithm=algorithm,
+                reoptimized="unchanged"
+            )
+            return self._store(result, previous, graph)
+
+        segment_start = nodes[broken[0]]
+        segment_end = nodes[broken[-1] + 1]
+        try:
+            segment = self._find_optimal_path.execute_on(
+                graph, segment_start, segment_end,
+                deadline_ms=deadline_ms, algorithm=algorithm, store_result=False,
+                history="none"
+            )
+        except ValueError:
+            segment = None
+
+        if segment is None or not segment.best_path.is_valid():
+            result = self._find_optimal_path.execute_on(
+                graph, previous.start, previous.end,
+                deadline_ms=deadline_ms, algorithm=algorithm, store_result=False
+            )
+            return self._store(replace(result, reoptimized="recomputed"), previous, graph)
+
+        spliced = _without_loops(
+            nodes[:broken[0]] + list(segment.best_path.nodes) + nodes[broken[-1] + 2:]
+        )
+        distance = sum(
+            self._edge_weight(graph, from_node, to_node)
+            for from_node, to_node in zip(spliced, spliced[1:])
+        )
+        result = replace(
+            segment,
+            best_path=Path(nodes=spliced, distance=distance),
+            reoptimized="repaired"
+        )
+        return self._store(result, previous, graph)
+
+    def _edge_weight(self, graph: GraphOverlay, from_node: str, to_node: str) -> Optional[float]:
+        """Weight of the cheapest open edge between two nodes, or None"""
+        weights = [
+            edge.weight for edge in graph.get_out_edges(from_node)
+            if edge.to_node == to_node and not edge.is_blocked
+        ]
+        return min(weights) if weights else None
+
+    def _store(
+        self,
+        result: OptimizationResult,
+        previous: RouteRecord,
+        graph: GraphOverlay
+    ) -> OptimizationResult:
+        """Store the updated route so it can be re-optimized again"""
+        result_id = self._results.save(RouteRecord(
+            start=previous.start,
+            end=previous.end,
+            blocked_edges=graph.blocked_edges,
+            path=result.best_path,
+            algorithm=result.algorithm
+        ))
+        return replace(result, result_id=result_id)
+
+
+def _without_loops(nodes: List[str]) -> List[str]:
+    """Cut out every cycle, keeping the first visit of each node"""
+    path: List[str] = []
+    position = {}
+    for node in nodes:
+        if node in position:
+            for removed in path[position[node] + 1:]:
+                del position[removed]
+            del path[position[node] + 1:]
+            continue
+        position[node] = len(path)
+        path.append(node)
+    return path
@@ -0,0 +1,129 @@
+"""
+Stream Optimal Path Use Case
+SOLID - Single Responsibility: Only turns one route search into a stream of events
+"""
+import queue
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from .find_optimal_path_use_case import FindOptimalPathUseCase
+
+# (event name, payload): "iteration" records, then one "result" or "error"
+Event = Tuple[str, Dict[str, Any]]
+
+
+class _Cancelled(Exception):
+    """Raised into a search whose stream was closed"""
+
+
+class _EventStream:
+    """
+    Iterator over a running search's events up to the final one
+
+    Closing it, or reaching the end, lets the search stop at its next
+    iteration; unlike a generator it also does so when closed unstarted.
+    """
+
+    def __init__(self, first: Tuple[str, Any], events: queue.Queue, closed: threading.Event):
+        self._next: Optional[Tuple[str, Any]] = first
+        self._events = events
+        self._closed = closed
+        self._done = False
+
+    def __iter__(self) -> '_EventStream':
+        return self
+
+    def __next__(self) -> Event:
+        if self._done:
+            raise StopIteration
+        name, payload = self._next if self._next is not None else self._events.get()
+        self._next = None
+        if name != "iteration":
+            self.close()
+        if name == "error":
+            return name, {"error": str(payload)}
+        return name, payload
+
+    def close(self) -> None:
+        self._done = True
+        self._closed.set()
+
+
+class StreamOptimalPathUseCase:
+    """
+    Use case for following a route search while it runs
+
+    The search runs on its own thread and passes every iteration to a
+    bounded queue, so the caller can forward it at once and no history is
+    kept. A slow reader holds the search up once the queue is full; a
+    closed stream aborts it at the next iteration.
+    """
+
+    def __init__(
+        self,
+        find_optimal_path_use_case: FindOptimalPathUseCase,
+        queue_size: int = 32
+    ):
+        self._find_optimal_path = find_optimal_path_use_case
+        self._queue_size = max(1, queue_size)
+
+    def execute(
+        self,
+        start_node_id: str,
+        end_node_id: str,
+        blocked_edges: Optional[List[tuple]] = None,
+        deadline_ms: Optional[float] = None,
+        algorithm: Optional[str] = None,
+        history: str = "full"
+    ) -> Iterator[Event]:
+        """
+        Start the search and return its events
+
+        Waits for the first event, so invalid requests raise ValueError
+        here rather than inside the stream; later failures end the stream
+        with an "error" event. The arguments are those of
+        FindOptimalPathUseCase.execute; history sets what each "iteration"
+        event holds. The "result" event is the final result without
+        iteration records.
+        """
+        events: queue.Queue = queue.Queue(maxsize=self._queue_size)
+        closed = threading.Event()
+
+        def emit(event: Tuple[str, Any]) -> None:
+            # Wait for room, but give up once the reader is gone
+            while not closed.is_set():
+                try:
+                    events.put(event, timeout=0.1)
+                    return
+                except queue.Full:
+                    pass
+            raise _Cancelled()
+
+        def run() -> None:
+            try:
+                result = self._find_optimal_path.execute(
+                    start_node_id,
+                    end_node_id,
+                    blocked_edges=blocked_edges,
+                    deadline_ms=deadline_ms,
+                    algorithm=algorithm,
+                    history=history,
+                    on_iteration=lambda entry: emit(("iteration", entry))
+                )
+                summary = result.to_dict()
+                summary.pop("iterations")
+                emit(("result", summary))
+            except _Cancelled:
+                pass
+            except Exception as e:
+                # Passed on as is; the reader turns it into an error event
+                try:
+                    emit(("error", e))
+                except _Cancelled:
+                    pass
+
+        threading.Thread(target=run, name="route-stream", daemon=True).start()
+        first = events.get()
+        if first[0] == "error":
+            closed.set()
+            raise first[1]
+        return _EventStream(first, events, closed)
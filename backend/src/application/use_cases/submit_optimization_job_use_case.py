@@ -0,0 +1,149 @@
+"""
+Submit Optimization Job Use Case
+SOLID - Single Responsibility: Only runs route searches in the background
+"""
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import Any, Dict, List, Optional
+from ...domain.interfaces import IJobRepository
+from ...domain.entities import OptimizationJob
+from ...domain.entities.optimization_job import DONE, FAILED, QUEUED, RUNNING
+from .find_optimal_path_use_case import FindOptimalPathUseCase
+
+
+class JobQueueFullError(Exception):
+    """Raised when a job is submitted while max_pending jobs are unfinished"""
+
+
+class SubmitOptimizationJobUseCase:
+    """
+    Use case for queueing a route search and returning at once
+
+    Jobs run on a fixed pool of worker threads, so a burst of heavy
+    searches waits in the queue instead of holding request threads. At
+    most max_pending jobs may be queued or running; beyond that new jobs
+    are rejected rather than queued without bound.
+    """
+
+    def __init__(
+        self,
+        find_optimal_path_use_case: FindOptimalPathUseCase,
+        job_repository: IJobRepository,
+        max_workers: int = 2,
+        max_pending: int = 32
+    ):
+        self._find_optimal_path = find_optimal_path_use_case
+        self._jobs = job_repository
+        self._max_workers = max(1, max_workers)
+        self._max_pending = max(1, max_pending)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._submitted = 0
+        self._rejected = 0
+
+    def execute(
+        self,
+        start_node_id: str,
+        end_node_id: str,
+        blocked_edges: Optional[List[tuple]] = None,
+        deadline_ms: Optional[float] = None,
+        algorithm: Optional[str] = None,
+        history: Optional[str] = None
+    ) -> OptimizationJob:
+        """
+        Execute the use case
+
+        The arguments are those of FindOptimalPathUseCase.execute; invalid
+        ones make the job fail rather than this call.
+
+        Returns:
+            The queued job
+
+        Raises:
+            JobQueueFullError: max_pending jobs are already unfinished
+        """
+        with self._lock:
+            if self._pending >= self._max_pending:
+                self._rejected += 1
+                raise JobQueueFullError(
+                    f"Too many pending jobs (at most {self._max_pending})"
+                )
+            self._pending += 1
+            self._submitted += 1
+
+        job = OptimizationJob(job_id=uuid.uuid4().hex, status=QUEUED, submitted_at=time.time())
+        self._jobs.save(job)
+        arguments = {
+            "blocked_edges": blocked_edges,
+            "deadline_ms": deadline_ms,
+            "algorithm": algorithm,
+            "history": history
+        }
+        try:
+            self._get_executor().submit(
+                self._run, job, start_node_id, end_node_id, arguments
+            )
+        except RuntimeError as e:
+            # The pool was shut down
+            self._jobs.save(replace(job, status=FAILED, finished_at=time.time(), error=str(e)))
+            self._finish()
+            raise
+        return job
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue counters for /metrics"""
+        with self._lock:
+            return {
+                "pending": self._pending,
+                "max_pending": self._max_pending,
+                "workers": self._max_workers,
+                "submitted": self._submitted,
+                "rejected": self._rejected
+            }
+
+    def shutdown(self) -> None:
+        """Stop the worker threads once the queued jobs are done"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+    def _run(
+        self,
+        job: OptimizationJob,
+        start_node_id: str,
+        end_node_id: str,
+        arguments: Dict[str, Any]
+    ) -> None:
+        """Run one job on a worker thread and store every state change"""
+        try:
+            job = replace(job, status=RUNNING, started_at=time.time())
+            self._jobs.save(job)
+            try:
+                result = self._find_optimal_path.execute(
+                    start_node_id, end_node_id, **arguments
+                )
+                job = replace(job, status=DONE, finished_at=time.time(), result=result)
+            except Exception as e:
+                job = replace(job, status=FAILED, finished_at=time.time(), error=str(e))
+            self._jobs.save(job)
+        finally:
+            self._finish()
+
+    def _finish(self) -> None:
+        """Free the pending slot of a finished job"""
+        with self._lock:
+            self._pending -= 1
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Create the worker pool on first use"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="optimization-job"
+                )
+            return self._executor
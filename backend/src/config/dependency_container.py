@@ -2,10 +2,38 @@
 Dependency Injection Container
 Manages object creation and dependency injection
 """
-from ..infrastructure.repositories import InMemoryGraphRepository
-from ..infrastructure.algorithms import AntColonyOptimization
-from ..application.use_cases import FindOptimalPathUseCase, GetGraphUseCase
+from ..infrastructure.repositories import (
+    InMemoryGraphRepository,
+    InMemoryJobRepository,
+    InMemoryResultRepository
+)
+from ..infrastructure.algorithms import (
+    AntColonyOptimization,
+    AStarAlgorithm,
+    ConnectivityIndex,
+    ContractionHierarchyAlgorithm,
+    ContractionHierarchyProvider,
+    ConvergenceCriteria,
+    DistanceMatrixCalculator,
+    DijkstraAlgorithm,
+    IslandModelACO,
+    LandmarkProvider,
+    VectorizedAntColonyOptimization
+)
+from ..infrastructure.caching import PheromoneCache
+from ..application.use_cases import (
+    BatchFindOptimalPathUseCase,
+    FindOptimalPathUseCase,
+    GetDistanceMatrixUseCase,
+    GetGraphUseCase,
+    GetMetricsUseCase,
+    GetOptimizationJobUseCase,
+    ReoptimizeRouteUseCase,
+    StreamOptimalPathUseCase,
+    SubmitOptimizationJobUseCase
+)
 from ..presentation.controllers import RouteController
+from .settings import Config, get_config
 
 
 class DependencyContainer:
@@ -14,7 +42,15 @@ class DependencyContainer:
     Implements Dependency Injection pattern
     """
 
-    def __init__(self):
+    # ACO engine implementations selectable through Config.ACO_ENGINE
+    ACO_ENGINES = {
+        'standard': AntColonyOptimization,
+        'vectorized': VectorizedAntColonyOptimization,
+        'island': IslandModelACO,
+    }
+
+    def __init__(self, config: Config = None):
+        self._config = config or get_config()
         self._instances = {}
 
     def get_graph_repository(self):
@@ -23,21 +59,188 @@ class DependencyContainer:
             self._instances['graph_repository'] = InMemoryGraphRepository()
         return self._instances['graph_repository']
 
+    def get_result_repository(self):
+        """Get or create the result repository singleton"""
+        if 'result_repository' not in self._instances:
+            self._instances['result_repository'] = InMemoryResultRepository(
+                max_entries=self._config.RESULT_STORE_SIZE
+            )
+        return self._instances['result_repository']
+
+    def get_job_repository(self):
+        """Get or create the job repository singleton"""
+        if 'job_repository' not in self._instances:
+            self._instances['job_repository'] = InMemoryJobRepository(
+                max_entries=self._config.JOB_STORE_SIZE
+            )
+        return self._instances['job_repository']
+
+    def get_pheromone_cache(self):
+        """Get or create the warm-start pheromone cache singleton"""
+        if self._config.PHEROMONE_CACHE_SIZE <= 0:
+            return None
+        if 'pheromone_cache' not in self._instances:
+            self._instances['pheromone_cache'] = PheromoneCache(
+                max_entries=self._config.PHEROMONE_CACHE_SIZE,
+                half_life_s=self._config.PHEROMONE_CACHE_HALF_LIFE_S,
+                nearby_retention=self._config.PHEROMONE_CACHE_NEARBY_RETENTION
+            )
+        return self._instances['pheromone_cache']
+
+    def get_landmark_provider(self):
+        """Get or create the landmark provider singleton, preprocessed at load"""
+        if self._config.LANDMARK_COUNT <= 0:
+            return None
+        if 'landmark_provider' not in self._instances:
+            provider = LandmarkProvider(
+                count=self._config.LANDMARK_COUNT,
+                path=self._config.LANDMARKS_PATH or None
+            )
+            provider.get(self.get_graph_repository().get_graph().compile())
+            self._instances['landmark_provider'] = provider
+        return self._instances['landmark_provider']
+
+    def get_connectivity_index(self):
+        """Get or create the connectivity index singleton, labelled at load"""
+        if 'connectivity_index' not in self._instances:
+            index = ConnectivityIndex()
+            index.get(self.get_graph_repository().get_graph().compile())
+            self._instances['connectivity_index'] = index
+        return self._instances['connectivity_index']
+
+    def get_contraction_hierarchy_provider(self):
+        """Get or create the contraction hierarchy provider singleton"""
+        if 'contraction_hierarchy_provider' not in self._instances:
+            provider = ContractionHierarchyProvider()
+            if self._config.PATH_ALGORITHM == 'ch':
+                provider.get(self.get_graph_repository().get_graph().compile())
+            self._instances['contraction_hierarchy_provider'] = provider
+        return self._instances['contraction_hierarchy_provider']
+
     def get_aco_algorithm(self):
-        """Create new ACO algorithm instance"""
-        return AntColonyOptimization(
-            n_ants=15,
-            n_iterations=30,
+        """Create new ACO algorithm instance for the configured engine"""
+        engine = self._config.ACO_ENGINE
+        if engine not in self.ACO_ENGINES:
+            raise ValueError(f"Unknown ACO engine '{engine}'")
+
+        options = {}
+        if engine == 'island':
+            options = {
+                'n_colonies': self._config.ACO_COLONIES,
+                'migration_interval': self._config.ACO_MIGRATION_INTERVAL,
+                'pheromone_migration': self._config.ACO_PHEROMONE_MIGRATION,
+            }
+        return self.ACO_ENGINES[engine](
+            n_ants=self._config.ACO_N_ANTS,
+            n_iterations=self._config.ACO_N_ITERATIONS,
             alpha=1.0,
             beta=2.0,
-            evaporation=0.5
+            evaporation=0.5,
+            convergence=self.get_convergence_criteria(),
+            max_iterations=self._config.ACO_MAX_ITERATIONS,
+            pheromone_cache=self.get_pheromone_cache(),
+            candidate_list_size=self._config.ACO_CANDIDATE_LIST_SIZE,
+            seed_with_shortest_path=self._config.ACO_SEED_SHORTEST_PATH,
+            landmarks=self.get_landmark_provider(),
+            corridor_factor=self._config.ACO_CORRIDOR_FACTOR,
+            local_search=self._config.ACO_LOCAL_SEARCH,
+            history_limit=self._config.ACO_HISTORY_LIMIT,
+            **options
+        )
+
+    def get_path_finders(self):
+        """Create every path finder a request can select by name"""
+        return {
+            'aco': self.get_aco_algorithm(),
+            'astar': AStarAlgorithm(landmarks=self.get_landmark_provider()),
+            'dijkstra': DijkstraAlgorithm(),
+            'ch': ContractionHierarchyAlgorithm(
+                hierarchies=self.get_contraction_hierarchy_provider(),
+                landmarks=self.get_landmark_provider()
+            ),
+        }
+
+    def get_convergence_criteria(self):
+        """Create early termination criteria from configuration"""
+        config = self._config
+        return ConvergenceCriteria(
+            stagnation_limit=config.ACO_STAGNATION_LIMIT or None,
+            same_path_ratio=config.ACO_SAME_PATH_RATIO or None,
+            min_branching_factor=config.ACO_MIN_BRANCHING_FACTOR or None,
+            min_iterations=config.ACO_MIN_ITERATIONS
         )
 
     def get_find_optimal_path_use_case(self):
         """Create find optimal path use case"""
+        path_finders = self.get_path_finders()
+        algorithm = self._config.PATH_ALGORITHM
+        if algorithm not in path_finders:
+            raise ValueError(f"Unknown path algorithm '{algorithm}'")
         return FindOptimalPathUseCase(
             graph_repository=self.get_graph_repository(),
-            path_finder=self.get_aco_algorithm()
+            path_finder=path_finders[algorithm],
+            default_deadline_ms=self._config.ACO_DEADLINE_MS or None,
+            path_finders=path_finders,
+            default_algorithm=algorithm,
+            connectivity=self.get_connectivity_index(),
+            result_repository=self.get_result_repository(),
+            default_history=self._config.ACO_HISTORY_LEVEL
+        )
+
+    def get_batch_find_optimal_path_use_case(self, find_optimal_path_use_case=None):
+        """Create batch find optimal path use case, sharing the given single-query one"""
+        return BatchFindOptimalPathUseCase(
+            graph_repository=self.get_graph_repository(),
+            find_optimal_path_use_case=(
+                find_optimal_path_use_case or self.get_find_optimal_path_use_case()
+            ),
+            max_workers=self._config.BATCH_MAX_WORKERS,
+            max_queries=self._config.BATCH_MAX_QUERIES
+        )
+
+    def get_reoptimize_route_use_case(self, find_optimal_path_use_case=None):
+        """Create reoptimize route use case, sharing the given single-query one"""
+        return ReoptimizeRouteUseCase(
+            graph_repository=self.get_graph_repository(),
+            find_optimal_path_use_case=(
+                find_optimal_path_use_case or self.get_find_optimal_path_use_case()
+            ),
+            result_repository=self.get_result_repository(),
+            default_deadline_ms=self._config.REOPTIMIZE_DEADLINE_MS or None
+        )
+
+    def get_stream_optimal_path_use_case(self, find_optimal_path_use_case=None):
+        """Create stream optimal path use case, sharing the given single-query one"""
+        return StreamOptimalPathUseCase(
+            find_optimal_path_use_case=(
+                find_optimal_path_use_case or self.get_find_optimal_path_use_case()
+            ),
+            queue_size=self._config.STREAM_QUEUE_SIZE
+        )
+
+    def get_submit_optimization_job_use_case(self, find_optimal_path_use_case=None):
+        """Get or create the job submission singleton, which owns the worker pool"""
+        if 'submit_optimization_job_use_case' not in self._instances:
+            self._instances['submit_optimization_job_use_case'] = SubmitOptimizationJobUseCase(
+                find_optimal_path_use_case=(
+                    find_optimal_path_use_case or self.get_find_optimal_path_use_case()
+                ),
+                job_repository=self.get_job_repository(),
+                max_workers=self._config.JOB_MAX_WORKERS,
+                max_pending=self._config.JOB_MAX_PENDING
+            )
+        return self._instances['submit_optimization_job_use_case']
+
+    def get_get_optimization_job_use_case(self):
+        """Create get optimization job use case"""
+        return GetOptimizationJobUseCase(job_repository=self.get_job_repository())
+
+    def get_get_distance_matrix_use_case(self):
+        """Create get distance matrix use case"""
+        return GetDistanceMatrixUseCase(
+            graph_repository=self.get_graph_repository(),
+            calculator=DistanceMatrixCalculator(max_workers=self._config.MATRIX_MAX_WORKERS),
+            max_cells=self._config.MATRIX_MAX_CELLS
         )
 
     def get_get_graph_use_case(self):
@@ -46,10 +249,41 @@ class DependencyContainer:
             graph_repository=self.get_graph_repository()
         )
 
+    def get_get_metrics_use_case(self):
+        """Create get metrics use case"""
+        sources = {}
+        if self.get_pheromone_cache() is not None:
+            sources['pheromone_cache'] = self.get_pheromone_cache()
+        if self.get_landmark_provider() is not None:
+            sources['landmarks'] = self.get_landmark_provider()
+        sources['connectivity'] = self.get_connectivity_index()
+        sources['results'] = self.get_result_repository()
+        sources['contraction_hierarchy'] = self.get_contraction_hierarchy_provider()
+        sources['jobs'] = self.get_submit_optimization_job_use_case()
+        sources['job_store'] = self.get_job_repository()
+        return GetMetricsUseCase(sources=sources)
+
     def get_route_controller(self):
         """Create route controller"""
+        find_optimal_path_use_case = self.get_find_optimal_path_use_case()
+        submit_optimization_job_use_case = self.get_submit_optimization_job_use_case(
+            find_optimal_path_use_case
+        )
         return RouteController(
-            find_optimal_path_use_case=self.get_find_optimal_path_use_case(),
+            find_optimal_path_use_case=find_optimal_path_use_case,
             get_graph_use_case=self.get_get_graph_use_case(),
-            graph_repository=self.get_graph_repository()
+            graph_repository=self.get_graph_repository(),
+            get_metrics_use_case=self.get_get_metrics_use_case(),
+            batch_find_optimal_path_use_case=self.get_batch_find_optimal_path_use_case(
+                find_optimal_path_use_case
+            ),
+            get_distance_matrix_use_case=self.get_get_distance_matrix_use_case(),
+            reoptimize_route_use_case=self.get_reoptimize_route_use_case(
+                find_optimal_path_use_case
+            ),
+            stream_optimal_path_use_case=self.get_stream_optimal_path_use_case(
+                find_optimal_path_use_case
+            ),
+            submit_optimization_job_use_case=submit_optimization_job_use_case,
+            get_optimization_job_use_case=self.get_get_optimization_job_use_case()
         )
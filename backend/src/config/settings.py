@@ -17,6 +17,86 @@ class Config:
     API_TITLE = "ACO Route Optimization API"
     API_VERSION = "2.0.0"
 
+    # Path finder used when a request names none: 'aco', 'astar', 'dijkstra'
+    # or 'ch' (contraction hierarchy, preprocessed at load when selected)
+    PATH_ALGORITHM = os.environ.get('PATH_ALGORITHM', 'aco')
+
+    # Routes kept for POST /reoptimize, and the budget of a repair (0: the
+    # ACO_DEADLINE_MS default)
+    RESULT_STORE_SIZE = int(os.environ.get('RESULT_STORE_SIZE', 256))
+    REOPTIMIZE_DEADLINE_MS = float(os.environ.get('REOPTIMIZE_DEADLINE_MS', 50))
+
+    # Iterations POST /optimize/stream buffers for a slow client before
+    # the search waits for it
+    STREAM_QUEUE_SIZE = int(os.environ.get('STREAM_QUEUE_SIZE', 32))
+
+    # Background jobs (POST /jobs): worker threads, unfinished jobs before
+    # submissions are rejected with 429, and jobs kept for GET /jobs/<id>
+    JOB_MAX_WORKERS = int(os.environ.get('JOB_MAX_WORKERS', 2))
+    JOB_MAX_PENDING = int(os.environ.get('JOB_MAX_PENDING', 32))
+    JOB_STORE_SIZE = int(os.environ.get('JOB_STORE_SIZE', 1024))
+
+    # POST /optimize/batch: worker threads and largest accepted batch
+    BATCH_MAX_WORKERS = int(os.environ.get('BATCH_MAX_WORKERS', 4))
+    BATCH_MAX_QUERIES = int(os.environ.get('BATCH_MAX_QUERIES', 500))
+
+    # POST /matrix: worker threads (sharing the GIL, so not a speedup) and
+    # largest accepted sources x targets
+    MATRIX_MAX_WORKERS = int(os.environ.get('MATRIX_MAX_WORKERS', 4))
+    MATRIX_MAX_CELLS = int(os.environ.get('MATRIX_MAX_CELLS', 10000))
+
+    # ACO engine: 'standard' (per-ant), 'vectorized' (NumPy lockstep ants,
+    # only faster for colonies of a few hundred ants) or 'island' (parallel
+    # colonies in a process pool)
+    ACO_ENGINE = os.environ.get('ACO_ENGINE', 'standard')
+
+    # Colony size and iteration budget
+    ACO_N_ANTS = int(os.environ.get('ACO_N_ANTS', 15))
+    ACO_N_ITERATIONS = int(os.environ.get('ACO_N_ITERATIONS', 30))
+    # Upper bound on iterations when a request runs against a deadline
+    ACO_MAX_ITERATIONS = int(os.environ.get('ACO_MAX_ITERATIONS', 1000))
+    # Default latency budget for /optimize in milliseconds; 0 means none
+    ACO_DEADLINE_MS = float(os.environ.get('ACO_DEADLINE_MS', 0))
+    # Start the colony from the exact shortest path (1) or from scratch (0)
+    ACO_SEED_SHORTEST_PATH = os.environ.get('ACO_SEED_SHORTEST_PATH', '0') == '1'
+    # Shortest edges per node ants consider first; 0 considers all edges
+    ACO_CANDIDATE_LIST_SIZE = int(os.environ.get('ACO_CANDIDATE_LIST_SIZE', 8))
+    # Ants only visit nodes on paths within this factor of the shortest
+    # distance; 0 disables corridor pruning
+    ACO_CORRIDOR_FACTOR = float(os.environ.get('ACO_CORRIDOR_FACTOR', 0))
+    # Improve each iteration's best ant by loop removal, shortcuts and
+    # bounded exact segment searches (1) or keep raw ant paths (0)
+    ACO_LOCAL_SEARCH = os.environ.get('ACO_LOCAL_SEARCH', '0') == '1'
+    # Iteration history of requests that do not ask for one: 'none',
+    # 'summary', 'paths' or 'full' (per-edge pheromone snapshots)
+    ACO_HISTORY_LEVEL = os.environ.get('ACO_HISTORY_LEVEL', 'none')
+    # Most recent iterations a history keeps
+    ACO_HISTORY_LIMIT = int(os.environ.get('ACO_HISTORY_LIMIT', 200))
+
+    # Early termination; 0 disables a criterion
+    ACO_MIN_ITERATIONS = int(os.environ.get('ACO_MIN_ITERATIONS', 5))
+    ACO_STAGNATION_LIMIT = int(os.environ.get('ACO_STAGNATION_LIMIT', 10))
+    ACO_SAME_PATH_RATIO = float(os.environ.get('ACO_SAME_PATH_RATIO', 0.9))
+    ACO_MIN_BRANCHING_FACTOR = float(os.environ.get('ACO_MIN_BRANCHING_FACTOR', 0))
+
+    # Warm-start pheromone cache; 0 entries disables it
+    PHEROMONE_CACHE_SIZE = int(os.environ.get('PHEROMONE_CACHE_SIZE', 64))
+    PHEROMONE_CACHE_HALF_LIFE_S = float(os.environ.get('PHEROMONE_CACHE_HALF_LIFE_S', 300))
+    PHEROMONE_CACHE_NEARBY_RETENTION = float(
+        os.environ.get('PHEROMONE_CACHE_NEARBY_RETENTION', 0.5)
+    )
+
+    # Landmark (ALT) lower bounds for A* and the ACO heuristic; 0 disables
+    LANDMARK_COUNT = int(os.environ.get('LANDMARK_COUNT', 0))
+    # File the landmark distances are persisted to; empty keeps them in memory
+    LANDMARKS_PATH = os.environ.get('LANDMARKS_PATH', '')
+
+    # Island model settings (ACO_ENGINE = 'island')
+    ACO_COLONIES = int(os.environ.get('ACO_COLONIES', os.cpu_count() or 1))
+    ACO_MIGRATION_INTERVAL = int(os.environ.get('ACO_MIGRATION_INTERVAL', 5))
+    # Share of the neighbouring colony's pheromone blended in at migration
+    ACO_PHEROMONE_MIGRATION = float(os.environ.get('ACO_PHEROMONE_MIGRATION', 0.1))
+
 
 class DevelopmentConfig(Config):
     """Development configuration"""
@@ -4,8 +4,14 @@ Export all domain entities
 """
 from .node import Node
 from .edge import Edge
+from .compiled_graph import CompiledGraph
 from .graph import Graph
+from .graph_overlay import GraphOverlay, GraphView
 from .path import Path
 from .optimization_result import OptimizationResult
+from .distance_matrix import DistanceMatrix
+from .route_record import RouteRecord
+from .optimization_job import OptimizationJob
 
-__all__ = ['Node', 'Edge', 'Graph', 'Path', 'OptimizationResult']
+__all__ = ['Node', 'Edge', 'Graph', 'CompiledGraph', 'GraphOverlay', 'GraphView', 'Path', 'OptimizationResult',
+           'DistanceMatrix', 'RouteRecord', 'OptimizationJob']
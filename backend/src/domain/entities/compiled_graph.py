@@ -0,0 +1,264 @@
+"""
+Domain Entity: Compiled Graph
+Read-only CSR snapshot of a graph version for the path finding engines
+"""
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Iterable, List, Tuple
+from .node import haversine_km
+
+# Zero-length edges get this weight in the heuristic instead of dividing by 0
+MIN_HEURISTIC_WEIGHT = 1e-9
+
+
+@dataclass(frozen=True)
+class CompiledGraph:
+    """
+    Immutable compressed sparse row (CSR) representation of a graph
+
+    Node IDs are interned to dense integers. The outgoing edges of node ``u``
+    occupy slots ``offsets[u]`` up to ``offsets[u + 1]`` of the flat
+    ``targets``, ``weights`` and ``blocked`` arrays. Node coordinates are
+    kept in ``latitudes`` and ``longitudes`` when known.
+    """
+    version: int
+    node_ids: List[str]
+    node_index: Dict[str, int]
+    offsets: array
+    targets: array
+    weights: array
+    blocked: bytearray
+
+    # Slots blocked by a per-request overlay on top of the shared arrays
+    extra_blocked: FrozenSet[int] = frozenset()
+
+    latitudes: array = field(default_factory=lambda: array('d'), repr=False)
+    longitudes: array = field(default_factory=lambda: array('d'), repr=False)
+
+    # Lazily filled per-node list of unblocked slots
+    _open_slots: Dict[int, Tuple[int, ...]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    # Lazily filled per-node lists of the nearest open slots, keyed by
+    # (node, size)
+    _candidates: Dict[Tuple[int, int], Tuple[int, ...]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    # Per-slot (1 / weight) ** beta tables keyed by beta; shared with every
+    # overlay view of this version since weights never differ between them
+    _heuristics: Dict[float, array] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    # Other data derived from weights and coordinates only, shared with
+    # every overlay view of this version
+    _derived: Dict[str, Any] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    @classmethod
+    def from_graph(cls, graph: 'Graph') -> 'CompiledGraph':
+        """Build the CSR arrays for the current state of a graph"""
+        node_ids = list(graph.nodes)
+        node_index = {node_id: i for i, node_id in enumerate(node_ids)}
+
+        # Counting sort of edges by source node keeps insertion order per node
+        edges = [
+            edge for edge in graph.edges
+            if edge.from_node in node_index and edge.to_node in node_index
+        ]
+        offsets = array('l', [0]) * (len(node_ids) + 1)
+        for edge in edges:
+            offsets[node_index[edge.from_node] + 1] += 1
+        for i in range(len(node_ids)):
+            offsets[i + 1] += offsets[i]
+
+        cursor = array('l', offsets[:-1])
+        targets = array('l', [0]) * len(edges)
+        weights = array('d', [0.0]) * len(edges)
+        blocked = bytearray(len(edges))
+        for edge in edges:
+            source = node_index[edge.from_node]
+            slot = cursor[source]
+            cursor[source] += 1
+            targets[slot] = node_index[edge.to_node]
+            weights[slot] = edge.weight
+            blocked[slot] = edge.is_blocked
+
+        return cls(
+            version=graph.version,
+            node_ids=node_ids,
+            node_index=node_index,
+            offsets=offsets,
+            targets=targets,
+            weights=weights,
+            blocked=blocked,
+            latitudes=array('d', (graph.nodes[node_id].latitude for node_id in node_ids)),
+            longitudes=array('d', (graph.nodes[node_id].longitude for node_id in node_ids))
+        )
+
+    @property
+    def node_count(self) -> int:
+        """Number of interned nodes"""
+        return len(self.node_ids)
+
+    @property
+    def edge_count(self) -> int:
+        """Number of edge slots"""
+        return len(self.targets)
+
+    def open_slots(self, node: int) -> Tuple[int, ...]:
+        """Get the unblocked outgoing edge slots of a node"""
+        slots = self._open_slots.get(node)
+        if slots is None:
+            blocked = self.blocked
+            extra_blocked = self.extra_blocked
+            slots = tuple(
+                slot for slot in range(self.offsets[node], self.offsets[node + 1])
+                if not blocked[slot] and slot not in extra_blocked
+            )
+            self._open_slots[node] = slots
+        return slots
+
+    def candidate_slots(self, node: int, size: int) -> Tuple[int, ...]:
+        """
+        Get the candidate list of a node: its size shortest open slots
+
+        Shorter edges have the larger heuristic for any beta. A size of 0
+        or a node with at most size open slots yields all open slots.
+        """
+        slots = self.open_slots(node)
+        if size <= 0 or len(slots) <= size:
+            return slots
+        key = (node, size)
+        candidates = self._candidates.get(key)
+        if candidates is None:
+            weights = self.weights
+            candidates = tuple(sorted(slots, key=lambda slot: weights[slot])[:size])
+            self._candidates[key] = candidates
+        return candidates
+
+    def heuristic(self, beta: float) -> array:
+        """Get the per-slot heuristic (1 / weight) ** beta, built once per version"""
+        table = self._heuristics.get(beta)
+        if table is None:
+            table = array('d', (
+                (1.0 / max(weight, MIN_HEURISTIC_WEIGHT)) ** beta
+                for weight in self.weights
+            ))
+            self._heuristics[beta] = table
+        return table
+
+    def great_circle_km(self, from_node: int, to_node: int) -> float:
+        """Great-circle distance between two interned nodes"""
+        latitudes = self.latitudes
+        longitudes = self.longitudes
+        return haversine_km(
+            latitudes[from_node], longitudes[from_node],
+            latitudes[to_node], longitudes[to_node]
+        )
+
+    def distance_scale(self) -> float:
+        """
+        Largest factor s with s * great-circle distance <= weight on every edge
+
+        Scaling the great-circle distance by s gives a consistent lower
+        bound on path length whatever unit the weights use. Returns 0, which
+        disables the bound, when coordinates are unknown.
+        """
+        scale = self._derived.get("distance_scale")
+        if scale is None:
+            scale = 0.0
+            if len(self.latitudes) == self.node_count:
+                scale = float("inf")
+                offsets, targets, weights = self.offsets, self.targets, self.weights
+                for source in range(self.node_count):
+                    for slot in range(offsets[source], offsets[source + 1]):
+                        span = self.great_circle_km(source, targets[slot])
+                        if span > 0:
+                            scale = min(scale, weights[slot] / span)
+                if scale == float("inf"):
+                    scale = 0.0
+            self._derived["distance_scale"] = scale
+        return scale
+
+    def reverse_index(self) -> Tuple[array, array, array]:
+        """
+        Incoming slots per node: offsets, slots and their source nodes
+
+        Covers every slot, blocked or not, so it is built once per version
+        and shared with overlay views; callers skip blocked slots.
+        """
+        index = self._derived.get("reverse_index")
+        if index is None:
+            n = self.node_count
+            offsets, targets = self.offsets, self.targets
+            reverse_offsets = array('l', [0]) * (n + 1)
+            for target in targets:
+                reverse_offsets[target + 1] += 1
+            for node in range(n):
+                reverse_offsets[node + 1] += reverse_offsets[node]
+            cursor = array('l', reverse_offsets[:-1])
+            slots = array('l', [0]) * len(targets)
+            sources = array('l', [0]) * len(targets)
+            for source in range(n):
+                for slot in range(offsets[source], offsets[source + 1]):
+                    position = cursor[targets[slot]]
+                    cursor[targets[slot]] += 1
+                    slots[position] = slot
+                    sources[position] = source
+            index = (reverse_offsets, slots, sources)
+            self._derived["reverse_index"] = index
+        return index
+
+    def is_blocked(self, slot: int) -> bool:
+        """Check whether an edge slot is blocked in this snapshot"""
+        return bool(self.blocked[slot]) or slot in self.extra_blocked
+
+    def with_blocked(self, slots: Iterable[int]) -> 'CompiledGraph':
+        """
+        Get a view that additionally blocks the given slots
+
+        The CSR arrays are shared with this snapshot, so the cost depends
+        only on the number of blocked slots, not on the graph size.
+        """
+        extra_blocked = self.extra_blocked.union(slots)
+        if extra_blocked == self.extra_blocked:
+            return self
+        return CompiledGraph(
+            version=self.version,
+            node_ids=self.node_ids,
+            node_index=self.node_index,
+            offsets=self.offsets,
+            targets=self.targets,
+            weights=self.weights,
+            blocked=self.blocked,
+            extra_blocked=extra_blocked,
+            latitudes=self.latitudes,
+            longitudes=self.longitudes,
+            _heuristics=self._heuristics,
+            _derived=self._derived
+        )
+
+    def find_slot(self, from_node: int, to_node: int) -> int:
+        """Get the first slot of the edge between two nodes, or -1"""
+        targets = self.targets
+        for slot in range(self.offsets[from_node], self.offsets[from_node + 1]):
+            if targets[slot] == to_node:
+                return slot
+        return -1
+
+    def edge_slots(self, from_node: int, to_node: int) -> List[int]:
+        """Get every slot holding an edge between two nodes"""
+        targets = self.targets
+        return [
+            slot for slot in range(self.offsets[from_node], self.offsets[from_node + 1])
+            if targets[slot] == to_node
+        ]
+
+    def to_node_ids(self, nodes: List[int]) -> List[str]:
+        """Map interned node indices back to node IDs"""
+        node_ids = self.node_ids
+        return [node_ids[node] for node in nodes]
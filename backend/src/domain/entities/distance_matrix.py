@@ -0,0 +1,38 @@
+"""
+Domain Entity: Distance Matrix
+Shortest distances between a set of sources and a set of targets
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+
+@dataclass(frozen=True)
+class DistanceMatrix:
+    """
+    Immutable many-to-many result in row-major order
+
+    Cell ``i * len(targets) + j`` holds the distance from sources[i] to
+    targets[j], or None when no route exists. Paths, when requested, use
+    the same layout.
+    """
+    sources: List[str]
+    targets: List[str]
+    distances: List[Optional[float]]
+    paths: Optional[List[Optional[List[str]]]] = None
+    elapsed_ms: float = 0.0
+
+    def distance(self, source: int, target: int) -> Optional[float]:
+        """Distance between the source and target at the given positions"""
+        return self.distances[source * len(self.targets) + target]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for API response"""
+        result = {
+            "sources": self.sources,
+            "targets": self.targets,
+            "distances": self.distances,
+            "elapsed_ms": self.elapsed_ms
+        }
+        if self.paths is not None:
+            result["paths"] = self.paths
+        return result
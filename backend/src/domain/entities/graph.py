@@ -3,10 +3,16 @@ Domain Entity: Graph
 Represents the complete route network
 """
 from dataclasses import dataclass, field
-from typing import Dict, List
+from itertools import count
+from typing import Dict, List, Optional, Tuple
 from copy import deepcopy
 from .node import Node
 from .edge import Edge
+from .compiled_graph import CompiledGraph
+
+# Process-wide so that different graphs never share a version number;
+# copy() takes a new one as well
+_versions = count(1)
 
 
 @dataclass
@@ -15,45 +21,100 @@ class Graph:
     nodes: Dict[str, Node] = field(default_factory=dict)
     edges: List[Edge] = field(default_factory=list)
 
+    # Adjacency index kept in sync with `edges` by every mutating method;
+    # both map to positions in `edges`, so replacing an edge there is enough
+    _out_edges: Dict[str, List[int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Every position of a (from, to) pair, in list order
+    _edge_index: Dict[Tuple[str, str], List[int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    # Bumped by every mutation; derived structures are cached per version
+    version: int = field(default=0, init=False, compare=False)
+    _compiled: Optional[CompiledGraph] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        self._rebuild_index()
+
     def add_node(self, node: Node) -> None:
         """Add a node to the graph"""
         self.nodes[node.id] = node
+        self._touch()
 
     def add_edge(self, edge: Edge) -> None:
         """Add an edge to the graph"""
         if edge.from_node not in self.nodes or edge.to_node not in self.nodes:
             raise ValueError("Both nodes must exist in graph before adding edge")
         self.edges.append(edge)
+        self._index_edge(len(self.edges) - 1)
+        self._touch()
 
     def get_neighbors(self, node_id: str) -> List[str]:
         """Get all neighboring nodes"""
+        edges = self.edges
         return [
-            edge.to_node for edge in self.edges
-            if edge.from_node == node_id and not edge.is_blocked
+            edges[i].to_node for i in self._out_edges.get(node_id, ())
+            if not edges[i].is_blocked
         ]
 
+    def get_out_edges(self, node_id: str) -> List[Edge]:
+        """Get all outgoing edges of a node, including blocked ones"""
+        edges = self.edges
+        return [edges[i] for i in self._out_edges.get(node_id, ())]
+
     def get_edge_weight(self, from_node: str, to_node: str) -> float:
         """Get weight of edge between two nodes"""
-        for edge in self.edges:
-            if edge.from_node == from_node and edge.to_node == to_node:
-                return edge.weight
-        raise ValueError(f"Edge from {from_node} to {to_node} not found")
+        edge = self.get_edge(from_node, to_node)
+        if edge is None:
+            raise ValueError(f"Edge from {from_node} to {to_node} not found")
+        return edge.weight
+
+    def get_edge(self, from_node: str, to_node: str) -> Edge:
+        """Get the edge between two nodes, or None if it does not exist"""
+        # The first edge for duplicate pairs, matching list-scan lookups
+        positions = self._edge_index.get((from_node, to_node))
+        return self.edges[positions[0]] if positions else None
 
     def block_edge(self, from_node: str, to_node: str) -> None:
         """Block an edge (simulate disaster)"""
-        for i, edge in enumerate(self.edges):
-            if ((edge.from_node == from_node and edge.to_node == to_node) or
-                (edge.from_node == to_node and edge.to_node == from_node)):
-                self.edges[i] = Edge(
-                    from_node=edge.from_node,
-                    to_node=edge.to_node,
-                    weight=edge.weight,
-                    is_blocked=True
-                )
+        keys = {(from_node, to_node), (to_node, from_node)}
+        if not any(key in self._edge_index for key in keys):
+            return
+        for key in keys:
+            for i in self._edge_index.get(key, ()):
+                edge = self.edges[i]
+                if not edge.is_blocked:
+                    self.edges[i] = Edge(
+                        from_node=edge.from_node,
+                        to_node=edge.to_node,
+                        weight=edge.weight,
+                        is_blocked=True
+                    )
+        self._touch()
+
+    def remove_edge(self, from_node: str, to_node: str) -> None:
+        """Remove the edge between two nodes in both directions"""
+        keys = {(from_node, to_node), (to_node, from_node)}
+        if not any(key in self._edge_index for key in keys):
+            return
+        self.edges = [edge for edge in self.edges if edge.as_tuple() not in keys]
+        self._rebuild_index()
+
+    def compile(self) -> CompiledGraph:
+        """Get the CSR snapshot of the current version, built once per version"""
+        if self._compiled is None or self._compiled.version != self.version:
+            self._compiled = CompiledGraph.from_graph(self)
+        return self._compiled
 
     def copy(self) -> 'Graph':
-        """Create a deep copy of the graph"""
-        return deepcopy(self)
+        """Create a deep copy of the graph with a version of its own"""
+        graph = deepcopy(self)
+        graph._touch()
+        return graph
 
     def remove_node(self, node_id: str) -> None:
         """Remove a node and all connected edges"""
@@ -61,3 +122,22 @@ class Graph:
             del self.nodes[node_id]
         self.edges = [edge for edge in self.edges
                      if edge.from_node != node_id and edge.to_node != node_id]
+        self._rebuild_index()
+
+    def _touch(self) -> None:
+        """Assign a new version after a mutation"""
+        self.version = next(_versions)
+
+    def _index_edge(self, position: int) -> None:
+        """Register the edge at a position of the edge list in the adjacency index"""
+        edge = self.edges[position]
+        self._out_edges.setdefault(edge.from_node, []).append(position)
+        self._edge_index.setdefault(edge.as_tuple(), []).append(position)
+
+    def _rebuild_index(self) -> None:
+        """Rebuild the adjacency index from the edge list"""
+        self._out_edges = {}
+        self._edge_index = {}
+        for position in range(len(self.edges)):
+            self._index_edge(position)
+        self._touch()
@@ -0,0 +1,115 @@
+"""
+Domain Entity: Graph Overlay
+Copy-on-write per-request view over the shared route network
+"""
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Union
+from .node import Node
+from .edge import Edge
+from .compiled_graph import CompiledGraph
+from .graph import Graph
+
+
+@dataclass
+class GraphOverlay:
+    """
+    Lightweight view that blocks edges without copying the base graph
+
+    The base graph is shared and never modified; the overlay only carries
+    the per-request blocked edge pairs.
+    """
+    base: Graph
+    blocked_pairs: Set[Tuple[str, str]] = field(default_factory=set)
+
+    _compiled: Optional[CompiledGraph] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @classmethod
+    def over(
+        cls,
+        graph: Union[Graph, 'GraphOverlay'],
+        blocked_edges: Optional[Iterable[tuple]] = None
+    ) -> 'GraphOverlay':
+        """Create an overlay over a graph (or extend an existing overlay)"""
+        if isinstance(graph, GraphOverlay):
+            overlay = cls(base=graph.base, blocked_pairs=set(graph.blocked_pairs))
+        else:
+            overlay = cls(base=graph)
+        for from_node, to_node in blocked_edges or ():
+            overlay.block_edge(from_node, to_node)
+        return overlay
+
+    @property
+    def nodes(self) -> Dict[str, Node]:
+        """Nodes of the base graph"""
+        return self.base.nodes
+
+    @property
+    def edges(self) -> List[Edge]:
+        """Edges of the base graph with the overlay's blocks applied"""
+        return [self._apply(edge) for edge in self.base.edges]
+
+    @property
+    def version(self) -> int:
+        """Version of the base graph"""
+        return self.base.version
+
+    @property
+    def blocked_edges(self) -> FrozenSet[Tuple[str, str]]:
+        """Edge pairs blocked by this overlay, in both directions"""
+        return frozenset(self.blocked_pairs)
+
+    def block_edge(self, from_node: str, to_node: str) -> None:
+        """Block an edge in both directions for this view only"""
+        self.blocked_pairs.add((from_node, to_node))
+        self.blocked_pairs.add((to_node, from_node))
+        self._compiled = None
+
+    def get_neighbors(self, node_id: str) -> List[str]:
+        """Get all neighboring nodes reachable through unblocked edges"""
+        return [
+            edge.to_node for edge in self.base.get_out_edges(node_id)
+            if not edge.is_blocked and edge.as_tuple() not in self.blocked_pairs
+        ]
+
+    def get_out_edges(self, node_id: str) -> List[Edge]:
+        """Get all outgoing edges of a node as seen through this overlay"""
+        return [self._apply(edge) for edge in self.base.get_out_edges(node_id)]
+
+    def get_edge_weight(self, from_node: str, to_node: str) -> float:
+        """Get weight of edge between two nodes"""
+        return self.base.get_edge_weight(from_node, to_node)
+
+    def get_edge(self, from_node: str, to_node: str) -> Optional[Edge]:
+        """Get the edge between two nodes, or None if it does not exist"""
+        edge = self.base.get_edge(from_node, to_node)
+        return self._apply(edge) if edge is not None else None
+
+    def compile(self) -> CompiledGraph:
+        """Get the base CSR snapshot with the overlay's blocks applied"""
+        base = self.base.compile()
+        if self._compiled is None or self._compiled.version != base.version:
+            slots = []
+            for from_node, to_node in self.blocked_pairs:
+                source = base.node_index.get(from_node)
+                target = base.node_index.get(to_node)
+                if source is not None and target is not None:
+                    slots.extend(base.edge_slots(source, target))
+            self._compiled = base.with_blocked(slots)
+        return self._compiled
+
+    def _apply(self, edge: Edge) -> Edge:
+        """Return the edge as seen through this overlay"""
+        if edge.is_blocked or edge.as_tuple() not in self.blocked_pairs:
+            return edge
+        return Edge(
+            from_node=edge.from_node,
+            to_node=edge.to_node,
+            weight=edge.weight,
+            is_blocked=True
+        )
+
+
+# Anything the path finders accept as a graph
+GraphView = Union[Graph, GraphOverlay]
@@ -3,7 +3,17 @@ Domain Entity: Node
 Represents a geographical point in the route network
 """
 from dataclasses import dataclass
-from typing import Optional
+from math import asin, cos, radians, sin, sqrt
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle distance in kilometers between two coordinates"""
+    phi1, phi2 = radians(lat1), radians(lat2)
+    a = (sin((phi2 - phi1) / 2) ** 2
+         + cos(phi1) * cos(phi2) * sin(radians(lng2 - lng1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * asin(min(1.0, sqrt(a)))
 
 
 @dataclass(frozen=True)
@@ -21,3 +31,7 @@ class Node:
             raise ValueError("Latitude must be between -90 and 90")
         if not (-180 <= self.longitude <= 180):
             raise ValueError("Longitude must be between -180 and 180")
+
+    def distance_to(self, other: 'Node') -> float:
+        """Great-circle distance to another node in kilometers"""
+        return haversine_km(self.latitude, self.longitude, other.latitude, other.longitude)
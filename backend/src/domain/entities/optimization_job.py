@@ -0,0 +1,43 @@
+"""
+Domain Entity: Optimization Job
+An optimization request run in the background
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from .optimization_result import OptimizationResult
+
+# Job states, in the order a job goes through them
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class OptimizationJob:
+    """State of one queued optimization; replaced as it progresses"""
+    job_id: str
+    status: str
+    # time.time() of each transition, None until reached
+    submitted_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Optional[OptimizationResult] = None
+    error: Optional[str] = None
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job is done or failed"""
+        return self.status in (DONE, FAILED)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for API response"""
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "result": self.result.to_dict() if self.result is not None else None,
+            "error": self.error
+        }
@@ -3,7 +3,7 @@ Domain Entity: Optimization Result
 Contains the complete result of the ACO algorithm
 """
 from dataclasses import dataclass
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from .path import Path
 
 
@@ -14,6 +14,19 @@ class OptimizationResult:
     iterations_history: List[Dict[str, Any]]
     total_iterations: int
     ants_per_iteration: int
+    stop_reason: str = "max_iterations"
+    iterations_used: int = 0
+    elapsed_ms: float = 0.0
+    warm_start: Optional[str] = None
+    algorithm: str = "aco"
+    seed_distance: Optional[float] = None
+    improved_on_seed: Optional[bool] = None
+    corridor_nodes: Optional[int] = None
+    corridor_edges: Optional[int] = None
+    # ID to re-optimize this result with, when results are stored
+    result_id: Optional[str] = None
+    # How a re-optimization answered: 'unchanged', 'repaired' or 'recomputed'
+    reoptimized: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for API response"""
@@ -22,5 +35,16 @@ class OptimizationResult:
             "distance": self.best_path.distance if self.best_path.is_valid() else None,
             "iterations": self.iterations_history,
             "total_iterations": self.total_iterations,
-            "ants_per_iteration": self.ants_per_iteration
+            "ants_per_iteration": self.ants_per_iteration,
+            "stop_reason": self.stop_reason,
+            "iterations_used": self.iterations_used,
+            "elapsed_ms": self.elapsed_ms,
+            "warm_start": self.warm_start,
+            "algorithm": self.algorithm,
+            "seed_distance": self.seed_distance,
+            "improved_on_seed": self.improved_on_seed,
+            "corridor_nodes": self.corridor_nodes,
+            "corridor_edges": self.corridor_edges,
+            "result_id": self.result_id,
+            "reoptimized": self.reoptimized
         }
@@ -0,0 +1,27 @@
+"""
+Domain Entity: Route Record
+A computed route kept so that it can be re-optimized later
+"""
+from dataclasses import dataclass
+from typing import FrozenSet, Iterable, Tuple
+from .path import Path
+
+
+@dataclass(frozen=True)
+class RouteRecord:
+    """Query and best path of an earlier optimization"""
+    start: str
+    end: str
+    # Blocked edge pairs in both directions, as overlays store them
+    blocked_edges: FrozenSet[Tuple[str, str]]
+    path: Path
+    algorithm: str
+
+    @staticmethod
+    def pairs(edges: Iterable[tuple]) -> FrozenSet[Tuple[str, str]]:
+        """Normalize edges to pairs in both directions"""
+        pairs = set()
+        for from_node, to_node in edges:
+            pairs.add((from_node, to_node))
+            pairs.add((to_node, from_node))
+        return frozenset(pairs)
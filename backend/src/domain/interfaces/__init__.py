@@ -1,7 +1,19 @@
 """
 Domain Interfaces __init__
 """
+from .iconnectivity_index import IConnectivityIndex
+from .idistance_matrix_calculator import IDistanceMatrixCalculator
 from .igraph_repository import IGraphRepository
-from .ipath_finder_algorithm import IPathFinderAlgorithm
+from .ijob_repository import IJobRepository
+from .ipath_finder_algorithm import HISTORY_LEVELS, IPathFinderAlgorithm
+from .iresult_repository import IResultRepository
 
-__all__ = ['IGraphRepository', 'IPathFinderAlgorithm']
+__all__ = [
+    'HISTORY_LEVELS',
+    'IConnectivityIndex',
+    'IDistanceMatrixCalculator',
+    'IGraphRepository',
+    'IJobRepository',
+    'IPathFinderAlgorithm',
+    'IResultRepository'
+]
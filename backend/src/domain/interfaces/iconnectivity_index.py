@@ -0,0 +1,15 @@
+"""
+Connectivity Interface (SOLID - Interface Segregation Principle)
+Defines contract for reachability queries
+"""
+from abc import ABC, abstractmethod
+from ..entities import GraphView
+
+
+class IConnectivityIndex(ABC):
+    """Interface for answering whether a route between two nodes exists"""
+
+    @abstractmethod
+    def is_reachable(self, graph: GraphView, start_node: str, end_node: str) -> bool:
+        """Check whether end_node can be reached from start_node in the graph"""
+        pass
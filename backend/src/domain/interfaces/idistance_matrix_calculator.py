@@ -0,0 +1,22 @@
+"""
+Distance Matrix Interface (SOLID - Interface Segregation Principle)
+Defines contract for many-to-many shortest distance calculators
+"""
+from abc import ABC, abstractmethod
+from typing import List
+from ..entities import DistanceMatrix, GraphView
+
+
+class IDistanceMatrixCalculator(ABC):
+    """Interface for many-to-many shortest distance calculators"""
+
+    @abstractmethod
+    def compute(
+        self,
+        graph: GraphView,
+        sources: List[str],
+        targets: List[str],
+        include_paths: bool = False
+    ) -> DistanceMatrix:
+        """Compute the distance from every source to every target"""
+        pass
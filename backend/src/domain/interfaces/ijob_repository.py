@@ -0,0 +1,21 @@
+"""
+Job Repository Interface (SOLID - Dependency Inversion Principle)
+Defines contract for storing background optimization jobs by ID
+"""
+from abc import ABC, abstractmethod
+from typing import Optional
+from ..entities import OptimizationJob
+
+
+class IJobRepository(ABC):
+    """Interface for optimization job storage"""
+
+    @abstractmethod
+    def save(self, job: OptimizationJob) -> None:
+        """Store a job, replacing the earlier state with the same ID"""
+        pass
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[OptimizationJob]:
+        """Get a job, or None if unknown or expired"""
+        pass
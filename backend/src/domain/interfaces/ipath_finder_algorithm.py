@@ -3,8 +3,11 @@ Path Finder Interface (SOLID - Interface Segregation Principle)
 Defines contract for pathfinding algorithms
 """
 from abc import ABC, abstractmethod
-from typing import List
-from ..entities import Graph, Path
+from typing import Any, Callable, Dict, List, Optional
+from ..entities import GraphView, Path
+
+# Iteration history a request can ask for, from cheapest to most detailed
+HISTORY_LEVELS = ("none", "summary", "paths", "full")
 
 
 class IPathFinderAlgorithm(ABC):
@@ -13,10 +16,41 @@ class IPathFinderAlgorithm(ABC):
     @abstractmethod
     def find_optimal_path(
         self,
-        graph: Graph,
+        graph: GraphView,
         start_node: str,
         end_node: str,
-        blocked_edges: List[tuple] = None
+        blocked_edges: List[tuple] = None,
+        deadline_ms: Optional[float] = None,
+        history: str = "none",
+        on_iteration: Optional[Callable[[Dict[str, Any]], None]] = None
     ) -> Path:
-        """Find optimal path between two nodes"""
+        """
+        Find optimal path between two nodes
+
+        deadline_ms is an optional latency budget; iterative algorithms
+        return their best path so far once it is spent. history is one of
+        HISTORY_LEVELS and decides what get_iterations_history() returns;
+        "none" records nothing. With on_iteration, iterative algorithms
+        pass each iteration's record to it as soon as it is produced
+        instead of keeping a history; exceptions it raises abort the run.
+        """
         pass
+
+    def get_run_info(self) -> Dict[str, Any]:
+        """
+        Get details about the last run of the calling thread
+
+        Known keys: "stop_reason", "iterations_used", "elapsed_ms",
+        "warm_start", "seed_distance" and "improved_on_seed".
+        Algorithms that report nothing return an empty dictionary.
+        """
+        return {}
+
+    def get_iterations_history(self) -> List[Dict[str, Any]]:
+        """
+        Get per-iteration records of the calling thread's last run
+
+        The records hold what the run's history level asked for.
+        Algorithms that do not iterate return an empty list.
+        """
+        return []
@@ -0,0 +1,21 @@
+"""
+Result Repository Interface (SOLID - Dependency Inversion Principle)
+Defines contract for storing computed routes by ID
+"""
+from abc import ABC, abstractmethod
+from typing import Optional
+from ..entities import RouteRecord
+
+
+class IResultRepository(ABC):
+    """Interface for computed route storage"""
+
+    @abstractmethod
+    def save(self, record: RouteRecord) -> str:
+        """Store a route and return its ID"""
+        pass
+
+    @abstractmethod
+    def get(self, result_id: str) -> Optional[RouteRecord]:
+        """Get a stored route, or None if unknown or expired"""
+        pass
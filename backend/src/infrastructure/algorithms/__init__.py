@@ -1,6 +1,28 @@
 """
 Algorithms __init__
 """
+from .convergence import ConvergenceCriteria
 from .aco_algorithm import AntColonyOptimization
+from .vectorized_aco_algorithm import VectorizedAntColonyOptimization
+from .island_aco_algorithm import IslandModelACO
+from .exact_path_algorithm import (
+    AStarAlgorithm, ContractionHierarchyAlgorithm, DijkstraAlgorithm
+)
+from .connectivity import ConnectivityIndex
+from .distance_matrix import DistanceMatrixCalculator
+from .contraction_hierarchy import ContractionHierarchyProvider
+from .landmarks import LandmarkProvider
 
-__all__ = ['AntColonyOptimization']
+__all__ = [
+    'ConvergenceCriteria',
+    'AntColonyOptimization',
+    'VectorizedAntColonyOptimization',
+    'IslandModelACO',
+    'AStarAlgorithm',
+    'DijkstraAlgorithm',
+    'ContractionHierarchyAlgorithm',
+    'ContractionHierarchyProvider',
+    'ConnectivityIndex',
+    'DistanceMatrixCalculator',
+    'LandmarkProvider'
+]
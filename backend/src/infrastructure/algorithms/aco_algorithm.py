@@ -3,9 +3,27 @@ ACO Algorithm Implementation (Clean Architecture - Infrastructure Layer)
 Implements IPathFinderAlgorithm interface
 """
 import random
-from typing import List, Dict, Any, Tuple
+import threading
+import time
+from typing import List, Dict, Any, Callable, Optional, Sequence, Tuple
 from ...domain.interfaces import IPathFinderAlgorithm
-from ...domain.entities import Graph, Path
+from ...domain.entities import CompiledGraph, GraphOverlay, GraphView, Path
+from ..caching import PheromoneCache, WarmStart
+from .pheromone_store import PheromoneStore
+from .roulette_sampler import RouletteSampler
+from .corridor import find_corridor
+from .iteration_history import IterationHistory
+from .landmarks import LandmarkProvider
+from .local_search import EPSILON, improve_path
+from .shortest_path import Potential, great_circle_potential, max_potential, shortest_path
+from .convergence import (
+    DEADLINE,
+    MAX_ITERATIONS,
+    ConvergenceCriteria,
+    ConvergenceMonitor,
+    branching_factor,
+    dominant_path
+)
 
 
 class AntColonyOptimization(IPathFinderAlgorithm):
@@ -14,83 +32,351 @@ class AntColonyOptimization(IPathFinderAlgorithm):
     SOLID - Single Responsibility: Only handles path optimization logic
     """
 
+    # Draws of an already visited node before falling back to an explicit
+    # draw among the unvisited neighbors
+    max_rejections = 4
+
+    # Local search: edges per exactly re-optimized segment and nodes its
+    # bounded search may settle
+    local_search_window = 8
+    local_search_max_settled = 256
+
     def __init__(
         self,
         n_ants: int = 15,
         n_iterations: int = 30,
         alpha: float = 1.0,
         beta: float = 2.0,
-        evaporation: float = 0.5
+        evaporation: float = 0.5,
+        convergence: Optional[ConvergenceCriteria] = None,
+        max_iterations: int = 1000,
+        pheromone_cache: Optional[PheromoneCache] = None,
+        candidate_list_size: int = 8,
+        seed_with_shortest_path: bool = False,
+        landmarks: Optional[LandmarkProvider] = None,
+        corridor_factor: float = 0.0,
+        local_search: bool = False,
+        history_limit: int = 200
     ):
         self.n_ants = n_ants
         self.n_iterations = n_iterations
+        self.max_iterations = max_iterations
         self.alpha = alpha
         self.beta = beta
         self.evaporation = evaporation
-        self.pheromone: Dict[Tuple[str, str], float] = {}
-        self.iterations_history: List[Dict[str, Any]] = []
+        self.convergence = convergence
+        self.pheromone_cache = pheromone_cache
+        # Ants choose among this many shortest edges of a node first; 0 = all
+        self.candidate_list_size = candidate_list_size
+        # Prime the colony with the exact shortest path as its incumbent
+        self.seed_with_shortest_path = seed_with_shortest_path
+        # Landmark lower bounds make the heuristic goal-directed
+        self.landmarks = landmarks
+        # Confine ants to nodes within this factor of the shortest distance
+        # (at least 1); 0 lets them roam the whole graph
+        self.corridor_factor = corridor_factor
+        # Improve each iteration's best ant before it is compared and reinforced
+        self.local_search = local_search
+        # Most recent iterations a run keeps when a request asks for history
+        self.history_limit = history_limit
+        # Outcome and history of the last run, per thread since instances
+        # are shared
+        self._run_info = threading.local()
 
     def find_optimal_path(
         self,
-        graph: Graph,
+        graph: GraphView,
         start_node: str,
         end_node: str,
-        blocked_edges: List[tuple] = None
+        blocked_edges: List[tuple] = None,
+        deadline_ms: Optional[float] = None,
+        history: str = "none",
+        on_iteration: Optional[Callable[[Dict[str, Any]], None]] = None
     ) -> Path:
-        """Find optimal path using ACO algorithm"""
+        """
+        Find optimal path using ACO algorithm
+
+        Without a deadline the colony runs n_iterations. With deadline_ms it
+        runs as an anytime search: iterations continue (up to
+        max_iterations) until the budget is spent, and the best path found
+        so far is returned. With seed_with_shortest_path the colony starts
+        from the exact shortest path, so it never returns a worse one. With
+        corridor_factor the ants only walk nodes on near-shortest paths.
+        history sets what get_iterations_history() returns afterwards, or
+        what is passed to on_iteration after every iteration.
+        """
+        started = time.monotonic()
+        deadline = self._deadline(started, deadline_ms)
+
         # Validate inputs
         if start_node not in graph.nodes:
             raise ValueError(f"Start node {start_node} not in graph")
         if end_node not in graph.nodes:
             raise ValueError(f"End node {end_node} not in graph")
 
-        # Block edges if specified
+        # Block edges if specified, without touching the caller's graph
         if blocked_edges:
-            for from_node, to_node in blocked_edges:
-                graph.block_edge(from_node, to_node)
+            graph = GraphOverlay.over(graph, blocked_edges)
 
-        # Initialize pheromone
-        self._initialize_pheromone(graph)
+        # Ants walk the interned CSR snapshot; node IDs are restored at the end
+        compiled = graph.compile()
+        start = compiled.node_index[start_node]
+        end = compiled.node_index[end_node]
+        recorder = self._start_history(compiled, history, on_iteration)
 
-        # Run ACO algorithm
-        best_path = None
-        best_distance = float("inf")
+        # Initialize pheromone, seeded from earlier runs when cached
+        pheromone = self._initialize_pheromone(compiled)
+        cache_key = (compiled.version, start, end, compiled.extra_blocked)
+        warm_start = self._warm_start(cache_key, pheromone)
+        seed = self._seed_path(compiled, pheromone, start, end)
+        walk, corridor_info = self._corridor(compiled, start, end, seed)
+        state = self._prepare(walk, end)
 
-        for iteration in range(self.n_iterations):
-            iteration_paths = []
+        # Run ACO algorithm, starting from the seed as incumbent if any
+        best_path = seed[0] if seed else None
+        best_distance = seed[2] if seed else float("inf")
+        monitor = ConvergenceMonitor(self.convergence, self.n_ants)
+        stop_reason = MAX_ITERATIONS
+        iterations_used = 0
 
-            for _ in range(self.n_ants):
-                path, distance = self._construct_path(graph, start_node, end_node)
-                if path and distance < float("inf"):
-                    iteration_paths.append((path, distance))
-                    if distance < best_distance:
-                        best_path = path
-                        best_distance = distance
+        for iteration in range(self._iteration_limit(deadline)):
+            if deadline is not None and iteration > 0 and time.monotonic() >= deadline:
+                stop_reason = DEADLINE
+                break
+
+            iteration_paths = self._run_iteration(state, pheromone, start, end, deadline)
+            self._improve_iteration_best(walk, iteration_paths)
+            self._update_pheromone(pheromone, iteration_paths)
+            iterations_used += 1
 
-            self._update_pheromone(iteration_paths)
-            self._store_iteration_history(iteration, best_path, best_distance, iteration_paths)
+            for path, _, distance in iteration_paths:
+                if distance < best_distance:
+                    best_path = path
+                    best_distance = distance
+
+            recorder.record(
+                iteration, best_path, best_distance, iteration_paths, pheromone
+            )
+
+            converged = monitor.update(
+                best_distance,
+                dominant_path(iteration_paths)[1],
+                self._branching_factor(monitor, walk, pheromone, iteration_paths)
+            )
+            if converged:
+                stop_reason = converged
+                break
+
+        if self.pheromone_cache is not None:
+            self.pheromone_cache.store(cache_key, pheromone)
+        self._record_run(
+            stop_reason, iterations_used, started,
+            warm_start=warm_start, **self._seed_info(seed, best_distance), **corridor_info
+        )
 
         if best_path is None:
             return Path(nodes=[], distance=float('inf'))
 
-        return Path(nodes=best_path, distance=best_distance)
+        return Path(nodes=compiled.to_node_ids(best_path), distance=best_distance)
+
+    def get_run_info(self) -> Dict[str, Any]:
+        """Get stop reason and iterations used by this thread's last run"""
+        return dict(getattr(self._run_info, "data", {}))
+
+    def _record_run(
+        self,
+        stop_reason: str,
+        iterations_used: int,
+        started: float,
+        **details: Any
+    ) -> None:
+        """Remember how the current thread's run ended"""
+        self._run_info.data = {
+            "stop_reason": stop_reason,
+            "iterations_used": iterations_used,
+            "elapsed_ms": (time.monotonic() - started) * 1000.0,
+            **details
+        }
+
+    def _warm_start(self, key: tuple, pheromone: Sequence[float]) -> Optional[str]:
+        """Seed the pheromone from the cache; return the kind of match"""
+        if self.pheromone_cache is None:
+            return None
+        seed = self.pheromone_cache.lookup(key)
+        if seed is None or seed.size != len(pheromone):
+            return None
+        self._seed_pheromone(pheromone, seed)
+        return seed.match
+
+    def _seed_pheromone(self, pheromone: PheromoneStore, seed: WarmStart) -> None:
+        """Blend a cached table into the initial pheromone"""
+        pheromone.blend(seed.background, seed.levels, seed.retention)
+
+    def _seed_path(
+        self,
+        compiled: CompiledGraph,
+        pheromone: Sequence[float],
+        start: int,
+        end: int
+    ) -> Optional[Tuple[List[int], List[int], float]]:
+        """
+        Deposit pheromone along the exact shortest path and return it
+
+        The deposit equals a whole iteration of ants walking the path.
+        Returns None when seeding is off or end is unreachable.
+        """
+        if not self.seed_with_shortest_path:
+            return None
+        nodes, slots, distance, _ = shortest_path(
+            compiled, start, end,
+            max_potential(great_circle_potential(compiled, end), self._potential(compiled, end))
+        )
+        if not slots or distance <= 0:
+            return None
+        self._deposit(pheromone, slots, self.n_ants / distance)
+        return nodes, slots, distance
+
+    def _corridor(
+        self,
+        compiled: CompiledGraph,
+        start: int,
+        end: int,
+        seed: Optional[Tuple[List[int], List[int], float]]
+    ) -> Tuple[CompiledGraph, Dict[str, Any]]:
+        """
+        View confining the ants to the corridor, with its size for run info
+
+        The corridor holds the nodes within corridor_factor of the shortest
+        distance, taken from the seed or else found by A*. The snapshot is
+        returned unchanged when pruning is off or end is unreachable.
+        """
+        if self.corridor_factor <= 0:
+            return compiled, {}
+        potential = max_potential(
+            great_circle_potential(compiled, end), self._potential(compiled, end)
+        )
+        if seed is not None:
+            best_distance = seed[2]
+        else:
+            _, _, best_distance, _ = shortest_path(compiled, start, end, potential)
+        if best_distance == float("inf"):
+            return compiled, {}
+        corridor = find_corridor(
+            compiled, start, end, max(self.corridor_factor, 1.0) * best_distance, potential
+        )
+        if corridor is None:
+            return compiled, {}
+        return corridor.restrict(compiled), {
+            "corridor_nodes": corridor.node_count,
+            "corridor_edges": corridor.edge_count
+        }
+
+    def _seed_info(
+        self,
+        seed: Optional[Tuple[List[int], List[int], float]],
+        best_distance: float
+    ) -> Dict[str, Any]:
+        """Run details comparing the result with the seed path"""
+        if seed is None:
+            return {}
+        return {
+            "seed_distance": seed[2],
+            "improved_on_seed": best_distance < seed[2]
+        }
+
+    def _deadline(self, started: float, deadline_ms: Optional[float]) -> Optional[float]:
+        """Absolute time.monotonic() deadline for a latency budget"""
+        if deadline_ms is None:
+            return None
+        return started + deadline_ms / 1000.0
+
+    def _iteration_limit(self, deadline: Optional[float]) -> int:
+        """Iterations to run: fixed, or bounded only by the budget"""
+        if deadline is None:
+            return self.n_iterations
+        return max(self.n_iterations, self.max_iterations)
+
+    def _branching_factor(
+        self,
+        monitor: ConvergenceMonitor,
+        compiled: CompiledGraph,
+        pheromone: Sequence[float],
+        paths: List[Tuple[List[int], List[int], float]]
+    ) -> Optional[float]:
+        """Branching factor over the nodes the ants passed, if it is monitored"""
+        if not monitor.needs_branching_factor or not paths:
+            return None
+        nodes = (node for path, _, _ in paths for node in path[:-1])
+        return branching_factor(
+            compiled, pheromone, nodes, self.convergence.branching_lambda
+        )
+
+    def _initialize_pheromone(self, compiled: CompiledGraph) -> PheromoneStore:
+        """Initialize pheromone levels on all edge slots"""
+        return PheromoneStore(compiled.edge_count)
+
+    def _deposit(self, pheromone: PheromoneStore, slots: List[int], amount: float) -> None:
+        """Add pheromone to the given slots"""
+        pheromone.deposit(slots, amount)
 
-    def _initialize_pheromone(self, graph: Graph) -> None:
-        """Initialize pheromone levels on all edges"""
-        self.pheromone = {}
-        for edge in graph.edges:
-            if not edge.is_blocked:
-                self.pheromone[edge.as_tuple()] = 1.0
+    def _potential(self, compiled: CompiledGraph, end: int) -> Optional[Potential]:
+        """Landmark lower bound on the remaining distance to end, if available"""
+        if self.landmarks is None:
+            return None
+        return self.landmarks.potential(compiled, end)
+
+    def _prepare(self, compiled: CompiledGraph, end: int) -> Any:
+        """Build the per-request state the ants walk on"""
+        return RouletteSampler(
+            compiled, self.alpha, self.beta, self.candidate_list_size,
+            self._potential(compiled, end)
+        )
+
+    def _run_iteration(
+        self,
+        sampler: RouletteSampler,
+        pheromone: PheromoneStore,
+        start: int,
+        end: int,
+        deadline: Optional[float] = None
+    ) -> List[Tuple[List[int], List[int], float]]:
+        """Let every ant construct a path"""
+        iteration_paths = []
+        sampler.refresh(pheromone)
+
+        for ant in range(self.n_ants):
+            # Past the deadline the remaining ants of the iteration are skipped
+            if deadline is not None and ant > 0 and time.monotonic() >= deadline:
+                break
+            path, slots, distance = self._construct_path(
+                sampler, pheromone, start, end
+            )
+            if path and distance < float("inf"):
+                iteration_paths.append((path, slots, distance))
+
+        return iteration_paths
 
     def _construct_path(
         self,
-        graph: Graph,
-        start: str,
-        end: str
-    ) -> Tuple[List[str], float]:
-        """Construct a path for one ant"""
+        sampler: RouletteSampler,
+        pheromone: PheromoneStore,
+        start: int,
+        end: int
+    ) -> Tuple[List[int], List[int], float]:
+        """
+        Construct a path for one ant
+
+        The next slot is drawn from the node's candidate list and redrawn
+        while it leads to a visited node, which samples the unvisited
+        candidates exactly in proportion to their weights. The remaining
+        open slots are considered only once every candidate is visited.
+        """
+        compiled = sampler.compiled
+        targets = compiled.targets
+        weights = compiled.weights
         current = start
         path = [current]
+        slots = []
         distance = 0
         visited = {current}
         max_steps = 100
@@ -99,84 +385,115 @@ class AntColonyOptimization(IPathFinderAlgorithm):
             if current == end:
                 break
 
-            neighbors = graph.get_neighbors(current)
-            unvisited_neighbors = [n for n in neighbors if n not in visited]
+            slot = sampler.draw(pheromone, current)
+            if slot is None:
+                return None, None, float("inf")
 
-            if not unvisited_neighbors:
-                # Try any neighbor to complete path
-                unvisited_neighbors = neighbors
-                if not unvisited_neighbors:
-                    return None, float("inf")
+            if targets[slot] in visited:
+                for _ in range(self.max_rejections - 1):
+                    slot = sampler.draw(pheromone, current)
+                    if targets[slot] not in visited:
+                        break
+                else:
+                    candidates = [
+                        s for s in sampler.candidates(current)
+                        if targets[s] not in visited
+                    ] or [
+                        s for s in compiled.open_slots(current)
+                        if targets[s] not in visited
+                    ]
+                    # Without unvisited neighbors any candidate completes the path
+                    if candidates:
+                        slot = self._select_next_node(sampler, pheromone, candidates)
 
-            next_node = self._select_next_node(
-                graph, current, unvisited_neighbors
-            )
+            current = targets[slot]
 
-            path.append(next_node)
-            distance += graph.get_edge_weight(current, next_node)
-            visited.add(next_node)
-            current = next_node
+            path.append(current)
+            slots.append(slot)
+            distance += weights[slot]
+            visited.add(current)
 
         if current != end:
-            return None, float("inf")
+            return None, None, float("inf")
 
-        return path, distance
+        return path, slots, distance
 
     def _select_next_node(
         self,
-        graph: Graph,
-        current: str,
-        neighbors: List[str]
-    ) -> str:
-        """Select next node based on pheromone and heuristic"""
-        probabilities = []
-
-        for neighbor in neighbors:
-            edge_key = (current, neighbor)
-            pheromone = self.pheromone.get(edge_key, 1.0) ** self.alpha
-            heuristic = (1.0 / graph.get_edge_weight(current, neighbor)) ** self.beta
-            probabilities.append(pheromone * heuristic)
+        sampler: RouletteSampler,
+        pheromone: PheromoneStore,
+        candidates: Sequence[int]
+    ) -> int:
+        """Select the next edge slot based on pheromone and heuristic"""
+        heuristic = sampler.heuristic
+        # The evaporation scale is common to all candidates and cancels out
+        levels, initial = pheromone.unscaled
+        if self.alpha == 1.0:
+            probabilities = [
+                levels.get(slot, initial) * heuristic[slot] for slot in candidates
+            ]
+        else:
+            alpha = self.alpha
+            probabilities = [
+                (levels.get(slot, initial) ** alpha) * heuristic[slot]
+                for slot in candidates
+            ]
 
         total = sum(probabilities)
         if total == 0:
-            return random.choice(neighbors)
+            return random.choice(candidates)
+
+        return random.choices(candidates, weights=probabilities)[0]
+
+    def _improve_iteration_best(
+        self,
+        compiled: CompiledGraph,
+        paths: List[Tuple[List[int], List[int], float]]
+    ) -> None:
+        """
+        Replace the iteration's best path by its local search improvement
 
-        probabilities = [p / total for p in probabilities]
-        return random.choices(neighbors, weights=probabilities)[0]
+        Runs before the pheromone update, so the colony reinforces the
+        repaired edges in place of the raw ones.
+        """
+        if not self.local_search or not paths:
+            return
+        index = min(range(len(paths)), key=lambda i: paths[i][2])
+        improved = improve_path(
+            compiled, paths[index],
+            self.local_search_window, self.local_search_max_settled
+        )
+        if improved[2] < paths[index][2] - EPSILON:
+            paths[index] = improved
 
-    def _update_pheromone(self, paths: List[Tuple[List[str], float]]) -> None:
+    def _update_pheromone(
+        self,
+        pheromone: PheromoneStore,
+        paths: List[Tuple[List[int], List[int], float]]
+    ) -> None:
         """Update pheromone levels"""
         # Evaporation
-        for edge_key in self.pheromone:
-            self.pheromone[edge_key] *= (1 - self.evaporation)
+        pheromone.evaporate(1 - self.evaporation)
 
         # Reinforcement
-        for path, distance in paths:
-            if path and distance < float("inf"):
-                for i in range(len(path) - 1):
-                    edge_key = (path[i], path[i + 1])
-                    if edge_key in self.pheromone:
-                        self.pheromone[edge_key] += 1.0 / distance
+        for _, slots, distance in paths:
+            if slots and distance < float("inf"):
+                pheromone.deposit(slots, 1.0 / distance)
 
-    def _store_iteration_history(
+    def _start_history(
         self,
-        iteration: int,
-        best_path: List[str],
-        best_distance: float,
-        paths: List[Tuple[List[str], float]]
-    ) -> None:
-        """Store iteration data for visualization"""
-        self.iterations_history.append({
-            "iteration": iteration + 1,
-            "paths": [(path, dist) for path, dist in paths[:5]],
-            "best_path": best_path,
-            "best_distance": best_distance,
-            "pheromone_levels": {
-                str(edge): level
-                for edge, level in list(self.pheromone.items())[:10]
-            }
-        })
+        compiled: CompiledGraph,
+        level: str,
+        listener: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> IterationHistory:
+        """Give the current thread an empty history for a new run"""
+        recorder = IterationHistory(
+            compiled, level, self.history_limit, listener, decay=1 - self.evaporation
+        )
+        self._run_info.history = recorder
+        return recorder
 
     def get_iterations_history(self) -> List[Dict[str, Any]]:
-        """Get iteration history for result"""
-        return self.iterations_history
+        """Get the iterations this thread's last run recorded"""
+        recorder = getattr(self._run_info, "history", None)
+        return recorder.to_dicts() if recorder is not None else []
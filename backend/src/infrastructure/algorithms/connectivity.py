@@ -0,0 +1,235 @@
+"""
+Connectivity Index (Clean Architecture - Infrastructure Layer)
+Component labels answering reachability without a path search
+"""
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+from ...domain.interfaces import IConnectivityIndex
+from ...domain.entities import CompiledGraph, GraphView
+
+
+@dataclass(frozen=True)
+class ComponentLabels:
+    """
+    Weak and strong component labels of one snapshot view
+
+    Nodes in different weakly connected components cannot reach each other
+    and nodes in the same strongly connected component always can; both
+    answers are O(1). Other pairs are decided on the condensation, the DAG
+    of strong components, and memoized.
+    """
+    version: int
+    extra_blocked: FrozenSet[int]
+    weak: array
+    strong: array
+    weak_count: int
+    # Successor strong components of each strong component
+    condensation: List[Tuple[int, ...]]
+
+    _answers: Dict[Tuple[int, int], bool] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    def reachable(self, start: int, end: int) -> bool:
+        """Check whether end can be reached from start"""
+        if self.weak[start] != self.weak[end]:
+            return False
+        source, target = self.strong[start], self.strong[end]
+        if source == target:
+            return True
+        answer = self._answers.get((source, target))
+        if answer is None:
+            answer = self._search(source, target)
+            self._answers[(source, target)] = answer
+        return answer
+
+    def _search(self, source: int, target: int) -> bool:
+        """Depth-first search on the condensation"""
+        seen = {source}
+        stack = [source]
+        while stack:
+            for successor in self.condensation[stack.pop()]:
+                if successor == target:
+                    return True
+                if successor not in seen:
+                    seen.add(successor)
+                    stack.append(successor)
+        return False
+
+    @classmethod
+    def build(cls, compiled: CompiledGraph) -> 'ComponentLabels':
+        """Label the components of a view in two linear passes"""
+        weak = _weak_components(compiled)
+        strong, condensation = _strong_components(compiled)
+        return cls(
+            version=compiled.version,
+            extra_blocked=compiled.extra_blocked,
+            weak=weak,
+            strong=strong,
+            weak_count=len(set(weak)),
+            condensation=condensation
+        )
+
+
+class ConnectivityIndex(IConnectivityIndex):
+    """
+    Thread-safe component labels of the current graph version
+
+    Labels of the graph itself are rebuilt on the first query after a
+    mutation. Request overlays get their own labels, cached by blocked
+    slots until the next mutation; an overlay blocking only edges that are
+    already blocked shares the graph's labels.
+    """
+
+    def __init__(self, max_overlays: int = 32):
+        self._max_overlays = max_overlays
+        self._version = None
+        self._base: Optional[ComponentLabels] = None
+        self._overlays: 'OrderedDict[FrozenSet[int], ComponentLabels]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._builds = 0
+        self._overlay_hits = 0
+        self._last_build_ms = 0.0
+
+    def is_reachable(self, graph: GraphView, start_node: str, end_node: str) -> bool:
+        """Check whether end_node can be reached from start_node in the graph"""
+        compiled = graph.compile()
+        labels = self.get(compiled)
+        return labels.reachable(
+            compiled.node_index[start_node], compiled.node_index[end_node]
+        )
+
+    def get(self, compiled: CompiledGraph) -> ComponentLabels:
+        """Get the labels of a snapshot view, building them if needed"""
+        # Overlay slots that the graph itself already blocks change nothing
+        key = frozenset(
+            slot for slot in compiled.extra_blocked if not compiled.blocked[slot]
+        )
+        with self._lock:
+            if self._version != compiled.version:
+                self._version = compiled.version
+                self._base = None
+                self._overlays.clear()
+            if not key:
+                labels = self._base
+            else:
+                labels = self._overlays.get(key)
+                if labels is not None:
+                    self._overlays.move_to_end(key)
+                    self._overlay_hits += 1
+            if labels is not None:
+                return labels
+
+        # Built outside the lock; a concurrent duplicate build is harmless
+        labels = self._build(compiled)
+        with self._lock:
+            if self._version == compiled.version:
+                if not key:
+                    self._base = labels
+                else:
+                    self._overlays[key] = labels
+                    while len(self._overlays) > self._max_overlays:
+                        self._overlays.popitem(last=False)
+        return labels
+
+    def stats(self) -> Dict[str, Any]:
+        """Index counters for /metrics"""
+        with self._lock:
+            return {
+                "components": self._base.weak_count if self._base else 0,
+                "builds": self._builds,
+                "overlays": len(self._overlays),
+                "overlay_hits": self._overlay_hits,
+                "last_build_ms": self._last_build_ms
+            }
+
+    def _build(self, compiled: CompiledGraph) -> ComponentLabels:
+        """Build labels and record the timing"""
+        started = time.monotonic()
+        labels = ComponentLabels.build(compiled)
+        self._last_build_ms = (time.monotonic() - started) * 1000.0
+        self._builds += 1
+        return labels
+
+
+def _weak_components(compiled: CompiledGraph) -> array:
+    """Union-find over the open slots, ignoring direction"""
+    parent = array('l', range(compiled.node_count))
+
+    def find(node: int) -> int:
+        root = node
+        while parent[root] != root:
+            root = parent[root]
+        while parent[node] != root:
+            parent[node], node = root, parent[node]
+        return root
+
+    targets = compiled.targets
+    for source in range(compiled.node_count):
+        for slot in compiled.open_slots(source):
+            a, b = find(source), find(targets[slot])
+            if a != b:
+                parent[max(a, b)] = min(a, b)
+    return array('l', (find(node) for node in range(compiled.node_count)))
+
+
+def _strong_components(compiled: CompiledGraph) -> Tuple[array, List[Tuple[int, ...]]]:
+    """Iterative Tarjan over the open slots, with the condensation edges"""
+    n = compiled.node_count
+    targets = compiled.targets
+    index = array('l', [-1]) * n
+    low = array('l', [0]) * n
+    component = array('l', [-1]) * n
+    on_stack = bytearray(n)
+    stack: List[int] = []
+    counter = 0
+    components = 0
+
+    for root in range(n):
+        if index[root] >= 0:
+            continue
+        # Frames of (node, position in its open slots)
+        frames = [(root, 0)]
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        while frames:
+            node, position = frames[-1]
+            slots = compiled.open_slots(node)
+            if position < len(slots):
+                frames[-1] = (node, position + 1)
+                neighbor = targets[slots[position]]
+                if index[neighbor] < 0:
+                    index[neighbor] = low[neighbor] = counter
+                    counter += 1
+                    stack.append(neighbor)
+                    on_stack[neighbor] = 1
+                    frames.append((neighbor, 0))
+                elif on_stack[neighbor]:
+                    low[node] = min(low[node], index[neighbor])
+                continue
+            frames.pop()
+            if frames:
+                parent = frames[-1][0]
+                low[parent] = min(low[parent], low[node])
+            if low[node] == index[node]:
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = 0
+                    component[member] = components
+                    if member == node:
+                        break
+                components += 1
+
+    successors: List[set] = [set() for _ in range(components)]
+    for source in range(n):
+        for slot in compiled.open_slots(source):
+            a, b = component[source], component[targets[slot]]
+            if a != b:
+                successors[a].add(b)
+    return component, [tuple(entries) for entries in successors]
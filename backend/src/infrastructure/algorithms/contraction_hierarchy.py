@@ -0,0 +1,311 @@
+"""
+Contraction Hierarchy (Clean Architecture - Infrastructure Layer)
+Node-ordered shortcut graph for fast exact bidirectional queries
+"""
+import threading
+import time
+from array import array
+from dataclasses import dataclass
+from heapq import heapify, heappop, heappush
+from typing import Any, Dict, List, Optional, Tuple
+from ...domain.entities import CompiledGraph
+
+INF = float("inf")
+
+
+@dataclass(frozen=True)
+class ContractionHierarchy:
+    """
+    Contraction hierarchy of one graph version
+
+    Nodes are contracted one by one in order of importance; a shortcut
+    u -> w replaces u -> v -> w whenever that is the only shortest route
+    left once v is removed. A query searches upward from the start and,
+    backwards, upward from the end; the best meeting node gives the exact
+    distance. Edges blocked on the graph itself are left out, while
+    per-request overlays are handled by the query engine.
+    """
+    version: int
+    rank: array
+    # Edges to higher ranked nodes, per source
+    up_offsets: array
+    up_targets: array
+    up_weights: array
+    # Edges from higher ranked nodes, per target
+    down_offsets: array
+    down_sources: array
+    down_weights: array
+    # (u, w) -> (contracted middle node or -1, original slot or -1)
+    parts: Dict[Tuple[int, int], Tuple[int, int]]
+    shortcut_count: int
+
+    # Nodes settled by a witness search before it gives up and a
+    # (possibly unneeded) shortcut is added
+    witness_settle_limit = 60
+
+    @classmethod
+    def build(cls, compiled: CompiledGraph) -> 'ContractionHierarchy':
+        """Contract every node of a snapshot by edge-difference priority"""
+        n = compiled.node_count
+        # Edges between uncontracted nodes and what they stand for
+        outgoing: List[Dict[int, float]] = [{} for _ in range(n)]
+        incoming: List[Dict[int, float]] = [{} for _ in range(n)]
+        parts: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        offsets, targets, weights, blocked = (
+            compiled.offsets, compiled.targets, compiled.weights, compiled.blocked
+        )
+        for source in range(n):
+            for slot in range(offsets[source], offsets[source + 1]):
+                target = targets[slot]
+                if blocked[slot] or target == source:
+                    continue
+                weight = weights[slot]
+                if weight < outgoing[source].get(target, INF):
+                    outgoing[source][target] = weight
+                    incoming[target][source] = weight
+                    parts[(source, target)] = (-1, slot)
+
+        contracted = bytearray(n)
+        depth = [0] * n
+        rank = array('l', [0]) * n
+        # Final hierarchy edges: (u, w) -> (middle, slot, weight)
+        hierarchy: Dict[Tuple[int, int], Tuple[int, int, float]] = {}
+
+        def shortcuts_for(node: int) -> List[Tuple[int, int, float]]:
+            """Shortcuts contracting node would need"""
+            needed = []
+            longest_out = max(outgoing[node].values(), default=0.0)
+            for source, in_weight in incoming[node].items():
+                distances = cls._witness_search(
+                    outgoing, source, node, in_weight + longest_out
+                )
+                for target, out_weight in outgoing[node].items():
+                    through = in_weight + out_weight
+                    if target != source and distances.get(target, INF) > through:
+                        needed.append((source, target, through))
+            return needed
+
+        def priority(node: int) -> int:
+            edge_difference = (
+                len(shortcuts_for(node)) - len(incoming[node]) - len(outgoing[node])
+            )
+            return edge_difference + depth[node]
+
+        queue = [(priority(node), node) for node in range(n)]
+        heapify(queue)
+        next_rank = 0
+        while queue:
+            _, node = heappop(queue)
+            if contracted[node]:
+                continue
+            # Lazy update: re-queue if the node's priority went stale
+            current = priority(node)
+            if queue and current > queue[0][0]:
+                heappush(queue, (current, node))
+                continue
+
+            for source, target, weight in shortcuts_for(node):
+                if weight < outgoing[source].get(target, INF):
+                    outgoing[source][target] = weight
+                    incoming[target][source] = weight
+                    parts[(source, target)] = (node, -1)
+
+            # The node's remaining edges lead to higher ranks and are final
+            contracted[node] = 1
+            rank[node] = next_rank
+            next_rank += 1
+            for source, weight in incoming[node].items():
+                hierarchy[(source, node)] = parts[(source, node)] + (weight,)
+                del outgoing[source][node]
+                depth[source] = max(depth[source], depth[node] + 1)
+            for target, weight in outgoing[node].items():
+                hierarchy[(node, target)] = parts[(node, target)] + (weight,)
+                del incoming[target][node]
+                depth[target] = max(depth[target], depth[node] + 1)
+
+        return cls._assemble(compiled.version, rank, hierarchy)
+
+    @classmethod
+    def _witness_search(
+        cls,
+        outgoing: List[Dict[int, float]],
+        source: int,
+        skipped: int,
+        limit: float
+    ) -> Dict[int, float]:
+        """Bounded Dijkstra from source over uncontracted nodes, avoiding skipped"""
+        distances = {source: 0.0}
+        heap = [(0.0, source)]
+        settled = 0
+        while heap and settled < cls.witness_settle_limit:
+            distance, node = heappop(heap)
+            if distance > limit:
+                break
+            if distance > distances[node]:
+                continue
+            settled += 1
+            for neighbor, weight in outgoing[node].items():
+                if neighbor == skipped:
+                    continue
+                candidate = distance + weight
+                if candidate < distances.get(neighbor, INF):
+                    distances[neighbor] = candidate
+                    heappush(heap, (candidate, neighbor))
+        return distances
+
+    @classmethod
+    def _assemble(
+        cls,
+        version: int,
+        rank: array,
+        hierarchy: Dict[Tuple[int, int], Tuple[int, int, float]]
+    ) -> 'ContractionHierarchy':
+        """Pack hierarchy edges into upward and downward CSR arrays"""
+        n = len(rank)
+        up: List[List[Tuple[int, float]]] = [[] for _ in range(n)]
+        down: List[List[Tuple[int, float]]] = [[] for _ in range(n)]
+        for (source, target), (_, _, weight) in hierarchy.items():
+            if rank[target] > rank[source]:
+                up[source].append((target, weight))
+            else:
+                down[target].append((source, weight))
+
+        def pack(lists: List[List[Tuple[int, float]]]) -> Tuple[array, array, array]:
+            offsets = array('l', [0])
+            nodes = array('l')
+            weights = array('d')
+            for entries in lists:
+                for node, weight in entries:
+                    nodes.append(node)
+                    weights.append(weight)
+                offsets.append(len(nodes))
+            return offsets, nodes, weights
+
+        up_offsets, up_targets, up_weights = pack(up)
+        down_offsets, down_sources, down_weights = pack(down)
+        return cls(
+            version=version,
+            rank=rank,
+            up_offsets=up_offsets,
+            up_targets=up_targets,
+            up_weights=up_weights,
+            down_offsets=down_offsets,
+            down_sources=down_sources,
+            down_weights=down_weights,
+            parts={edge: (middle, slot) for edge, (middle, slot, _) in hierarchy.items()},
+            shortcut_count=sum(1 for middle, _, _ in hierarchy.values() if middle >= 0)
+        )
+
+    def query(self, start: int, end: int) -> Tuple[Optional[List[int]], float, int]:
+        """
+        Exact shortest path as original edge slots
+
+        Returns the slots, the distance and the number of settled nodes;
+        the slots are None when end is unreachable.
+        """
+        if start == end:
+            return [], 0.0, 0
+        forward = {start: 0.0}
+        backward = {end: 0.0}
+        forward_parent: Dict[int, int] = {}
+        backward_parent: Dict[int, int] = {}
+        forward_heap = [(0.0, start)]
+        backward_heap = [(0.0, end)]
+        best, meeting, settled = INF, -1, 0
+
+        while forward_heap or backward_heap:
+            # Each direction stops once it cannot improve on the best meeting
+            if forward_heap and forward_heap[0][0] >= best:
+                forward_heap = []
+            if backward_heap and backward_heap[0][0] >= best:
+                backward_heap = []
+            if forward_heap and (not backward_heap or forward_heap[0][0] <= backward_heap[0][0]):
+                heap, distances, parents, other = forward_heap, forward, forward_parent, backward
+                offsets, nodes, weights = self.up_offsets, self.up_targets, self.up_weights
+            elif backward_heap:
+                heap, distances, parents, other = backward_heap, backward, backward_parent, forward
+                offsets, nodes, weights = self.down_offsets, self.down_sources, self.down_weights
+            else:
+                break
+
+            distance, node = heappop(heap)
+            if distance > distances[node]:
+                continue
+            settled += 1
+            if node in other and distance + other[node] < best:
+                best, meeting = distance + other[node], node
+            for index in range(offsets[node], offsets[node + 1]):
+                neighbor = nodes[index]
+                candidate = distance + weights[index]
+                if candidate < distances.get(neighbor, INF):
+                    distances[neighbor] = candidate
+                    parents[neighbor] = node
+                    heappush(heap, (candidate, neighbor))
+
+        if meeting < 0:
+            return None, INF, settled
+
+        # Hierarchy edges start -> meeting, then meeting -> end
+        chain = [meeting]
+        while chain[-1] != start:
+            chain.append(forward_parent[chain[-1]])
+        chain.reverse()
+        while chain[-1] != end:
+            chain.append(backward_parent[chain[-1]])
+
+        slots: List[int] = []
+        for source, target in zip(chain, chain[1:]):
+            self._unpack(source, target, slots)
+        return slots, best, settled
+
+    def _unpack(self, source: int, target: int, slots: List[int]) -> None:
+        """Append the original slots a hierarchy edge stands for"""
+        stack = [(source, target)]
+        while stack:
+            source, target = stack.pop()
+            middle, slot = self.parts[(source, target)]
+            if middle < 0:
+                slots.append(slot)
+            else:
+                # Pushed in reverse so the first half is unpacked first
+                stack.append((middle, target))
+                stack.append((source, middle))
+
+
+class ContractionHierarchyProvider:
+    """
+    Thread-safe source of the contraction hierarchy of the current version
+
+    The hierarchy is built on the first query of every graph version.
+    """
+
+    def __init__(self):
+        self._hierarchy: Optional[ContractionHierarchy] = None
+        self._lock = threading.Lock()
+        self._builds = 0
+        self._last_build_ms = 0.0
+
+    def get(self, compiled: CompiledGraph) -> ContractionHierarchy:
+        """Get the hierarchy for a snapshot's version, building it if needed"""
+        hierarchy = self._hierarchy
+        if hierarchy is not None and hierarchy.version == compiled.version:
+            return hierarchy
+        with self._lock:
+            hierarchy = self._hierarchy
+            if hierarchy is None or hierarchy.version != compiled.version:
+                started = time.monotonic()
+                hierarchy = ContractionHierarchy.build(compiled)
+                self._last_build_ms = (time.monotonic() - started) * 1000.0
+                self._builds += 1
+                self._hierarchy = hierarchy
+        return hierarchy
+
+    def stats(self) -> Dict[str, Any]:
+        """Preprocessing counters for /metrics"""
+        with self._lock:
+            hierarchy = self._hierarchy
+            return {
+                "builds": self._builds,
+                "last_build_ms": self._last_build_ms,
+                "shortcuts": hierarchy.shortcut_count if hierarchy else 0
+            }
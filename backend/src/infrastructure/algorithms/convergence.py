@@ -0,0 +1,119 @@
+"""
+ACO Convergence Detection (Clean Architecture - Infrastructure Layer)
+Decides when a colony has settled so a run can stop before n_iterations
+"""
+from collections import Counter
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Sequence, Tuple
+from ...domain.entities import CompiledGraph
+
+
+# Stop reasons reported in OptimizationResult
+MAX_ITERATIONS = "max_iterations"
+STAGNATION = "stagnation"
+SAME_PATH = "same_path"
+LOW_BRANCHING = "low_branching"
+DEADLINE = "deadline"
+
+
+@dataclass(frozen=True)
+class ConvergenceCriteria:
+    """
+    Early termination thresholds; a criterion set to None is disabled
+
+    stagnation_limit: iterations without improvement of the best distance
+    same_path_ratio: share of the iteration's ants that followed one path
+    min_branching_factor: mean lambda-branching factor of the decision
+        nodes on the iteration's paths at or below which the run stops
+    """
+    stagnation_limit: Optional[int] = None
+    same_path_ratio: Optional[float] = None
+    min_branching_factor: Optional[float] = None
+    branching_lambda: float = 0.05
+    min_iterations: int = 1
+
+
+def dominant_path(
+    paths: Iterable[Tuple[List[int], List[int], float]]
+) -> Tuple[Tuple[int, ...], int]:
+    """Most frequent edge slot sequence among paths and how many ants took it"""
+    counts = Counter(tuple(slots) for _, slots, _ in paths)
+    if not counts:
+        return (), 0
+    return counts.most_common(1)[0]
+
+
+def branching_factor(
+    compiled: CompiledGraph,
+    pheromone: Sequence[float],
+    nodes: Iterable[int],
+    branching_lambda: float
+) -> Optional[float]:
+    """
+    Mean lambda-branching factor over the given nodes
+
+    An outgoing edge counts as a branch when its pheromone is within
+    lambda of the node's range above the minimum. Nodes with a single open
+    edge carry no decision and are skipped; returns None if none remain.
+    """
+    factors = []
+    for node in set(nodes):
+        slots = compiled.open_slots(node)
+        if len(slots) < 2:
+            continue
+        levels = [pheromone[slot] for slot in slots]
+        low = min(levels)
+        threshold = low + branching_lambda * (max(levels) - low)
+        if threshold == low:
+            factors.append(float(len(levels)))
+        else:
+            factors.append(float(sum(1 for level in levels if level >= threshold)))
+    if not factors:
+        return None
+    return sum(factors) / len(factors)
+
+
+class ConvergenceMonitor:
+    """Tracks one run and reports the first criterion that is met"""
+
+    def __init__(self, criteria: Optional[ConvergenceCriteria], n_ants: int):
+        self._criteria = criteria or ConvergenceCriteria()
+        self._n_ants = max(1, n_ants)
+        self._best_distance = float("inf")
+        self._stagnant = 0
+        self._iterations = 0
+
+    @property
+    def needs_branching_factor(self) -> bool:
+        return self._criteria.min_branching_factor is not None
+
+    def update(
+        self,
+        best_distance: float,
+        dominant_count: int,
+        branching: Optional[float] = None
+    ) -> Optional[str]:
+        """Record one finished iteration; return a stop reason or None"""
+        criteria = self._criteria
+        self._iterations += 1
+
+        if best_distance < self._best_distance:
+            self._best_distance = best_distance
+            self._stagnant = 0
+        else:
+            self._stagnant += 1
+
+        if self._iterations < criteria.min_iterations:
+            return None
+        if (criteria.stagnation_limit is not None
+                and best_distance < float("inf")
+                and self._stagnant >= criteria.stagnation_limit):
+            return STAGNATION
+        if (criteria.same_path_ratio is not None
+                and dominant_count / self._n_ants >= criteria.same_path_ratio):
+            return SAME_PATH
+        if (criteria.min_branching_factor is not None
+                and branching is not None
+                and branching <= criteria.min_branching_factor):
+            return LOW_BRANCHING
+        return None
@@ -0,0 +1,120 @@
+"""
+Search Corridor (Clean Architecture - Infrastructure Layer)
+Restricts a query to the nodes that can lie on a near-shortest path
+"""
+from dataclasses import dataclass
+from heapq import heappop, heappush
+from typing import Dict, FrozenSet, Optional
+from ...domain.entities import CompiledGraph
+from .shortest_path import Potential
+
+INF = float("inf")
+
+
+@dataclass(frozen=True)
+class Corridor:
+    """
+    Nodes v with d(start, v) + d(v, end) <= limit
+
+    exits are the open slots leading from a corridor node to a node
+    outside; blocking them confines a walk from start to the corridor.
+    Every corridor node keeps a path to end inside the corridor.
+    """
+    nodes: FrozenSet[int]
+    exits: FrozenSet[int]
+    edge_count: int
+    limit: float
+
+    @property
+    def node_count(self) -> int:
+        """Number of nodes kept"""
+        return len(self.nodes)
+
+    def restrict(self, compiled: CompiledGraph) -> CompiledGraph:
+        """View of the snapshot without the corridor's exits"""
+        return compiled.with_blocked(self.exits)
+
+
+def find_corridor(
+    compiled: CompiledGraph,
+    start: int,
+    end: int,
+    limit: float,
+    potential: Optional[Potential] = None
+) -> Optional[Corridor]:
+    """
+    Corridor of a query by bounded forward and backward searches
+
+    The forward search from start skips nodes whose distance plus the
+    lower bound potential (to end) exceeds limit; the backward search from
+    end only visits nodes the forward search kept. Both distances are
+    exact on the corridor. Returns None when end is not within limit.
+    """
+    forward = _forward_distances(compiled, start, limit, potential)
+    if forward.get(end, INF) > limit:
+        return None
+    nodes = frozenset(_backward_distances(compiled, end, limit, forward))
+
+    targets = compiled.targets
+    exits = []
+    edge_count = 0
+    for node in nodes:
+        for slot in compiled.open_slots(node):
+            if targets[slot] in nodes:
+                edge_count += 1
+            else:
+                exits.append(slot)
+    return Corridor(nodes=nodes, exits=frozenset(exits), edge_count=edge_count, limit=limit)
+
+
+def _forward_distances(
+    compiled: CompiledGraph,
+    start: int,
+    limit: float,
+    potential: Optional[Potential]
+) -> Dict[int, float]:
+    """Distances from start of the nodes that may lie within limit"""
+    targets = compiled.targets
+    weights = compiled.weights
+    distances = {start: 0.0}
+    heap = [(0.0, start)]
+    while heap:
+        distance, node = heappop(heap)
+        if distance > distances[node]:
+            continue
+        if potential is not None and distance + potential(node) > limit:
+            continue
+        for slot in compiled.open_slots(node):
+            neighbor = targets[slot]
+            candidate = distance + weights[slot]
+            if candidate <= limit and candidate < distances.get(neighbor, INF):
+                distances[neighbor] = candidate
+                heappush(heap, (candidate, neighbor))
+    return distances
+
+
+def _backward_distances(
+    compiled: CompiledGraph,
+    end: int,
+    limit: float,
+    forward: Dict[int, float]
+) -> Dict[int, float]:
+    """Distances to end of the nodes whose detour stays within limit"""
+    offsets, slots, sources = compiled.reverse_index()
+    weights = compiled.weights
+    distances = {end: 0.0}
+    heap = [(0.0, end)]
+    while heap:
+        distance, node = heappop(heap)
+        if distance > distances[node]:
+            continue
+        for index in range(offsets[node], offsets[node + 1]):
+            slot = slots[index]
+            source = sources[index]
+            if source not in forward or compiled.is_blocked(slot):
+                continue
+            candidate = distance + weights[slot]
+            if forward[source] + candidate <= limit and candidate < distances.get(source, INF):
+                distances[source] = candidate
+                heappush(heap, (candidate, source))
+    return distances
@@ -0,0 +1,92 @@
+"""
+Distance Matrix Calculator (Clean Architecture - Infrastructure Layer)
+Many-to-many shortest distances from one search per source
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+from ...domain.interfaces import IDistanceMatrixCalculator
+from ...domain.entities import CompiledGraph, DistanceMatrix, GraphView
+from .shortest_path import one_to_many
+
+
+class DistanceMatrixCalculator(IDistanceMatrixCalculator):
+    """
+    Distance matrix from one-to-many Dijkstra searches
+
+    Each distinct source runs a single search that stops once all targets
+    are settled; the sources are spread over a thread pool sharing one
+    compiled snapshot.
+
+    one_to_many is pure Python and keeps the GIL for the whole search, so
+    the rows are computed effectively one after another: max_workers caps
+    how many searches a request starts, not how many cores it uses.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        self.max_workers = max(1, max_workers)
+
+    def compute(
+        self,
+        graph: GraphView,
+        sources: List[str],
+        targets: List[str],
+        include_paths: bool = False
+    ) -> DistanceMatrix:
+        """Compute the distance from every source to every target"""
+        started = time.monotonic()
+        for node_id in list(sources) + list(targets):
+            if node_id not in graph.nodes:
+                raise ValueError(f"Node '{node_id}' not found in graph")
+
+        compiled = graph.compile()
+        ends = [compiled.node_index[node_id] for node_id in targets]
+        unique_sources = list(dict.fromkeys(sources))
+
+        workers = min(self.max_workers, len(unique_sources))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            rows = dict(zip(unique_sources, pool.map(
+                lambda source: self._row(compiled, source, ends, include_paths),
+                unique_sources
+            )))
+
+        distances: List[Optional[float]] = []
+        paths: List[Optional[List[str]]] = []
+        for source in sources:
+            row_distances, row_paths = rows[source]
+            distances.extend(row_distances)
+            paths.extend(row_paths)
+
+        return DistanceMatrix(
+            sources=list(sources),
+            targets=list(targets),
+            distances=distances,
+            paths=paths if include_paths else None,
+            elapsed_ms=(time.monotonic() - started) * 1000.0
+        )
+
+    def _row(
+        self,
+        compiled: CompiledGraph,
+        source: str,
+        ends: List[int],
+        include_paths: bool
+    ) -> Tuple[List[Optional[float]], List[Optional[List[str]]]]:
+        """Distances, and paths if requested, from one source to every target"""
+        start = compiled.node_index[source]
+        settled, parents = one_to_many(compiled, start, set(ends))
+        distances = [settled.get(end) for end in ends]
+        if not include_paths:
+            return distances, []
+
+        paths: List[Optional[List[str]]] = []
+        for end in ends:
+            if end not in settled:
+                paths.append(None)
+                continue
+            nodes = [end]
+            while nodes[-1] != start:
+                nodes.append(parents[nodes[-1]][0])
+            nodes.reverse()
+            paths.append(compiled.to_node_ids(nodes))
+        return distances, paths
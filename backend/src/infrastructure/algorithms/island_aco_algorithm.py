@@ -0,0 +1,451 @@
+"""
+Island Model ACO Implementation (Clean Architecture - Infrastructure Layer)
+Runs independent colonies in a process pool that periodically share their best
+path and blend in a neighbour's pheromone
+"""
+import os
+import threading
+import time
+from collections import Counter
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+from ...domain.entities import CompiledGraph, GraphOverlay, GraphView, Path
+from ..caching import PheromoneCache
+from .aco_algorithm import AntColonyOptimization
+from .landmarks import LandmarkProvider
+from .pheromone_store import PheromoneStore
+from .convergence import (
+    DEADLINE,
+    MAX_ITERATIONS,
+    ConvergenceCriteria,
+    ConvergenceMonitor,
+    dominant_path
+)
+
+
+@dataclass(frozen=True)
+class _SharedSnapshot:
+    """
+    Picklable handle to a CSR snapshot published in shared memory
+
+    One block holds, in order: offsets, targets, weights, the heuristic
+    table for beta, two banks of one pheromone row per colony and the
+    blocked mask. An epoch reads the rows of one bank and writes those of
+    the other, so a colony can read its neighbour's row while that
+    neighbour runs. Workers map it read-only except for the row of the
+    colony they are running in the bank being written.
+    """
+    name: str
+    index_typecode: str
+    node_count: int
+    edge_count: int
+    n_colonies: int
+    extra_blocked: FrozenSet[int]
+    beta: float
+
+    @property
+    def index_size(self) -> int:
+        return array(self.index_typecode).itemsize
+
+    def layout(self) -> Dict[str, Tuple[int, int]]:
+        """Byte offset and length of every section of the block"""
+        sections = [
+            ("offsets", (self.node_count + 1) * self.index_size),
+            ("targets", self.edge_count * self.index_size),
+            ("weights", self.edge_count * 8),
+            ("heuristic", self.edge_count * 8),
+            ("pheromone", 2 * self.n_colonies * self.edge_count * 8),
+            ("blocked", self.edge_count),
+        ]
+        layout = {}
+        position = 0
+        for section, length in sections:
+            layout[section] = (position, length)
+            position += length
+        return layout
+
+    @property
+    def size(self) -> int:
+        position, length = self.layout()["blocked"]
+        return position + length
+
+
+def _publish_snapshot(
+    compiled: CompiledGraph,
+    n_colonies: int,
+    initial_pheromone: array,
+    beta: float
+) -> Tuple[shared_memory.SharedMemory, _SharedSnapshot]:
+    """Copy a compiled graph and every colony's initial pheromone into shared memory"""
+    handle = _SharedSnapshot(
+        name="",
+        index_typecode=compiled.offsets.typecode,
+        node_count=compiled.node_count,
+        edge_count=compiled.edge_count,
+        n_colonies=n_colonies,
+        extra_blocked=compiled.extra_blocked,
+        beta=beta
+    )
+    shm = shared_memory.SharedMemory(create=True, size=max(handle.size, 1))
+    handle = replace(handle, name=shm.name)
+
+    layout = handle.layout()
+    pheromone_rows = initial_pheromone.tobytes() * (2 * n_colonies)
+    for section, data in (
+        ("offsets", compiled.offsets.tobytes()),
+        ("targets", compiled.targets.tobytes()),
+        ("weights", compiled.weights.tobytes()),
+        ("heuristic", compiled.heuristic(beta).tobytes()),
+        ("pheromone", pheromone_rows),
+        ("blocked", bytes(compiled.blocked)),
+    ):
+        position, length = layout[section]
+        shm.buf[position:position + length] = data
+    return shm, handle
+
+
+def _row_index(handle: _SharedSnapshot, bank: int, colony: int) -> int:
+    """Position of a colony's pheromone row among all rows"""
+    return bank * handle.n_colonies + colony
+
+
+def _read_pheromone(
+    shm: shared_memory.SharedMemory,
+    handle: _SharedSnapshot,
+    bank: int,
+    colony: int
+) -> array:
+    """Copy one colony's pheromone row out of shared memory"""
+    position, _ = handle.layout()["pheromone"]
+    row_size = handle.edge_count * 8
+    position += _row_index(handle, bank, colony) * row_size
+    table = array('d')
+    table.frombytes(bytes(shm.buf[position:position + row_size]))
+    return table
+
+
+def _attach_snapshot(
+    handle: _SharedSnapshot
+) -> Tuple[shared_memory.SharedMemory, List[memoryview], CompiledGraph, memoryview]:
+    """Map a published snapshot and all its pheromone rows"""
+    shm = shared_memory.SharedMemory(name=handle.name)
+    layout = handle.layout()
+    views = []
+
+    def view(section: str, typecode: str) -> memoryview:
+        position, length = layout[section]
+        raw = shm.buf[position:position + length]
+        views.append(raw)
+        typed = raw.cast(typecode)
+        views.append(typed)
+        return typed
+
+    compiled = CompiledGraph(
+        version=0,
+        node_ids=[],
+        node_index={},
+        offsets=view("offsets", handle.index_typecode),
+        targets=view("targets", handle.index_typecode),
+        weights=view("weights", 'd'),
+        blocked=view("blocked", 'B'),
+        extra_blocked=handle.extra_blocked,
+        _heuristics={handle.beta: view("heuristic", 'd')}
+    )
+    rows = view("pheromone", 'd')
+    return shm, views, compiled, rows
+
+
+@lru_cache(maxsize=8)
+def _colony_engine(parameters: Tuple[Tuple[str, Any], ...]) -> AntColonyOptimization:
+    """The worker process's ACO for one parameter set, built on first use"""
+    return AntColonyOptimization(**dict(parameters))
+
+
+def _run_colony_epoch(
+    handle: _SharedSnapshot,
+    colony: int,
+    parameters: Tuple[Tuple[str, Any], ...],
+    start: int,
+    end: int,
+    n_iterations: int,
+    bank: int = 0,
+    blend: float = 0.0,
+    migrant: Optional[Tuple[List[int], float]] = None,
+    deadline: Optional[float] = None,
+    snapshot_pheromone: bool = False
+) -> List[Tuple[list, tuple, Optional[array], Optional[set], tuple]]:
+    """
+    Run one colony for a migration interval inside a worker process
+
+    The colony starts from its row in the given bank, with the share blend
+    of it replaced by the previous colony's row, and leaves its pheromone
+    in the other bank. Returns per iteration the five first ant paths, the
+    colony's best path so far, the pheromone table and the slots deposited
+    on when snapshot_pheromone is set (else None) and the colony's most
+    frequent path with its ant count, all in interned node indices. Stops early at the
+    time.monotonic() deadline, which is shared by all processes.
+    """
+    aco = _colony_engine(parameters)
+    shm, views, compiled, rows = _attach_snapshot(handle)
+    edge_count = handle.edge_count
+
+    def row(bank: int, colony: int) -> memoryview:
+        position = _row_index(handle, bank, colony % handle.n_colonies) * edge_count
+        view = rows[position:position + edge_count]
+        views.append(view)
+        return view
+
+    try:
+        # Migration: blend in the pheromone of the previous colony on the ring
+        levels = row(bank, colony)
+        if blend > 0 and handle.n_colonies > 1:
+            keep = 1.0 - blend
+            levels = [
+                own * keep + neighbour * blend
+                for own, neighbour in zip(levels, row(bank, colony - 1))
+            ]
+        # Evaporate lazily during the epoch, write the row back once at the end
+        pheromone = PheromoneStore.from_levels(levels)
+
+        # Migration: the global best path reinforces this colony's trail
+        if migrant is not None:
+            slots, distance = migrant
+            pheromone.deposit(slots, 1.0 / distance)
+
+        best = (None, None, float("inf"))
+        history = []
+        state = aco._prepare(compiled, end)
+        for iteration in range(n_iterations):
+            if deadline is not None and iteration > 0 and time.monotonic() >= deadline:
+                break
+            iteration_paths = aco._run_iteration(state, pheromone, start, end, deadline)
+            aco._improve_iteration_best(compiled, iteration_paths)
+            aco._update_pheromone(pheromone, iteration_paths)
+            for candidate in iteration_paths:
+                if candidate[2] < best[2]:
+                    best = candidate
+            history.append((
+                iteration_paths[:5],
+                best,
+                pheromone.to_array() if snapshot_pheromone else None,
+                {slot for _, slots, _ in iteration_paths for slot in slots}
+                if snapshot_pheromone else None,
+                dominant_path(iteration_paths)
+            ))
+        row(1 - bank, colony)[:] = pheromone.to_array()
+        return history
+    finally:
+        for view in reversed(views):
+            view.release()
+        shm.close()
+
+
+class IslandModelACO(AntColonyOptimization):
+    """
+    Parallel ACO running independent colonies as islands
+
+    Every colony keeps its own pheromone row in a shared memory copy of the
+    CSR snapshot and runs in a worker process. After each migration
+    interval the global best path is sent to all colonies, which reinforce
+    it, and every colony blends the share pheromone_migration of the
+    previous colony's pheromone (in a ring) into its own before
+    continuing. Convergence is checked by the coordinator on the
+    merged colonies (stagnation and same-path share; the branching factor
+    is not available since pheromone stays inside the workers). Landmarks
+    only guide the seed path; workers use the plain heuristic.
+    """
+
+    def __init__(
+        self,
+        n_ants: int = 15,
+        n_iterations: int = 30,
+        alpha: float = 1.0,
+        beta: float = 2.0,
+        evaporation: float = 0.5,
+        convergence: Optional[ConvergenceCriteria] = None,
+        max_iterations: int = 1000,
+        pheromone_cache: Optional[PheromoneCache] = None,
+        candidate_list_size: int = 8,
+        seed_with_shortest_path: bool = False,
+        landmarks: Optional[LandmarkProvider] = None,
+        corridor_factor: float = 0.0,
+        local_search: bool = False,
+        history_limit: int = 200,
+        n_colonies: int = None,
+        migration_interval: int = 5,
+        pheromone_migration: float = 0.1,
+        max_workers: int = None
+    ):
+        super().__init__(
+            n_ants=n_ants,
+            n_iterations=n_iterations,
+            alpha=alpha,
+            beta=beta,
+            evaporation=evaporation,
+            convergence=convergence,
+            max_iterations=max_iterations,
+            pheromone_cache=pheromone_cache,
+            candidate_list_size=candidate_list_size,
+            seed_with_shortest_path=seed_with_shortest_path,
+            landmarks=landmarks,
+            corridor_factor=corridor_factor,
+            local_search=local_search,
+            history_limit=history_limit
+        )
+        self.n_colonies = n_colonies or os.cpu_count() or 1
+        self.migration_interval = max(1, migration_interval)
+        self.pheromone_migration = min(max(pheromone_migration, 0.0), 1.0)
+        self.max_workers = max_workers or self.n_colonies
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def find_optimal_path(
+        self,
+        graph: GraphView,
+        start_node: str,
+        end_node: str,
+        blocked_edges: List[tuple] = None,
+        deadline_ms: Optional[float] = None,
+        history: str = "none",
+        on_iteration: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Path:
+        """
+        Find optimal path with colonies running in parallel processes
+
+        At history level "full" the recorded pheromone is the first
+        colony's.
+        """
+        started = time.monotonic()
+        deadline = self._deadline(started, deadline_ms)
+        iteration_limit = self._iteration_limit(deadline)
+
+        # Validate inputs
+        if start_node not in graph.nodes:
+            raise ValueError(f"Start node {start_node} not in graph")
+        if end_node not in graph.nodes:
+            raise ValueError(f"End node {end_node} not in graph")
+
+        # Block edges if specified, without touching the caller's graph
+        if blocked_edges:
+            graph = GraphOverlay.over(graph, blocked_edges)
+
+        compiled = graph.compile()
+        start = compiled.node_index[start_node]
+        end = compiled.node_index[end_node]
+        recorder = self._start_history(compiled, history, on_iteration)
+
+        # Hashable, so every worker builds its engine once per parameter set
+        parameters = (
+            ("alpha", self.alpha),
+            ("beta", self.beta),
+            ("candidate_list_size", self.candidate_list_size),
+            ("evaporation", self.evaporation),
+            ("local_search", self.local_search),
+            ("n_ants", self.n_ants),
+        )
+
+        monitor = ConvergenceMonitor(self.convergence, self.n_ants * self.n_colonies)
+        stop_reason = None
+        iteration = 0
+        epochs = 0
+        # Every colony starts from the same (possibly warm-started and
+        # seeded) table; the seed path is the first migrant
+        pheromone = self._initialize_pheromone(compiled)
+        cache_key = (compiled.version, start, end, compiled.extra_blocked)
+        warm_start = self._warm_start(cache_key, pheromone)
+        seed = self._seed_path(compiled, pheromone, start, end)
+        best = seed or (None, None, float("inf"))
+        walk, corridor_info = self._corridor(compiled, start, end, seed)
+        shm, handle = _publish_snapshot(
+            walk, self.n_colonies, pheromone, self.beta
+        )
+        try:
+            while iteration < iteration_limit and stop_reason is None:
+                if deadline is not None and iteration > 0 and time.monotonic() >= deadline:
+                    stop_reason = DEADLINE
+                    break
+
+                epoch = min(self.migration_interval, iteration_limit - iteration)
+                migrant = (best[1], best[2]) if best[0] is not None else None
+                blend = self.pheromone_migration if epochs > 0 else 0.0
+                executor = self._get_executor()
+                futures = [
+                    executor.submit(
+                        _run_colony_epoch, handle, colony, parameters,
+                        start, end, epoch, epochs % 2, blend, migrant, deadline,
+                        history == "full" and colony == 0
+                    )
+                    for colony in range(self.n_colonies)
+                ]
+                histories = [future.result() for future in futures]
+                epochs += 1
+
+                # Colonies cut short by the deadline report fewer iterations
+                completed = min(len(colony_history) for colony_history in histories)
+                if completed < epoch:
+                    stop_reason = DEADLINE
+
+                # Migration at the start of the epoch moved levels beyond the deposits
+                if epochs > 1:
+                    recorder.resync()
+                for offset in range(completed):
+                    paths = []
+                    dominant = Counter()
+                    for colony_history in histories:
+                        iteration_paths, colony_best, _, _, (slots, count) = colony_history[offset]
+                        paths.extend(iteration_paths)
+                        dominant[slots] += count
+                        if colony_best[2] < best[2]:
+                            best = colony_best
+                    recorder.record(
+                        iteration,
+                        best[0],
+                        best[2],
+                        sorted(paths, key=lambda path: path[2]),
+                        histories[0][offset][2],
+                        histories[0][offset][3]
+                    )
+                    iteration += 1
+
+                    converged = monitor.update(
+                        best[2], max(dominant.values(), default=0)
+                    )
+                    if converged:
+                        stop_reason = converged
+                        break
+
+            if self.pheromone_cache is not None:
+                self.pheromone_cache.store(
+                    cache_key, _read_pheromone(shm, handle, epochs % 2, 0)
+                )
+        finally:
+            shm.close()
+            shm.unlink()
+
+        self._record_run(
+            stop_reason or MAX_ITERATIONS, iteration, started,
+            warm_start=warm_start, **self._seed_info(seed, best[2]), **corridor_info
+        )
+
+        if best[0] is None:
+            return Path(nodes=[], distance=float('inf'))
+
+        return Path(nodes=compiled.to_node_ids(best[0]), distance=best[2])
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Create the worker pool on first use"""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._executor
+
+    def shutdown(self) -> None:
+        """Stop the worker processes"""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
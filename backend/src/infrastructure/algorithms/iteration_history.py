@@ -0,0 +1,166 @@
+"""
+Iteration History (Clean Architecture - Infrastructure Layer)
+Bounded, level-controlled record of ACO iterations for visualization
+"""
+from array import array
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+from ...domain.entities import CompiledGraph
+from ...domain.interfaces import HISTORY_LEVELS
+
+# Ant paths kept per iteration from the "paths" level on
+SAMPLED_PATHS = 5
+
+
+class IterationHistory:
+    """
+    Ring buffer of the most recent iterations of one run
+
+    The level decides what an iteration costs to record:
+
+    - "none": nothing
+    - "summary": iteration number, best distance and ants that arrived
+    - "paths": also the best path and the first ant paths
+    - "full": also a snapshot of the pheromone on every edge slot
+
+    Records hold interned node indices and float64 arrays; node IDs and
+    the response dictionaries are only built by to_dicts(). Once limit
+    iterations are recorded the oldest are dropped.
+
+    With a listener nothing is buffered: every iteration is passed on as
+    a dictionary when it is recorded. At level "full" the first one then
+    carries "pheromone_levels" and later ones a "pheromone_delta": decay,
+    the evaporation factor every level was multiplied by, and the levels
+    of the slots deposited on. A delta costs O(slots deposited), so the
+    pheromone table is only read in full for the first iteration and
+    after resync().
+    """
+
+    def __init__(
+        self,
+        compiled: CompiledGraph,
+        level: str = "none",
+        limit: int = 200,
+        listener: Optional[Callable[[Dict[str, Any]], None]] = None,
+        decay: float = 1.0
+    ):
+        if level not in HISTORY_LEVELS:
+            raise ValueError(
+                f"Unknown history level '{level}', expected one of: "
+                + ", ".join(HISTORY_LEVELS)
+            )
+        self._compiled = compiled
+        self._rank = HISTORY_LEVELS.index(level)
+        self._records: Deque[tuple] = deque(maxlen=max(1, limit))
+        self._listener = listener
+        self._decay = decay
+        # "('A', 'B')" keys of the open slots, built at level "full"
+        self._edge_keys: Optional[Dict[int, str]] = None
+        # Whether the listener has levels to apply deltas to
+        self._synced = False
+
+    @property
+    def enabled(self) -> bool:
+        """Whether recording stores anything"""
+        return self._rank > 0
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def record(
+        self,
+        iteration: int,
+        best_path: Optional[List[int]],
+        best_distance: float,
+        paths: Sequence[Tuple[List[int], List[int], float]],
+        pheromone: Any = None,
+        deposited: Optional[Iterable[int]] = None
+    ) -> None:
+        """
+        Record one iteration; a no-op at level "none"
+
+        Ant paths are kept by reference, as they are never modified once
+        built. pheromone is anything with a float64 tobytes() and slot
+        indexing, and is only read at level "full". deposited are the
+        slots the iteration deposited on, by default those of paths.
+        """
+        if not self._rank:
+            return
+        found = sum(1 for _, _, distance in paths if distance < float("inf"))
+        sampled = None
+        if self._rank >= 2:
+            sampled = tuple((path, distance) for path, _, distance in paths[:SAMPLED_PATHS])
+        else:
+            best_path = None
+        full = self._rank >= 3 and pheromone is not None
+
+        if self._listener is None:
+            levels = None
+            if full:
+                levels = array('d')
+                levels.frombytes(pheromone.tobytes())
+            self._records.append(
+                (iteration + 1, best_distance, found, best_path, sampled, levels)
+            )
+            return
+        entry = self._entry((iteration + 1, best_distance, found, best_path, sampled, None))
+        if full:
+            if deposited is None:
+                deposited = {slot for _, slots, _ in paths for slot in slots}
+            entry.update(self._pheromone_update(pheromone, deposited))
+        self._listener(entry)
+
+    def resync(self) -> None:
+        """Send the listener every level again with the next iteration"""
+        self._synced = False
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Recorded iterations as response dictionaries with node IDs restored"""
+        return [self._entry(record) for record in self._records]
+
+    def _entry(self, record: tuple) -> Dict[str, Any]:
+        """One record as a response dictionary"""
+        compiled = self._compiled
+        iteration, best_distance, found, best_path, sampled, levels = record
+        entry: Dict[str, Any] = {
+            "iteration": iteration,
+            "best_distance": best_distance,
+            "paths_found": found
+        }
+        if sampled is not None:
+            entry["paths"] = [
+                (compiled.to_node_ids(path), distance) for path, distance in sampled
+            ]
+            entry["best_path"] = compiled.to_node_ids(best_path) if best_path else None
+        if levels is not None:
+            entry["pheromone_levels"] = {
+                key: levels[slot] for slot, key in self._keys().items()
+            }
+        return entry
+
+    def _pheromone_update(self, pheromone: Any, deposited: Iterable[int]) -> Dict[str, Any]:
+        """Levels for the listener: all of them first, then only the deposits"""
+        keys = self._keys()
+        if not self._synced:
+            self._synced = True
+            return {"pheromone_levels": {
+                key: float(pheromone[slot]) for slot, key in keys.items()
+            }}
+        # Every other level only evaporated
+        changed = {
+            keys[slot]: float(pheromone[slot]) for slot in deposited if slot in keys
+        }
+        return {"pheromone_delta": {"decay": self._decay, "levels": changed}}
+
+    def _keys(self) -> Dict[int, str]:
+        """Open slots with their "('A', 'B')" keys"""
+        if self._edge_keys is None:
+            compiled = self._compiled
+            node_ids = compiled.node_ids
+            targets = compiled.targets
+            self._edge_keys = {
+                slot: str((node_ids[source], node_ids[targets[slot]]))
+                for source in range(compiled.node_count)
+                for slot in compiled.open_slots(source)
+            }
+        return self._edge_keys
@@ -0,0 +1,282 @@
+"""
+Landmark Preprocessing (Clean Architecture - Infrastructure Layer)
+ALT lower bounds from precomputed distances to and from landmark nodes
+"""
+import base64
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from array import array
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from ...domain.entities import CompiledGraph
+from .shortest_path import Potential, distances_from
+
+logger = logging.getLogger(__name__)
+
+INF = float("inf")
+
+
+def graph_fingerprint(compiled: CompiledGraph) -> str:
+    """Content hash of a snapshot's nodes, edges and blocked flags"""
+    digest = hashlib.sha1()
+    digest.update("\0".join(compiled.node_ids).encode())
+    for table in (compiled.offsets, compiled.targets, compiled.weights):
+        digest.update(bytes(table))
+    digest.update(bytes(compiled.blocked))
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class LandmarkIndex:
+    """
+    Distances from and to a few landmark nodes of one graph version
+
+    For a landmark L the triangle inequality gives the lower bounds
+    d(v, t) >= d(L, t) - d(L, v) and d(v, t) >= d(v, L) - d(t, L). The
+    largest bound over all landmarks is a consistent A* potential. Bounds
+    stay valid for overlays of the same version, which only block edges.
+    """
+    version: int
+    fingerprint: str
+    landmarks: List[str]
+    # One array('d') per landmark, indexed by interned node
+    forward: List[array]
+    backward: List[array]
+
+    def lower_bound(self, node: int, target: int) -> float:
+        """Largest landmark lower bound on the distance from node to target"""
+        bound = 0.0
+        for from_landmark, to_landmark in zip(self.forward, self.backward):
+            # Pairs of unreachable nodes give no information
+            if from_landmark[node] < INF:
+                bound = max(bound, from_landmark[target] - from_landmark[node])
+            if to_landmark[target] < INF:
+                bound = max(bound, to_landmark[node] - to_landmark[target])
+        return bound
+
+    def potential(self, target: int) -> Potential:
+        """Memoized lower bound on the distance to a fixed target"""
+        bounds: Dict[int, float] = {}
+
+        def potential(node: int) -> float:
+            bound = bounds.get(node)
+            if bound is None:
+                bound = self.lower_bound(node, target)
+                bounds[node] = bound
+            return bound
+
+        return potential
+
+    @classmethod
+    def build(
+        cls,
+        compiled: CompiledGraph,
+        count: int,
+        landmarks: Sequence[str] = ()
+    ) -> 'LandmarkIndex':
+        """
+        Compute landmark distances for a snapshot
+
+        Landmarks that still exist are reused, which makes re-running after
+        a mutation cost only two Dijkstra searches per landmark. Missing
+        ones are chosen by farthest-point selection.
+        """
+        forward_adjacency, backward_adjacency = _adjacency(compiled)
+        chosen = [compiled.node_index[node_id] for node_id in landmarks
+                  if node_id in compiled.node_index][:count]
+        forward = [distances_from(forward_adjacency, node) for node in chosen]
+
+        if len(chosen) < count and compiled.node_count:
+            # Distance of every node to its nearest chosen landmark
+            nearest = array('d', [INF]) * compiled.node_count
+            for distances in forward:
+                _take_min(nearest, distances)
+            if not chosen:
+                nearest = distances_from(forward_adjacency, 0)
+            while len(chosen) < min(count, compiled.node_count):
+                candidate = _farthest(nearest, chosen)
+                if candidate is None:
+                    break
+                chosen.append(candidate)
+                forward.append(distances_from(forward_adjacency, candidate))
+                if len(chosen) == 1:
+                    nearest = array('d', forward[0])
+                else:
+                    _take_min(nearest, forward[-1])
+
+        return cls(
+            version=compiled.version,
+            fingerprint=graph_fingerprint(compiled),
+            landmarks=compiled.to_node_ids(chosen),
+            forward=forward,
+            backward=[distances_from(backward_adjacency, node) for node in chosen]
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable form; distance arrays are base64 float64 bytes"""
+        def encode(table: array) -> str:
+            return base64.b64encode(table.tobytes()).decode("ascii")
+
+        return {
+            "fingerprint": self.fingerprint,
+            "landmarks": self.landmarks,
+            "forward": [encode(table) for table in self.forward],
+            "backward": [encode(table) for table in self.backward]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], version: int) -> 'LandmarkIndex':
+        """Restore a serialized index for the given graph version"""
+        def decode(text: str) -> array:
+            table = array('d')
+            table.frombytes(base64.b64decode(text))
+            return table
+
+        return cls(
+            version=version,
+            fingerprint=data["fingerprint"],
+            landmarks=list(data["landmarks"]),
+            forward=[decode(text) for text in data["forward"]],
+            backward=[decode(text) for text in data["backward"]]
+        )
+
+
+class LandmarkProvider:
+    """
+    Thread-safe source of the landmark index of the current graph version
+
+    The index is rebuilt on first use after a mutation, reusing the
+    previous landmarks. With a path it is also saved to disk and loaded
+    again after a restart when the graph content is unchanged.
+    """
+
+    def __init__(self, count: int = 8, path: Optional[str] = None):
+        self._count = count
+        self._path = path
+        self._index: Optional[LandmarkIndex] = None
+        self._lock = threading.Lock()
+        self._builds = 0
+        self._loads = 0
+        self._last_build_ms = 0.0
+
+    def get(self, compiled: CompiledGraph) -> Optional[LandmarkIndex]:
+        """Get the index for a snapshot's version, building it if needed"""
+        if self._count <= 0:
+            return None
+        index = self._index
+        if index is not None and index.version == compiled.version:
+            return index
+        with self._lock:
+            index = self._index
+            if index is None or index.version != compiled.version:
+                index = self._load_or_build(compiled, index)
+                self._index = index
+        return index
+
+    def potential(self, compiled: CompiledGraph, target: int) -> Optional[Potential]:
+        """Landmark lower bound to the target, or None when disabled"""
+        index = self.get(compiled)
+        return index.potential(target) if index is not None else None
+
+    def stats(self) -> Dict[str, Any]:
+        """Preprocessing counters for /metrics"""
+        with self._lock:
+            return {
+                "landmarks": len(self._index.landmarks) if self._index else 0,
+                "builds": self._builds,
+                "loads": self._loads,
+                "last_build_ms": self._last_build_ms
+            }
+
+    def _load_or_build(
+        self,
+        compiled: CompiledGraph,
+        previous: Optional[LandmarkIndex]
+    ) -> LandmarkIndex:
+        """Adopt the persisted index if it matches, else rebuild and persist"""
+        fingerprint = graph_fingerprint(compiled)
+        if previous is not None and previous.fingerprint == fingerprint:
+            return LandmarkIndex(
+                compiled.version, fingerprint, previous.landmarks,
+                previous.forward, previous.backward
+            )
+
+        stored = self._read()
+        if stored is not None and stored.get("fingerprint") == fingerprint:
+            self._loads += 1
+            return LandmarkIndex.from_dict(stored, compiled.version)
+
+        reuse = previous.landmarks if previous else (stored or {}).get("landmarks", [])
+        started = time.monotonic()
+        index = LandmarkIndex.build(compiled, self._count, reuse)
+        self._last_build_ms = (time.monotonic() - started) * 1000.0
+        self._builds += 1
+        self._write(index)
+        return index
+
+    def _read(self) -> Optional[Dict[str, Any]]:
+        """Read the persisted index, if any"""
+        if not self._path or not os.path.exists(self._path):
+            return None
+        try:
+            with open(self._path, "r", encoding="utf-8") as handle:
+                return json.load(handle)
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable landmark file %s: %s", self._path, e)
+            return None
+
+    def _write(self, index: LandmarkIndex) -> None:
+        """Persist the index atomically"""
+        if not self._path:
+            return
+        temporary = f"{self._path}.tmp"
+        try:
+            with open(temporary, "w", encoding="utf-8") as handle:
+                json.dump(index.to_dict(), handle)
+            os.replace(temporary, self._path)
+        except OSError as e:
+            logger.warning("Could not persist landmarks to %s: %s", self._path, e)
+
+
+def _adjacency(
+    compiled: CompiledGraph
+) -> Tuple[List[List[Tuple[int, float]]], List[List[Tuple[int, float]]]]:
+    """
+    Forward and reverse (neighbor, weight) lists of the graph itself
+
+    Slots blocked only by a request overlay are kept so that the bounds
+    hold for every overlay of the version.
+    """
+    forward = [[] for _ in range(compiled.node_count)]
+    backward = [[] for _ in range(compiled.node_count)]
+    offsets = compiled.offsets
+    targets = compiled.targets
+    weights = compiled.weights
+    blocked = compiled.blocked
+    for source in range(compiled.node_count):
+        for slot in range(offsets[source], offsets[source + 1]):
+            if blocked[slot]:
+                continue
+            forward[source].append((targets[slot], weights[slot]))
+            backward[targets[slot]].append((source, weights[slot]))
+    return forward, backward
+
+
+def _take_min(nearest: array, distances: array) -> None:
+    """Lower nearest to distances element-wise"""
+    for node, distance in enumerate(distances):
+        if distance < nearest[node]:
+            nearest[node] = distance
+
+
+def _farthest(nearest: array, chosen: List[int]) -> Optional[int]:
+    """Node farthest from the chosen landmarks; unreached nodes come first"""
+    best, best_distance = None, -1.0
+    for node, distance in enumerate(nearest):
+        if distance > best_distance and node not in chosen:
+            best, best_distance = node, distance
+    return best
@@ -0,0 +1,153 @@
+"""
+Local Search (Clean Architecture - Infrastructure Layer)
+Improvement moves for ant paths: loops, shortcuts and exact segment repair
+"""
+from heapq import heappop, heappush
+from typing import Dict, List, Optional, Tuple
+from ...domain.entities import CompiledGraph
+
+# Node path, edge slots and distance, as the ACO engines pass paths around
+AntPath = Tuple[List[int], List[int], float]
+
+# Savings below this are rounding noise
+EPSILON = 1e-9
+
+
+def improve_path(
+    compiled: CompiledGraph,
+    path: AntPath,
+    window: int = 8,
+    max_settled: int = 256
+) -> AntPath:
+    """
+    Apply loop removal, shortcuts and segment re-optimization to a path
+
+    Segments of up to window edges are replaced by the exact shortest
+    route between their ends when a search settling at most max_settled
+    nodes finds a shorter one. The result is never longer than the input.
+    """
+    nodes, slots, _ = path
+    nodes, slots = remove_loops(nodes, slots)
+    nodes, slots = take_shortcuts(compiled, nodes, slots)
+    if window > 1:
+        nodes, slots = reoptimize_segments(compiled, nodes, slots, window, max_settled)
+    weights = compiled.weights
+    return nodes, slots, sum(weights[slot] for slot in slots)
+
+
+def remove_loops(nodes: List[int], slots: List[int]) -> Tuple[List[int], List[int]]:
+    """Cut out every cycle, keeping the first visit of each node"""
+    kept_nodes = [nodes[0]]
+    kept_slots: List[int] = []
+    position = {nodes[0]: 0}
+    for slot, node in zip(slots, nodes[1:]):
+        if node in position:
+            keep = position[node]
+            for removed in kept_nodes[keep + 1:]:
+                del position[removed]
+            del kept_nodes[keep + 1:]
+            del kept_slots[keep:]
+            continue
+        position[node] = len(kept_nodes)
+        kept_nodes.append(node)
+        kept_slots.append(slot)
+    return kept_nodes, kept_slots
+
+
+def take_shortcuts(
+    compiled: CompiledGraph,
+    nodes: List[int],
+    slots: List[int]
+) -> Tuple[List[int], List[int]]:
+    """
+    Replace stretches of a loop-free path by a single shorter open edge
+
+    From each node the edge saving the most is taken, which also swaps in
+    a cheaper parallel edge to the next node.
+    """
+    targets = compiled.targets
+    weights = compiled.weights
+    prefix = [0.0]
+    for slot in slots:
+        prefix.append(prefix[-1] + weights[slot])
+    position = {node: i for i, node in enumerate(nodes)}
+
+    short_nodes = [nodes[0]]
+    short_slots: List[int] = []
+    i = 0
+    while i < len(slots):
+        best_j, best_slot, best_saving = i + 1, slots[i], EPSILON
+        for slot in compiled.open_slots(nodes[i]):
+            j = position.get(targets[slot], -1)
+            if j > i:
+                saving = prefix[j] - prefix[i] - weights[slot]
+                if saving > best_saving:
+                    best_j, best_slot, best_saving = j, slot, saving
+        short_slots.append(best_slot)
+        short_nodes.append(nodes[best_j])
+        i = best_j
+    return short_nodes, short_slots
+
+
+def reoptimize_segments(
+    compiled: CompiledGraph,
+    nodes: List[int],
+    slots: List[int],
+    window: int,
+    max_settled: int
+) -> Tuple[List[int], List[int]]:
+    """Replace overlapping windows of a path by bounded exact searches"""
+    targets = compiled.targets
+    weights = compiled.weights
+    i = 0
+    while i < len(slots):
+        j = min(i + window, len(slots))
+        last = j == len(slots)
+        length = sum(weights[slot] for slot in slots[i:j])
+        shorter = _bounded_path(compiled, nodes[i], nodes[j], length, max_settled)
+        if shorter is not None:
+            slots = slots[:i] + shorter + slots[j:]
+            nodes = [nodes[0]] + [targets[slot] for slot in slots]
+            nodes, slots = remove_loops(nodes, slots)
+        if last:
+            break
+        i += max(1, window // 2)
+    return nodes, slots
+
+
+def _bounded_path(
+    compiled: CompiledGraph,
+    start: int,
+    end: int,
+    limit: float,
+    max_settled: int
+) -> Optional[List[int]]:
+    """Slots of a path from start to end shorter than limit, if one is found"""
+    targets = compiled.targets
+    weights = compiled.weights
+    distances = {start: 0.0}
+    parents: Dict[int, Tuple[int, int]] = {}
+    heap = [(0.0, start)]
+    settled = 0
+    while heap and settled < max_settled:
+        distance, node = heappop(heap)
+        if distance > distances[node]:
+            continue
+        if distance >= limit - EPSILON:
+            return None
+        if node == end:
+            path = []
+            while node != start:
+                node, slot = parents[node]
+                path.append(slot)
+            path.reverse()
+            return path
+        settled += 1
+        for slot in compiled.open_slots(node):
+            neighbor = targets[slot]
+            candidate = distance + weights[slot]
+            if candidate < distances.get(neighbor, float("inf")):
+                distances[neighbor] = candidate
+                parents[neighbor] = (node, slot)
+                heappush(heap, (candidate, neighbor))
+    return None
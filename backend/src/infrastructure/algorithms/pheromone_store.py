@@ -0,0 +1,139 @@
+"""
+Pheromone Store (Clean Architecture - Infrastructure Layer)
+Pheromone table with lazy evaporation for the ACO engines
+"""
+from array import array
+from typing import Dict, Optional, Sequence, Set, Tuple
+
+
+class PheromoneStore:
+    """
+    Per-slot pheromone levels with evaporation as a global scale factor
+
+    The level of a slot is ``scale * unscaled``. Evaporation only shrinks
+    the scale and a deposit of ``amount`` adds ``amount / scale`` to the
+    slot's unscaled value, so an iteration costs O(slots deposited) instead
+    of O(edges). Slots never deposited on share the unscaled initial level.
+    When the scale underflows ``min_scale`` the deposits are folded back
+    into the unscaled values. Slots whose unscaled value changed are
+    tracked for take_changes().
+    """
+
+    min_scale = 1e-100
+
+    def __init__(self, size: int, initial: float = 1.0):
+        self._size = size
+        self._initial = initial
+        self._scale = 1.0
+        self._unscaled: Dict[int, float] = {}
+        # None: every slot may have changed
+        self._changed: Optional[Set[int]] = None
+
+    @classmethod
+    def from_levels(cls, levels: Sequence[float]) -> 'PheromoneStore':
+        """Build a store holding a copy of a dense table"""
+        store = cls(len(levels))
+        store._unscaled = dict(enumerate(levels))
+        return store
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, slot: int) -> float:
+        return self._scale * self._unscaled.get(slot, self._initial)
+
+    def __setitem__(self, slot: int, level: float) -> None:
+        self._unscaled[slot] = level / self._scale
+        if self._changed is not None:
+            self._changed.add(slot)
+
+    @property
+    def unscaled(self) -> Tuple[Dict[int, float], float]:
+        """
+        Read-only unscaled levels and the default for untouched slots
+
+        They are proportional to the real levels, which is all a roulette
+        wheel draw needs.
+        """
+        return self._unscaled, self._initial
+
+    def evaporate(self, retention: float) -> None:
+        """Multiply every level by retention"""
+        if retention <= 0:
+            self._unscaled.clear()
+            self._initial = 0.0
+            self._scale = 1.0
+            self._changed = None
+            return
+        self._scale *= retention
+        if self._scale < self.min_scale:
+            self._renormalize()
+
+    def deposit(self, slots: Sequence[int], amount: float) -> None:
+        """Add amount to the level of every given slot"""
+        unscaled = self._unscaled
+        initial = self._initial
+        amount /= self._scale
+        for slot in slots:
+            unscaled[slot] = unscaled.get(slot, initial) + amount
+        if self._changed is not None:
+            self._changed.update(slots)
+
+    def take_changes(self) -> Optional[Set[int]]:
+        """
+        Slots whose unscaled value changed since the last call
+
+        None means every slot may have changed. Evaporation and
+        renormalization scale all slots alike and are not reported.
+        """
+        changed = self._changed
+        self._changed = set()
+        return changed
+
+    def sparse(self) -> Tuple[float, Dict[int, float]]:
+        """Level shared by the untouched slots and the levels of the others"""
+        scale = self._scale
+        return scale * self._initial, {
+            slot: scale * level for slot, level in self._unscaled.items()
+        }
+
+    def blend(self, background: float, levels: Dict[int, float], share: float) -> None:
+        """
+        Move every level the given share of the way toward a sparse table
+
+        The table holds the given levels and background for every other
+        slot. Costs O(slots touched here or in levels), not O(edges).
+        """
+        keep = 1.0 - share
+        scale = self._scale
+        unscaled = self._unscaled
+        blended = {slot: self[slot] * keep + level * share for slot, level in levels.items()}
+        # Untouched slots and touched ones off the table move alike
+        shift = share * background / scale
+        for slot in unscaled:
+            unscaled[slot] = unscaled[slot] * keep + shift
+        self._initial = self._initial * keep + shift
+        for slot, level in blended.items():
+            unscaled[slot] = level / scale
+        self._changed = None
+
+    def to_array(self) -> array:
+        """Materialize the levels as a dense array('d')"""
+        table = array('d', [self._scale * self._initial]) * self._size
+        scale = self._scale
+        for slot, level in self._unscaled.items():
+            table[slot] = scale * level
+        return table
+
+    def tobytes(self) -> bytes:
+        """Dense float64 bytes, as array('d').tobytes()"""
+        return self.to_array().tobytes()
+
+    def _renormalize(self) -> None:
+        """Fold the scale into the unscaled values"""
+        scale = self._scale
+        unscaled = self._unscaled
+        for slot in unscaled:
+            unscaled[slot] *= scale
+        self._initial *= scale
+        self._scale = 1.0
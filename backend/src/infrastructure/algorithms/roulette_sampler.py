@@ -0,0 +1,139 @@
+"""
+Roulette Sampler (Clean Architecture - Infrastructure Layer)
+Next-edge selection kernel with cached per-node cumulative weights
+"""
+import random
+from bisect import bisect_right
+from itertools import accumulate
+from operator import length_hint
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from ...domain.entities import CompiledGraph
+from ...domain.entities.compiled_graph import MIN_HEURISTIC_WEIGHT
+from .pheromone_store import PheromoneStore
+from .shortest_path import Potential
+
+
+class GoalDirectedHeuristic:
+    """
+    Per-slot heuristic (1 / (weight + lower bound to the target)) ** beta
+
+    Ranks an edge by the estimated length of the whole route through it
+    rather than by its own length. Values are computed on first use.
+    """
+
+    def __init__(self, compiled: CompiledGraph, beta: float, potential: Potential):
+        self._targets = compiled.targets
+        self._weights = compiled.weights
+        self._beta = beta
+        self._potential = potential
+        self._values: Dict[int, float] = {}
+
+    def __getitem__(self, slot: int) -> float:
+        value = self._values.get(slot)
+        if value is None:
+            estimate = self._weights[slot] + self._potential(self._targets[slot])
+            value = (1.0 / max(estimate, MIN_HEURISTIC_WEIGHT)) ** self._beta
+            self._values[slot] = value
+        return value
+
+
+class RouletteSampler:
+    """
+    Draws outgoing edge slots with probability pheromone^alpha * heuristic
+
+    The heuristic is the per-version (1 / weight) ** beta table, or the
+    goal-directed variant when a lower bound to the target is given.
+
+    Every node keeps a cumulative weight table over its candidate list (its
+    candidate_list_size shortest open slots, all of them for 0), so a draw
+    is one uniform number and a bisection. Tables are built from the
+    store's unscaled levels, which global evaporation does not change, and
+    are dropped only for nodes whose outgoing slots received a deposit.
+    Uniform numbers are drawn in one batch per iteration, sized after the
+    previous iteration's consumption.
+    """
+
+    min_batch = 64
+    max_batch = 1 << 16
+
+    def __init__(
+        self,
+        compiled: CompiledGraph,
+        alpha: float,
+        beta: float,
+        candidate_list_size: int = 0,
+        potential: Optional[Potential] = None
+    ):
+        self.compiled = compiled
+        self.candidate_list_size = candidate_list_size
+        self.heuristic: Sequence[float] = (
+            compiled.heuristic(beta) if potential is None
+            else GoalDirectedHeuristic(compiled, beta, potential)
+        )
+        self._alpha = alpha
+        self._tables: Dict[int, Tuple[Tuple[int, ...], List[float]]] = {}
+        self._batch = self.min_batch
+        self._uniforms: Iterator[float] = iter(())
+
+    def refresh(self, pheromone: PheromoneStore) -> None:
+        """Drop tables made stale by deposits and pre-draw uniform numbers"""
+        changed = pheromone.take_changes()
+        if changed is None:
+            self._tables.clear()
+        else:
+            offsets = self.compiled.offsets
+            tables = self._tables
+            for slot in changed:
+                tables.pop(bisect_right(offsets, slot) - 1, None)
+
+        left = length_hint(self._uniforms)
+        if left == 0:
+            self._batch = min(self._batch * 2, self.max_batch)
+        else:
+            used = self._batch - left
+            self._batch = max(self.min_batch, used + used // 4)
+        rand = random.random
+        self._uniforms = iter([rand() for _ in range(self._batch)])
+
+    def uniform(self) -> float:
+        """Next pre-drawn uniform number, drawing more once the batch is spent"""
+        value = next(self._uniforms, None)
+        return random.random() if value is None else value
+
+    def candidates(self, node: int) -> Tuple[int, ...]:
+        """Slots a node's draws are made from"""
+        return self.compiled.candidate_slots(node, self.candidate_list_size)
+
+    def draw(self, pheromone: PheromoneStore, node: int) -> Optional[int]:
+        """Draw one slot of a node's candidate list, or None if it has none"""
+        table = self._tables.get(node)
+        if table is None:
+            table = self._build(pheromone, node)
+        slots, cumulative = table
+        if not slots:
+            return None
+        total = cumulative[-1]
+        if total > 0:
+            index = bisect_right(cumulative, self.uniform() * total)
+            return slots[min(index, len(slots) - 1)]
+        return slots[int(self.uniform() * len(slots))]
+
+    def _build(
+        self,
+        pheromone: PheromoneStore,
+        node: int
+    ) -> Tuple[Tuple[int, ...], List[float]]:
+        """Build and cache the cumulative weight table of a node"""
+        slots = self.candidates(node)
+        levels, initial = pheromone.unscaled
+        heuristic = self.heuristic
+        if self._alpha == 1.0:
+            weights = [levels.get(slot, initial) * heuristic[slot] for slot in slots]
+        else:
+            alpha = self._alpha
+            weights = [
+                (levels.get(slot, initial) ** alpha) * heuristic[slot] for slot in slots
+            ]
+        table = (slots, list(accumulate(weights)))
+        self._tables[node] = table
+        return table
@@ -0,0 +1,154 @@
+"""
+Shortest Path Search (Clean Architecture - Infrastructure Layer)
+Binary-heap Dijkstra / A* over a compiled graph snapshot
+"""
+from array import array
+from heapq import heappop, heappush
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from ...domain.entities import CompiledGraph
+
+# Lower bound on the remaining distance from a node to the target
+Potential = Callable[[int], float]
+
+
+def great_circle_potential(compiled: CompiledGraph, target: int) -> Optional[Potential]:
+    """
+    Scaled great-circle distance to the target, or None without coordinates
+
+    The scale comes from CompiledGraph.distance_scale(), which keeps the
+    bound consistent, so A* settles every node at most once.
+    """
+    scale = compiled.distance_scale()
+    if scale <= 0:
+        return None
+    bounds: Dict[int, float] = {}
+
+    def potential(node: int) -> float:
+        bound = bounds.get(node)
+        if bound is None:
+            bound = scale * compiled.great_circle_km(node, target)
+            bounds[node] = bound
+        return bound
+
+    return potential
+
+
+def shortest_path(
+    compiled: CompiledGraph,
+    start: int,
+    end: int,
+    potential: Optional[Potential] = None
+) -> Tuple[Optional[List[int]], Optional[List[int]], float, int]:
+    """
+    Exact shortest path over the open slots of a snapshot
+
+    Runs Dijkstra, or A* when a consistent potential is given. Returns the
+    node path, its edge slots, its distance and the number of settled
+    nodes; the path and slots are None when end is unreachable.
+    """
+    targets = compiled.targets
+    weights = compiled.weights
+    distances = {start: 0.0}
+    # Node and slot each reached node was last relaxed from
+    parents: Dict[int, Tuple[int, int]] = {}
+    settled = set()
+    heap = [(potential(start) if potential else 0.0, 0.0, start)]
+
+    while heap:
+        _, distance, node = heappop(heap)
+        if node in settled:
+            continue
+        settled.add(node)
+        if node == end:
+            break
+        for slot in compiled.open_slots(node):
+            neighbor = targets[slot]
+            if neighbor in settled:
+                continue
+            candidate = distance + weights[slot]
+            if candidate < distances.get(neighbor, float("inf")):
+                distances[neighbor] = candidate
+                parents[neighbor] = (node, slot)
+                key = candidate + potential(neighbor) if potential else candidate
+                heappush(heap, (key, candidate, neighbor))
+
+    if end not in settled:
+        return None, None, float("inf"), len(settled)
+
+    # Walk the parent slots back from the end
+    slots = []
+    node = end
+    while node != start:
+        node, slot = parents[node]
+        slots.append(slot)
+    slots.reverse()
+    nodes = [start] + [targets[slot] for slot in slots]
+    return nodes, slots, distances[end], len(settled)
+
+
+def one_to_many(
+    compiled: CompiledGraph,
+    start: int,
+    ends: Set[int]
+) -> Tuple[Dict[int, float], Dict[int, Tuple[int, int]]]:
+    """
+    Dijkstra from start until every node of ends is settled
+
+    Returns the distances of the settled nodes and the (node, slot) each
+    was reached from; ends missing from the distances are unreachable.
+    """
+    targets = compiled.targets
+    weights = compiled.weights
+    distances = {start: 0.0}
+    parents: Dict[int, Tuple[int, int]] = {}
+    settled: Dict[int, float] = {}
+    remaining = set(ends)
+    heap = [(0.0, start)]
+
+    while heap and remaining:
+        distance, node = heappop(heap)
+        if node in settled:
+            continue
+        settled[node] = distance
+        remaining.discard(node)
+        for slot in compiled.open_slots(node):
+            neighbor = targets[slot]
+            if neighbor in settled:
+                continue
+            candidate = distance + weights[slot]
+            if candidate < distances.get(neighbor, float("inf")):
+                distances[neighbor] = candidate
+                parents[neighbor] = (node, slot)
+                heappush(heap, (candidate, neighbor))
+
+    return settled, parents
+
+
+def max_potential(*potentials: Optional[Potential]) -> Optional[Potential]:
+    """Pointwise maximum of lower bounds, which is again consistent"""
+    available = [potential for potential in potentials if potential is not None]
+    if not available:
+        return None
+    if len(available) == 1:
+        return available[0]
+    return lambda node: max(potential(node) for potential in available)
+
+
+def distances_from(
+    adjacency: List[List[Tuple[int, float]]],
+    source: int
+) -> array:
+    """Single-source Dijkstra distances over (neighbor, weight) lists; inf if unreachable"""
+    distances = array('d', [float("inf")]) * len(adjacency)
+    distances[source] = 0.0
+    heap = [(0.0, source)]
+    while heap:
+        distance, node = heappop(heap)
+        if distance > distances[node]:
+            continue
+        for neighbor, weight in adjacency[node]:
+            candidate = distance + weight
+            if candidate < distances[neighbor]:
+                distances[neighbor] = candidate
+                heappush(heap, (candidate, neighbor))
+    return distances
@@ -0,0 +1,312 @@
+"""
+Vectorized ACO Algorithm Implementation (Clean Architecture - Infrastructure Layer)
+Advances all ants of an iteration in lockstep with NumPy
+"""
+import time
+from typing import List, Optional, Tuple
+import numpy as np
+from ...domain.entities import CompiledGraph
+from ...domain.entities.compiled_graph import MIN_HEURISTIC_WEIGHT
+from ..caching import WarmStart
+from .aco_algorithm import AntColonyOptimization
+
+
+class VectorizedAntColonyOptimization(AntColonyOptimization):
+    """
+    ACO variant that moves every ant of an iteration one step at a time
+
+    Per step the candidate edge slots of all active ants are gathered into
+    one padded matrix, weighted by pheromone^alpha * heuristic^beta in batch
+    and sampled with a single vectorized draw. Paths, distances and the
+    iteration history follow the AntColonyOptimization contract.
+
+    Every step costs a fixed few dozen NumPy calls whatever the colony
+    size, so this only outruns the per-ant engine for large colonies:
+    about 0.3-0.6x its ants/s at 15 ants and under 2x at 200-1000 ants on
+    a 1,600-node grid (benchmarks/benchmark_aco.py vectorized). It is
+    therefore opt-in as ACO_ENGINE 'vectorized', with 'standard' the
+    default.
+    """
+
+    max_steps = 100
+
+    # Largest ants x nodes visited matrix kept per iteration; bigger
+    # colonies compare candidates against the ants' own path prefixes
+    max_visited_cells = 1 << 24
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._rng = np.random.default_rng()
+
+    def _initialize_pheromone(self, compiled: CompiledGraph) -> np.ndarray:
+        """Initialize pheromone levels on all edge slots"""
+        return np.ones(compiled.edge_count)
+
+    def _seed_pheromone(self, pheromone: np.ndarray, seed: WarmStart) -> None:
+        """Blend a cached table into the initial pheromone"""
+        retention = seed.retention
+        pheromone += (seed.background - pheromone) * retention
+        if seed.levels:
+            slots = np.fromiter(seed.levels.keys(), dtype=np.int64, count=len(seed.levels))
+            levels = np.fromiter(seed.levels.values(), dtype=np.float64, count=len(seed.levels))
+            pheromone[slots] += (levels - seed.background) * retention
+
+    def _deposit(self, pheromone: np.ndarray, slots: List[int], amount: float) -> None:
+        """Add pheromone to the given slots"""
+        np.add.at(pheromone, np.asarray(slots, dtype=np.int64), amount)
+
+    def _prepare(self, compiled: CompiledGraph, end: int) -> Tuple[np.ndarray, ...]:
+        """View the CSR snapshot as NumPy arrays"""
+        return self._as_arrays(compiled, end)
+
+    def _run_iteration(
+        self,
+        arrays: Tuple[np.ndarray, ...],
+        pheromone: np.ndarray,
+        start: int,
+        end: int,
+        deadline: Optional[float] = None
+    ) -> List[Tuple[List[int], List[int], float]]:
+        """Move all ants in lockstep"""
+        return self._construct_paths(arrays, pheromone, start, end, deadline)
+
+    def _as_arrays(self, compiled: CompiledGraph, end: int) -> Tuple[np.ndarray, ...]:
+        """View the CSR arrays as NumPy arrays and derive per-request tables"""
+        offsets = np.frombuffer(compiled.offsets, dtype=compiled.offsets.typecode)
+        targets = np.frombuffer(compiled.targets, dtype=compiled.targets.typecode)
+        weights = np.frombuffer(compiled.weights, dtype=compiled.weights.typecode)
+
+        open_mask = np.frombuffer(compiled.blocked, dtype=np.uint8) == 0
+        if compiled.extra_blocked:
+            open_mask[np.fromiter(compiled.extra_blocked, dtype=np.int64)] = False
+
+        heuristic = self._goal_directed_heuristic(compiled, end, weights, targets)
+        if heuristic is None:
+            heuristic = np.frombuffer(compiled.heuristic(self.beta), dtype=np.float64)
+
+        degrees = offsets[1:] - offsets[:-1]
+        candidate_mask = self._candidate_mask(offsets, degrees, weights, open_mask)
+        rows, open_rows, preferred_rows = self._padded_rows(
+            offsets, degrees, open_mask, candidate_mask
+        )
+        return (
+            offsets, degrees, targets.astype(np.int64), weights, heuristic,
+            open_mask, candidate_mask, rows, open_rows, preferred_rows
+        )
+
+    def _padded_rows(
+        self,
+        offsets: np.ndarray,
+        degrees: np.ndarray,
+        open_mask: np.ndarray,
+        candidate_mask: np.ndarray
+    ) -> Tuple[Optional[np.ndarray], ...]:
+        """
+        Every node's slots as one padded row, with their open and preferred masks
+
+        A step then gathers the rows of all ants with one index instead of
+        rebuilding them from the offsets. Skipped (None) when a few
+        high-degree nodes would make the table larger than max_visited_cells.
+        """
+        width = int(degrees.max()) if degrees.size else 0
+        if width == 0 or degrees.size * width > self.max_visited_cells:
+            return None, None, None
+        columns = np.arange(width)
+        in_row = columns < degrees[:, None]
+        rows = np.where(in_row, offsets[:-1, None] + columns, 0)
+        open_rows = in_row & open_mask[rows]
+        return rows, open_rows, open_rows & candidate_mask[rows]
+
+    def _goal_directed_heuristic(
+        self,
+        compiled: CompiledGraph,
+        end: int,
+        weights: np.ndarray,
+        targets: np.ndarray
+    ) -> Optional[np.ndarray]:
+        """Per-slot (1 / (weight + landmark bound)) ** beta, as GoalDirectedHeuristic"""
+        index = self.landmarks.get(compiled) if self.landmarks is not None else None
+        if index is None or not index.landmarks:
+            return None
+        forward = np.stack([np.frombuffer(table, dtype=np.float64) for table in index.forward])
+        backward = np.stack([np.frombuffer(table, dtype=np.float64) for table in index.backward])
+        with np.errstate(invalid="ignore"):
+            # Skip landmark terms where the subtrahend is unreachable
+            ahead = np.where(np.isinf(forward), -np.inf, forward[:, end:end + 1] - forward)
+            behind = np.where(
+                np.isinf(backward[:, end:end + 1]), -np.inf, backward - backward[:, end:end + 1]
+            )
+        bounds = np.maximum(np.maximum(ahead.max(axis=0), behind.max(axis=0)), 0.0)
+        estimate = np.maximum(weights + bounds[targets], MIN_HEURISTIC_WEIGHT)
+        return (1.0 / estimate) ** self.beta
+
+    def _candidate_mask(
+        self,
+        offsets: np.ndarray,
+        degrees: np.ndarray,
+        weights: np.ndarray,
+        open_mask: np.ndarray
+    ) -> np.ndarray:
+        """Mark the slots in their node's candidate list, as CompiledGraph.candidate_slots"""
+        size = self.candidate_list_size
+        if size <= 0 or degrees.size == 0 or degrees.max() <= size:
+            return open_mask
+        # Rank open slots by weight within their node; blocked slots sort last
+        sources = np.repeat(np.arange(degrees.size), degrees)
+        order = np.lexsort((weights, ~open_mask, sources))
+        rank = np.empty_like(order)
+        rank[order] = np.arange(order.size) - offsets[sources[order]]
+        return open_mask & (rank < size)
+
+    def _construct_paths(
+        self,
+        arrays: Tuple[np.ndarray, ...],
+        pheromone: np.ndarray,
+        start: int,
+        end: int,
+        deadline: Optional[float] = None
+    ) -> List[Tuple[List[int], List[int], float]]:
+        """Construct the paths of all ants of one iteration in lockstep"""
+        (offsets, degrees, targets, weights, heuristic,
+         open_mask, candidate_mask, rows, open_rows, preferred_rows) = arrays
+        n_ants = self.n_ants
+        max_steps = self.max_steps
+
+        # Move weights of every slot for this iteration
+        trail = pheromone if self.alpha == 1.0 else pheromone ** self.alpha
+        scores = trail * heuristic
+
+        nodes = np.empty((n_ants, max_steps + 1), dtype=np.int64)
+        slots = np.empty((n_ants, max_steps), dtype=np.int64)
+        nodes[:, 0] = start
+        lengths = np.zeros(n_ants, dtype=np.int64)
+        distances = np.zeros(n_ants)
+        n_nodes = degrees.size
+        visited = None
+        if n_ants * n_nodes <= self.max_visited_cells:
+            visited = np.zeros((n_ants, n_nodes), dtype=bool)
+            visited[:, start] = True
+
+        # State of the ants still walking only, compacted as ants drop out
+        ants = np.arange(n_ants)
+        current = np.full(n_ants, start, dtype=np.int64)
+        walked = np.zeros(n_ants)
+        arrived_ants = []
+        if start == end:
+            ants = ants[:0]
+            arrived_ants.append(np.arange(n_ants))
+
+        for step in range(max_steps):
+            if ants.size == 0:
+                break
+            # Past the deadline, ants still on their way are abandoned
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+
+            if rows is not None:
+                candidate_slots = rows[current]
+                valid = open_rows[current]
+                preferred = preferred_rows[current]
+            else:
+                candidate_slots, valid, preferred = self._gather_rows(
+                    offsets, degrees, open_mask, candidate_mask, current
+                )
+            width = candidate_slots.shape[1]
+
+            # Prefer unvisited candidate-list slots, then unvisited neighbors,
+            # then any neighbor: rank each slot and keep the best rank per ant
+            candidate_nodes = targets[candidate_slots]
+            if visited is not None:
+                unseen = ~visited[ants[:, None], candidate_nodes]
+            else:
+                unseen = ~(candidate_nodes[:, :, None] == nodes[ants, None, :step + 1]).any(axis=2)
+            rank = valid.view(np.int8) + (valid & unseen).view(np.int8)
+            rank += (preferred & unseen).view(np.int8)
+            best = rank.max(axis=1)
+
+            stuck = best == 0
+            if stuck.any():
+                moving = ~stuck
+                ants, current, walked = ants[moving], current[moving], walked[moving]
+                candidate_slots, candidate_nodes = candidate_slots[moving], candidate_nodes[moving]
+                rank, best = rank[moving], best[moving]
+                if ants.size == 0:
+                    break
+
+            # One vectorized roulette-wheel draw for all ants
+            candidates = rank == best[:, None]
+            cumulative = np.where(candidates, scores[candidate_slots], 0.0).cumsum(axis=1)
+            totals = cumulative[:, -1]
+            if not (totals.min() > 0 and np.isfinite(totals.sum())):
+                degenerate = ~((totals > 0) & np.isfinite(totals))
+                cumulative[degenerate] = candidates[degenerate].cumsum(axis=1)
+                totals = cumulative[:, -1]
+            draws = self._rng.random(ants.size) * totals
+            choice = np.minimum((cumulative <= draws[:, None]).sum(axis=1), width - 1)
+
+            position = np.arange(ants.size) * width + choice
+            chosen = candidate_slots.ravel()[position]
+            current = candidate_nodes.ravel()[position]
+            walked += weights[chosen]
+            slots[ants, step] = chosen
+            nodes[ants, step + 1] = current
+            if visited is not None:
+                visited[ants, current] = True
+
+            arrived = current == end
+            if arrived.any():
+                done = ants[arrived]
+                lengths[done] = step + 1
+                distances[done] = walked[arrived]
+                arrived_ants.append(done)
+                walking = ~arrived
+                ants, current, walked = ants[walking], current[walking], walked[walking]
+
+        if not arrived_ants:
+            return []
+        finished = np.sort(np.concatenate(arrived_ants))
+        return [
+            (path_nodes[:length + 1], path_slots[:length], distance)
+            for path_nodes, path_slots, length, distance in zip(
+                nodes[finished].tolist(),
+                slots[finished].tolist(),
+                lengths[finished].tolist(),
+                distances[finished].tolist()
+            )
+        ]
+
+    def _gather_rows(
+        self,
+        offsets: np.ndarray,
+        degrees: np.ndarray,
+        open_mask: np.ndarray,
+        candidate_mask: np.ndarray,
+        current: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Padded slot rows of the current nodes, built from the offsets"""
+        degree = degrees[current]
+        columns = np.arange(max(int(degree.max()), 1))
+        valid = columns < degree[:, None]
+        candidate_slots = np.where(valid, offsets[current][:, None] + columns, 0)
+        valid &= open_mask[candidate_slots]
+        return candidate_slots, valid, valid & candidate_mask[candidate_slots]
+
+    def _update_pheromone(
+        self,
+        pheromone: np.ndarray,
+        paths: List[Tuple[List[int], List[int], float]]
+    ) -> None:
+        """Update pheromone levels"""
+        pheromone *= (1 - self.evaporation)
+        deposits = [
+            (slots, 1.0 / distance) for _, slots, distance in paths
+            if slots and distance < float("inf")
+        ]
+        if deposits:
+            pheromone += np.bincount(
+                np.concatenate([slots for slots, _ in deposits]),
+                weights=np.repeat(
+                    [amount for _, amount in deposits], [len(slots) for slots, _ in deposits]
+                ),
+                minlength=pheromone.size
+            )
@@ -0,0 +1,6 @@
+"""
+Caching __init__
+"""
+from .pheromone_cache import PheromoneCache, WarmStart
+
+__all__ = ['PheromoneCache', 'WarmStart']
@@ -0,0 +1,163 @@
+"""
+Pheromone Cache
+Bounded LRU cache of pheromone tables used to warm-start ACO runs
+"""
+import threading
+import time
+from array import array
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Optional, Sequence, Tuple
+
+# (graph version, start index, end index, blocked edge slots)
+CacheKey = Tuple[int, int, int, FrozenSet[int]]
+
+
+@dataclass(frozen=True)
+class _Entry:
+    """Sparse pheromone table: one level for most slots, the rest listed"""
+    size: int
+    background: float
+    levels: Dict[int, float]
+    stored_at: float
+
+
+@dataclass(frozen=True)
+class WarmStart:
+    """
+    Pheromone table to seed a run with and how much of it to keep
+
+    Slots missing from levels are at background; the dictionary is shared
+    and must not be modified.
+    """
+    size: int
+    background: float
+    levels: Dict[int, float]
+    retention: float
+    match: str  # 'exact' or 'nearby'
+
+
+def _sparse_levels(table: Sequence[float]) -> Tuple[float, Dict[int, float]]:
+    """Most common level of a dense table and the slots that differ from it"""
+    if not table:
+        return 0.0, {}
+    background = Counter(table).most_common(1)[0][0]
+    return background, {
+        slot: level for slot, level in enumerate(table) if level != background
+    }
+
+
+class PheromoneCache:
+    """
+    Thread-safe LRU cache of final pheromone tables
+
+    Tables are keyed by graph version, start, end and blocked slots, so the
+    slot layout always matches the compiled graph they are applied to. A
+    lookup falls back to the most recent table of the same graph version
+    for the same route with other blocked edges, then for the same
+    destination or origin. Retention halves every `half_life_s` seconds and
+    nearby matches are further scaled by `nearby_retention`.
+
+    Tables are kept sparse, as the level evaporation left on the slots no
+    ant walked plus the levels of the walked ones, so seeding a run costs
+    O(walked slots) rather than O(edges).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 64,
+        half_life_s: float = 300.0,
+        nearby_retention: float = 0.5
+    ):
+        self._max_entries = max_entries
+        self._half_life_s = half_life_s
+        self._nearby_retention = nearby_retention
+        self._entries: 'OrderedDict[CacheKey, _Entry]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._nearby_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def lookup(self, key: CacheKey) -> Optional[WarmStart]:
+        """Find the best table to seed a run for the given key"""
+        version, start, end, _ = key
+        with self._lock:
+            entry = self._entries.get(key)
+            match = 'exact'
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+            else:
+                match = 'nearby'
+                entry = self._find_nearby(version, start, end)
+                if entry is None:
+                    self._misses += 1
+                    return None
+                self._nearby_hits += 1
+
+        retention = self._decay(time.monotonic() - entry.stored_at)
+        if match == 'nearby':
+            retention *= self._nearby_retention
+        return WarmStart(
+            size=entry.size,
+            background=entry.background,
+            levels=entry.levels,
+            retention=retention,
+            match=match
+        )
+
+    def store(self, key: CacheKey, pheromone: Sequence[float]) -> None:
+        """Remember the final pheromone table of a run"""
+        if hasattr(pheromone, 'sparse'):
+            # PheromoneStore: only the slots deposited on
+            background, levels = pheromone.sparse()
+        else:
+            table = array('d')
+            if hasattr(pheromone, 'tobytes'):
+                # array('d'), float64 NumPy arrays and 'd' memoryviews
+                table.frombytes(pheromone.tobytes())
+            else:
+                table.extend(pheromone)
+            background, levels = _sparse_levels(table)
+        entry = _Entry(len(pheromone), background, levels, time.monotonic())
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit rate, evictions and size of the cache"""
+        with self._lock:
+            lookups = self._hits + self._nearby_hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self._max_entries,
+                "hits": self._hits,
+                "nearby_hits": self._nearby_hits,
+                "misses": self._misses,
+                "hit_rate": (self._hits + self._nearby_hits) / lookups if lookups else 0.0,
+                "evictions": self._evictions
+            }
+
+    def _find_nearby(self, version: int, start: int, end: int) -> Optional[_Entry]:
+        """Most recent entry of the same version sharing the route, then an endpoint"""
+        same_end = same_start = None
+        for (e_version, e_start, e_end, _), entry in reversed(self._entries.items()):
+            if e_version != version:
+                continue
+            if e_start == start and e_end == end:
+                return entry
+            if e_end == end and same_end is None:
+                same_end = entry
+            if e_start == start and same_start is None:
+                same_start = entry
+        return same_end or same_start
+
+    def _decay(self, age_s: float) -> float:
+        """Share of a cached trail that survives after age_s seconds"""
+        if self._half_life_s <= 0:
+            return 1.0
+        return 0.5 ** (age_s / self._half_life_s)
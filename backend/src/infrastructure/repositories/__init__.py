@@ -2,5 +2,7 @@
 Repositories __init__
 """
 from .in_memory_graph_repository import InMemoryGraphRepository
+from .in_memory_job_repository import InMemoryJobRepository
+from .in_memory_result_repository import InMemoryResultRepository
 
-__all__ = ['InMemoryGraphRepository']
+__all__ = ['InMemoryGraphRepository', 'InMemoryJobRepository', 'InMemoryResultRepository']
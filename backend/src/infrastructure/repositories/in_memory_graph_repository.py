@@ -48,11 +48,7 @@ class InMemoryGraphRepository(IGraphRepository):
 
     def remove_edge(self, from_node: str, to_node: str) -> None:
         """Remove an edge from the graph"""
-        self._graph.edges = [
-            edge for edge in self._graph.edges
-            if not ((edge.from_node == from_node and edge.to_node == to_node) or
-                   (edge.from_node == to_node and edge.to_node == from_node))
-        ]
+        self._graph.remove_edge(from_node, to_node)
 
     def _initialize_default_graph(self) -> Graph:
         """Initialize graph with default mountain trekking data"""
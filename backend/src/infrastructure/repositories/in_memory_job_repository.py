@@ -0,0 +1,48 @@
+"""
+In-Memory Job Repository Implementation
+SOLID - Dependency Inversion: Implements IJobRepository interface
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+from ...domain.interfaces import IJobRepository
+from ...domain.entities import OptimizationJob
+
+
+class InMemoryJobRepository(IJobRepository):
+    """
+    Bounded in-memory store of optimization jobs
+    Once max_entries is exceeded the oldest finished jobs are dropped;
+    queued and running jobs are always kept
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self._max_entries = max_entries
+        self._jobs: 'OrderedDict[str, OptimizationJob]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._evictions = 0
+
+    def save(self, job: OptimizationJob) -> None:
+        """Store a job, replacing the earlier state with the same ID"""
+        with self._lock:
+            self._jobs[job.job_id] = job
+            excess = len(self._jobs) - self._max_entries
+            if excess > 0:
+                for job_id in [job_id for job_id, stored in self._jobs.items()
+                               if stored.finished][:excess]:
+                    del self._jobs[job_id]
+                    self._evictions += 1
+
+    def get(self, job_id: str) -> Optional[OptimizationJob]:
+        """Get a job, or None if unknown or expired"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def stats(self) -> Dict[str, Any]:
+        """Store counters for /metrics"""
+        with self._lock:
+            return {
+                "entries": len(self._jobs),
+                "max_entries": self._max_entries,
+                "evictions": self._evictions
+            }
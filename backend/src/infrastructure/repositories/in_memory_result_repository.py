@@ -0,0 +1,50 @@
+"""
+In-Memory Result Repository Implementation
+SOLID - Dependency Inversion: Implements IResultRepository interface
+"""
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+from ...domain.interfaces import IResultRepository
+from ...domain.entities import RouteRecord
+
+
+class InMemoryResultRepository(IResultRepository):
+    """
+    Bounded in-memory store of computed routes
+    The least recently used route is dropped once max_entries is exceeded
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self._max_entries = max_entries
+        self._records: 'OrderedDict[str, RouteRecord]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._evictions = 0
+
+    def save(self, record: RouteRecord) -> str:
+        """Store a route and return its ID"""
+        result_id = uuid.uuid4().hex
+        with self._lock:
+            self._records[result_id] = record
+            while len(self._records) > self._max_entries:
+                self._records.popitem(last=False)
+                self._evictions += 1
+        return result_id
+
+    def get(self, result_id: str) -> Optional[RouteRecord]:
+        """Get a stored route, or None if unknown or expired"""
+        with self._lock:
+            record = self._records.get(result_id)
+            if record is not None:
+                self._records.move_to_end(result_id)
+            return record
+
+    def stats(self) -> Dict[str, Any]:
+        """Store counters for /metrics"""
+        with self._lock:
+            return {
+                "entries": len(self._records),
+                "max_entries": self._max_entries,
+                "evictions": self._evictions
+            }
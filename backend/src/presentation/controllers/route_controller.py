@@ -2,10 +2,23 @@
 Route Controller
 SOLID - Single Responsibility: Only handles HTTP request/response
 """
+import json
 from flask import jsonify, request, Response
-from typing import Dict, Any
-from ...application.use_cases import FindOptimalPathUseCase, GetGraphUseCase
-from ...domain.entities import Node, Edge
+from typing import Dict, Any, Iterator, Optional, Tuple
+from ...application.use_cases import (
+    BatchFindOptimalPathUseCase,
+    FindOptimalPathUseCase,
+    GetDistanceMatrixUseCase,
+    GetGraphUseCase,
+    GetMetricsUseCase,
+    GetOptimizationJobUseCase,
+    JobQueueFullError,
+    ReoptimizeRouteUseCase,
+    RouteQuery,
+    StreamOptimalPathUseCase,
+    SubmitOptimizationJobUseCase
+)
+from ...domain.entities import Node, Edge, Path, RouteRecord
 from ...domain.interfaces import IGraphRepository
 
 class RouteController:
@@ -18,11 +31,25 @@ class RouteController:
         self,
         find_optimal_path_use_case: FindOptimalPathUseCase,
         get_graph_use_case: GetGraphUseCase,
-        graph_repository: IGraphRepository
+        graph_repository: IGraphRepository,
+        get_metrics_use_case: GetMetricsUseCase = None,
+        batch_find_optimal_path_use_case: BatchFindOptimalPathUseCase = None,
+        get_distance_matrix_use_case: GetDistanceMatrixUseCase = None,
+        reoptimize_route_use_case: ReoptimizeRouteUseCase = None,
+        stream_optimal_path_use_case: StreamOptimalPathUseCase = None,
+        submit_optimization_job_use_case: SubmitOptimizationJobUseCase = None,
+        get_optimization_job_use_case: GetOptimizationJobUseCase = None
     ):
         self._find_optimal_path_use_case = find_optimal_path_use_case
         self._get_graph_use_case = get_graph_use_case
         self._graph_repository = graph_repository
+        self._get_metrics_use_case = get_metrics_use_case
+        self._batch_find_optimal_path_use_case = batch_find_optimal_path_use_case
+        self._get_distance_matrix_use_case = get_distance_matrix_use_case
+        self._reoptimize_route_use_case = reoptimize_route_use_case
+        self._stream_optimal_path_use_case = stream_optimal_path_use_case
+        self._submit_optimization_job_use_case = submit_optimization_job_use_case
+        self._get_optimization_job_use_case = get_optimization_job_use_case
 
     def get_graph(self) -> Response:
         """
@@ -44,8 +71,15 @@ class RouteController:
         {
             "start": "A",
             "end": "H",
-            "blocked_edges": [["B", "C"], ["D", "E"]]  // optional
+            "blocked_edges": [["B", "C"], ["D", "E"]],  // optional
+            "deadline_ms": 200,  // optional latency budget
+            "algorithm": "astar",  // optional: "aco", "astar", "dijkstra" or "ch"
+            "history": "full"  // optional: "none", "summary", "paths" or "full"
         }
+
+        "iterations" in the response holds the recorded history, which is
+        empty unless a level is requested or configured. At every level it
+        keeps only the last ACO_HISTORY_LIMIT iterations.
         """
         try:
             # Parse request
@@ -54,41 +88,372 @@ class RouteController:
             if not data:
                 return jsonify({"error": "Request body is required"}), 400
 
-            start_node = data.get("start")
-            end_node = data.get("end")
-            blocked_edges = data.get("blocked_edges", [])
+            arguments, error = self._optimize_arguments(data)
+            if error:
+                return jsonify({"error": error}), 400
 
-            # Validate required fields
-            if not start_node or not end_node:
-                return jsonify({
-                    "error": "Both 'start' and 'end' fields are required"
-                }), 400
+            # Execute use case
+            result = self._find_optimal_path_use_case.execute(**arguments)
+
+            return jsonify(self._with_graph(result.to_dict())), 200
+
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+
+    def optimize_stream(self) -> Response:
+        """
+        POST /optimize/stream
+        Find optimal route, sending every iteration as soon as it is done
+
+        Takes the /optimize request body; "history" defaults to "full".
+        The response is a Server-Sent Events stream, or newline-delimited
+        JSON when the request accepts application/x-ndjson:
+
+            event: iteration
+            data: {"iteration": 1, "best_distance": 12.5, "paths": [...],
+                   "pheromone_levels": {"('A', 'B')": 1.2, ...}}
+
+            event: iteration
+            data: {"iteration": 2, ..., "pheromone_delta":
+                   {"decay": 0.5, "levels": {"('A', 'B')": 2.1}}}
+
+            event: result
+            data: {the /optimize response without "iterations"}
+
+        After the first iteration only "pheromone_delta" is sent: multiply
+        every level by "decay", then apply "levels". A failure after the
+        stream started ends it with an "error" event.
+        """
+        try:
+            if self._stream_optimal_path_use_case is None:
+                return jsonify({"error": "Streaming is not available"}), 404
+
+            data = request.get_json()
+            if not data:
+                return jsonify({"error": "Request body is required"}), 400
+
+            arguments, error = self._optimize_arguments(data)
+            if error:
+                return jsonify({"error": error}), 400
+            arguments["history"] = arguments["history"] or "full"
+
+            events = self._stream_optimal_path_use_case.execute(**arguments)
+
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            return jsonify({"error": f"Internal server error: {str(e)}"}), 500
 
+        ndjson = request.accept_mimetypes.best_match(
+            ["text/event-stream", "application/x-ndjson"]
+        ) == "application/x-ndjson"
+        response = Response(
+            self._format_events(events, ndjson),
+            mimetype="application/x-ndjson" if ndjson else "text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        )
+        # Stops the search when the client goes away
+        response.call_on_close(events.close)
+        return response
+
+    def submit_job(self) -> Response:
+        """
+        POST /jobs
+        Queue a route optimization and return its job at once
+
+        Takes the /optimize request body. Answers 202 with the job, whose
+        state GET /jobs/<job_id> reports, or 429 while the queue is full.
+        """
+        try:
+            if self._submit_optimization_job_use_case is None:
+                return jsonify({"error": "Jobs are not available"}), 404
+
+            data = request.get_json()
+            if not data:
+                return jsonify({"error": "Request body is required"}), 400
+
+            arguments, error = self._optimize_arguments(data)
+            if error:
+                return jsonify({"error": error}), 400
+
+            job = self._submit_optimization_job_use_case.execute(**arguments)
+            response = jsonify(job.to_dict())
+            response.headers["Location"] = f"/jobs/{job.job_id}"
+            return response, 202
+
+        except JobQueueFullError as e:
+            response = jsonify({"error": str(e)})
+            response.headers["Retry-After"] = "1"
+            return response, 429
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+
+    def get_job(self, job_id: str) -> Response:
+        """
+        GET /jobs/<job_id>
+        State of a queued optimization
+
+        "status" is "queued", "running", "done" or "failed"; "result" has
+        the /optimize response once done and "error" the reason a job
+        failed.
+        """
+        try:
+            if self._get_optimization_job_use_case is None:
+                return jsonify({"error": "Jobs are not available"}), 404
+
+            job = self._get_optimization_job_use_case.execute(job_id)
+            if job is None:
+                return jsonify({"error": f"Unknown job '{job_id}'"}), 404
+
+            response_data = job.to_dict()
+            if response_data["result"] is not None:
+                response_data["result"] = self._with_graph(response_data["result"])
+            return jsonify(response_data), 200
+
+        except Exception as e:
+            return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+
+    def _format_events(
+        self,
+        events: Iterator[Tuple[str, Dict[str, Any]]],
+        ndjson: bool
+    ) -> Iterator[str]:
+        """Serialize stream events as SSE messages or NDJSON lines"""
+        for name, payload in events:
+            if name == "result":
+                payload = self._with_graph(payload)
+            if ndjson:
+                yield json.dumps({"event": name, "data": payload}) + "\n"
+            else:
+                yield f"event: {name}\ndata: {json.dumps(payload)}\n\n"
+
+    def _optimize_arguments(
+        self,
+        data: Dict[str, Any]
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Use case arguments of an /optimize request body, or an error message"""
+        start_node = data.get("start")
+        end_node = data.get("end")
+        blocked_edges = data.get("blocked_edges", [])
+        deadline_ms = data.get("deadline_ms")
+        algorithm = data.get("algorithm")
+        history = data.get("history")
+
+        # Validate required fields
+        if not start_node or not end_node:
+            return None, "Both 'start' and 'end' fields are required"
+
+        error = self._option_error(deadline_ms, algorithm)
+        if error:
+            return None, error
+        if history is not None and not isinstance(history, str):
+            return None, "'history' must be a string"
+
+        return {
+            "start_node_id": start_node,
+            "end_node_id": end_node,
             # Convert blocked edges to tuples
-            blocked_edges_tuples = [tuple(edge) for edge in blocked_edges] if blocked_edges else None
+            "blocked_edges": [tuple(edge) for edge in blocked_edges] if blocked_edges else None,
+            "deadline_ms": deadline_ms,
+            "algorithm": algorithm,
+            "history": history
+        }, None
 
-            # Execute use case
-            result = self._find_optimal_path_use_case.execute(
-                start_node_id=start_node,
-                end_node_id=end_node,
-                blocked_edges=blocked_edges_tuples
+    def reoptimize_route(self) -> Response:
+        """
+        POST /reoptimize
+        Update an earlier route after more edges are blocked
+
+        Request body:
+        {
+            "result_id": "3f2c...",  // from an earlier response, or:
+            "previous": {"start": "A", "end": "H",
+                         "best_path": ["A", "B", "E", "H"],
+                         "blocked_edges": []},
+            "blocked_edges": [["E", "H"]],  // newly blocked edges
+            "deadline_ms": 50,  // optional budget of the repair
+            "algorithm": "aco"  // optional, defaults to the earlier one
+        }
+
+        The response has the /optimize format; "reoptimized" tells whether
+        the route was unchanged, repaired or recomputed.
+        """
+        try:
+            if self._reoptimize_route_use_case is None:
+                return jsonify({"error": "Re-optimization is not available"}), 404
+
+            data = request.get_json()
+            if not data:
+                return jsonify({"error": "Request body is required"}), 400
+
+            result_id = data.get("result_id")
+            previous = data.get("previous")
+            if result_id is not None and not isinstance(result_id, str):
+                return jsonify({"error": "'result_id' must be a string"}), 400
+            if previous is not None and not isinstance(previous, dict):
+                return jsonify({"error": "'previous' must be an object"}), 400
+
+            deadline_ms = data.get("deadline_ms")
+            algorithm = data.get("algorithm")
+            error = self._option_error(deadline_ms, algorithm)
+            if error:
+                return jsonify({"error": error}), 400
+
+            record = None
+            if previous is not None:
+                if not previous.get("start") or not previous.get("end") or not previous.get("best_path"):
+                    return jsonify({
+                        "error": "'previous' needs 'start', 'end' and 'best_path'"
+                    }), 400
+                record = RouteRecord(
+                    start=previous["start"],
+                    end=previous["end"],
+                    blocked_edges=RouteRecord.pairs(previous.get("blocked_edges") or ()),
+                    path=Path(
+                        nodes=list(previous["best_path"]),
+                        distance=float(previous.get("distance") or 0.0)
+                    ),
+                    algorithm=previous.get("algorithm") or "aco"
+                )
+
+            blocked_edges = data.get("blocked_edges", [])
+            result = self._reoptimize_route_use_case.execute(
+                result_id=result_id,
+                previous=record,
+                blocked_edges=[tuple(edge) for edge in blocked_edges] if blocked_edges else None,
+                deadline_ms=deadline_ms,
+                algorithm=algorithm
             )
+            return jsonify(self._with_graph(result.to_dict())), 200
 
-            # Get graph for response
-            graph_data = self._get_graph_use_case.execute()
+        except (TypeError, ValueError) as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            return jsonify({"error": f"Internal server error: {str(e)}"}), 500
 
-            # Build response
-            response_data = result.to_dict()
-            response_data["graph_edges"] = graph_data["edges"]
-            response_data["node_positions"] = graph_data["nodes"]
+    def _with_graph(self, response_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the graph edges and node positions the frontend draws"""
+        graph_data = self._get_graph_use_case.execute()
+        response_data["graph_edges"] = graph_data["edges"]
+        response_data["node_positions"] = graph_data["nodes"]
+        return response_data
 
-            return jsonify(response_data), 200
+    def optimize_batch(self) -> Response:
+        """
+        POST /optimize/batch
+        Find optimal routes for many origin-destination pairs
 
-        except ValueError as e:
+        Request body:
+        {
+            "queries": [
+                {"start": "A", "end": "H", "blocked_edges": [["B", "C"]]},
+                {"start": "C", "end": "G", "algorithm": "dijkstra"}
+            ],
+            "deadline_ms": 100,  // optional default for every query
+            "algorithm": "astar"  // optional default for every query
+        }
+
+        Results come back in query order without iteration history or
+        graph data; invalid queries get an "error" entry.
+        """
+        try:
+            if self._batch_find_optimal_path_use_case is None:
+                return jsonify({"error": "Batch optimization is not available"}), 404
+
+            data = request.get_json()
+            if not data:
+                return jsonify({"error": "Request body is required"}), 400
+
+            queries = data.get("queries")
+            if not isinstance(queries, list) or not all(
+                isinstance(query, dict) for query in queries
+            ):
+                return jsonify({"error": "'queries' must be a list of objects"}), 400
+
+            route_queries = []
+            for query in queries:
+                deadline_ms = query.get("deadline_ms", data.get("deadline_ms"))
+                algorithm = query.get("algorithm", data.get("algorithm"))
+                error = self._option_error(deadline_ms, algorithm)
+                if error:
+                    return jsonify({"error": error}), 400
+                route_queries.append(RouteQuery(
+                    start=query.get("start"),
+                    end=query.get("end"),
+                    blocked_edges=tuple(tuple(edge) for edge in query.get("blocked_edges") or ()),
+                    deadline_ms=deadline_ms,
+                    algorithm=algorithm
+                ))
+
+            result = self._batch_find_optimal_path_use_case.execute(route_queries)
+            return jsonify(result), 200
+
+        except (TypeError, ValueError) as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+
+    def distance_matrix(self) -> Response:
+        """
+        POST /matrix
+        Shortest distances from every source to every target
+
+        Request body:
+        {
+            "sources": ["A", "B"],
+            "targets": ["G", "H"],
+            "blocked_edges": [["E", "H"]],  // optional
+            "include_paths": false  // optional
+        }
+
+        "distances" is row-major: the distance from sources[i] to
+        targets[j] is at index i * len(targets) + j, null if unreachable.
+        """
+        try:
+            if self._get_distance_matrix_use_case is None:
+                return jsonify({"error": "Distance matrix is not available"}), 404
+
+            data = request.get_json()
+            if not data:
+                return jsonify({"error": "Request body is required"}), 400
+
+            sources = data.get("sources")
+            targets = data.get("targets")
+            for name, node_ids in (("sources", sources), ("targets", targets)):
+                if not isinstance(node_ids, list) or not all(
+                    isinstance(node_id, str) for node_id in node_ids
+                ):
+                    return jsonify({"error": f"'{name}' must be a list of node IDs"}), 400
+
+            blocked_edges = data.get("blocked_edges", [])
+            matrix = self._get_distance_matrix_use_case.execute(
+                sources=sources,
+                targets=targets,
+                blocked_edges=[tuple(edge) for edge in blocked_edges] if blocked_edges else None,
+                include_paths=bool(data.get("include_paths", False))
+            )
+            return jsonify(matrix.to_dict()), 200
+
+        except (TypeError, ValueError) as e:
             return jsonify({"error": str(e)}), 400
         except Exception as e:
             return jsonify({"error": f"Internal server error: {str(e)}"}), 500
 
+    def _option_error(self, deadline_ms: Any, algorithm: Any) -> Optional[str]:
+        """Validate the optional query settings; return an error message"""
+        if deadline_ms is not None:
+            if (isinstance(deadline_ms, bool)
+                    or not isinstance(deadline_ms, (int, float))
+                    or deadline_ms <= 0):
+                return "'deadline_ms' must be a positive number"
+        if algorithm is not None and not isinstance(algorithm, str):
+            return "'algorithm' must be a string"
+        return None
+
     def health_check(self) -> Response:
         """
         GET /health
@@ -99,6 +464,18 @@ class RouteController:
             "service": "ACO Route Optimization API"
         }), 200
 
+    def get_metrics(self) -> Response:
+        """
+        GET /metrics
+        Runtime statistics such as pheromone cache hit rate and evictions
+        """
+        try:
+            if self._get_metrics_use_case is None:
+                return jsonify({}), 200
+            return jsonify(self._get_metrics_use_case.execute()), 200
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
     def add_node(self) -> Response:
         """
         POST /nodes
@@ -30,6 +30,40 @@ def register_routes(app: Flask, controller: RouteController) -> None:
     def optimize():
         return controller.optimize_route()
 
+    # Optimize route, streaming every iteration
+    @app.route('/optimize/stream', methods=['POST'])
+    def optimize_stream():
+        return controller.optimize_stream()
+
+    # Update an earlier route after more edges are blocked
+    @app.route('/reoptimize', methods=['POST'])
+    def reoptimize():
+        return controller.reoptimize_route()
+
+    # Optimize many routes at once
+    @app.route('/optimize/batch', methods=['POST'])
+    def optimize_batch():
+        return controller.optimize_batch()
+
+    # Background optimization jobs
+    @app.route('/jobs', methods=['POST'])
+    def submit_job():
+        return controller.submit_job()
+
+    @app.route('/jobs/<job_id>', methods=['GET'])
+    def get_job(job_id):
+        return controller.get_job(job_id)
+
+    # Many-to-many distance matrix
+    @app.route('/matrix', methods=['POST'])
+    def distance_matrix():
+        return controller.distance_matrix()
+
+    # Runtime statistics
+    @app.route('/metrics', methods=['GET'])
+    def metrics():
+        return controller.get_metrics()
+
     # Node management
     @app.route('/nodes', methods=['POST'])
     def add_node():
@@ -0,0 +1,124 @@
+"""
+Shared test fixtures
+Run from the backend directory: python -m pytest
+"""
+import heapq
+import os
+import random
+import sys
+from typing import Dict, Iterable, Tuple
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.app import create_app  # noqa: E402
+from src.domain.entities import Edge, Graph, Node  # noqa: E402
+from src.infrastructure.repositories import InMemoryGraphRepository  # noqa: E402
+
+
+def make_grid(size: int, seed: int = 1, directed_gaps: int = 0) -> Graph:
+    """
+    Grid graph with random edge weights in both directions
+
+    Node IDs are "row_col". directed_gaps removes that many random edges
+    in one direction only, so that some pairs become one-way.
+    """
+    rng = random.Random(seed)
+    graph = Graph()
+    for row in range(size):
+        for col in range(size):
+            graph.add_node(Node(f"{row}_{col}", 21 + row * 0.001, 105 + col * 0.001, ""))
+    edges = []
+    for row in range(size):
+        for col in range(size):
+            for d_row, d_col in ((0, 1), (1, 0), (0, -1), (-1, 0)):
+                other_row, other_col = row + d_row, col + d_col
+                if 0 <= other_row < size and 0 <= other_col < size:
+                    edges.append(Edge(
+                        f"{row}_{col}", f"{other_row}_{other_col}",
+                        0.12 + rng.random() * 0.1
+                    ))
+    gaps = set(rng.sample(range(len(edges)), directed_gaps))
+    for i, edge in enumerate(edges):
+        if i not in gaps:
+            graph.add_edge(edge)
+    return graph
+
+
+def make_random_graph(n_nodes: int, n_edges: int, seed: int = 1) -> Graph:
+    """
+    Sparse random directed graph, usually not strongly connected
+
+    Node IDs are "n0", "n1", ...; duplicate pairs may occur.
+    """
+    rng = random.Random(seed)
+    graph = Graph()
+    for index in range(n_nodes):
+        graph.add_node(Node(f"n{index}", 21 + rng.random() * 0.01, 105 + rng.random() * 0.01, ""))
+    for _ in range(n_edges):
+        source, target = rng.sample(range(n_nodes), 2)
+        graph.add_edge(Edge(f"n{source}", f"n{target}", 0.5 + rng.random() * 2))
+    return graph
+
+
+def reference_distances(
+    graph: Graph,
+    source: str,
+    blocked: Iterable[Tuple[str, str]] = ()
+) -> Dict[str, float]:
+    """
+    Textbook Dijkstra over graph.edges: distances of the reachable nodes
+
+    Blocked edges and, in both directions, the blocked pairs are skipped.
+    """
+    blocked_pairs = set()
+    for from_node, to_node in blocked:
+        blocked_pairs.update({(from_node, to_node), (to_node, from_node)})
+    adjacency: Dict[str, list] = {}
+    for edge in graph.edges:
+        if not edge.is_blocked and (edge.from_node, edge.to_node) not in blocked_pairs:
+            adjacency.setdefault(edge.from_node, []).append((edge.to_node, edge.weight))
+    distances = {source: 0.0}
+    heap = [(0.0, source)]
+    while heap:
+        distance, node = heapq.heappop(heap)
+        if distance > distances[node]:
+            continue
+        for target, weight in adjacency.get(node, ()):
+            if distance + weight < distances.get(target, float("inf")):
+                distances[target] = distance + weight
+                heapq.heappush(heap, (distance + weight, target))
+    return distances
+
+
+def path_length(graph: Graph, nodes, blocked: Iterable[Tuple[str, str]] = ()) -> float:
+    """Length of a node path over its cheapest open edges; fails on a missing one"""
+    blocked_pairs = set()
+    for from_node, to_node in blocked:
+        blocked_pairs.update({(from_node, to_node), (to_node, from_node)})
+    total = 0.0
+    for from_node, to_node in zip(nodes, nodes[1:]):
+        assert (from_node, to_node) not in blocked_pairs
+        total += min(
+            edge.weight for edge in graph.get_out_edges(from_node)
+            if edge.to_node == to_node and not edge.is_blocked
+        )
+    return total
+
+
+@pytest.fixture
+def sample_graph() -> Graph:
+    """The default A-H demo graph"""
+    return InMemoryGraphRepository().get_graph()
+
+
+@pytest.fixture
+def grid() -> Graph:
+    """8x8 grid with a few one-way gaps"""
+    return make_grid(8, seed=3, directed_gaps=6)
+
+
+@pytest.fixture
+def client():
+    """Test client of an app with its own container and default graph"""
+    return create_app('testing').test_client()
@@ -0,0 +1,61 @@
+"""
+POST /optimize/batch
+"""
+import pytest
+
+
+def test_answers_every_query_in_order(client):
+    queries = [
+        {"start": "A", "end": "H", "algorithm": "dijkstra"},
+        {"start": "A", "end": "H", "algorithm": "dijkstra", "blocked_edges": [["E", "H"]]},
+        {"start": "H", "end": "A"},
+        {"start": "Z", "end": "A"},
+        {"start": "A", "end": "H"},
+    ]
+    response = client.post('/optimize/batch', json={"queries": queries})
+    assert response.status_code == 200
+    body = response.get_json()
+    results = body["results"]
+    assert [(entry["start"], entry["end"]) for entry in results] == [
+        (query["start"], query["end"]) for query in queries
+    ]
+    assert body["groups"] == 2
+
+    single = client.post('/optimize', json={"start": "A", "end": "H", "algorithm": "dijkstra"})
+    assert results[0]["best_path"] == single.get_json()["best_path"]
+    assert results[0]["distance"] == pytest.approx(single.get_json()["distance"])
+    assert ("E", "H") not in zip(results[1]["best_path"], results[1]["best_path"][1:])
+    assert results[1]["distance"] > results[0]["distance"]
+    # Failing queries get an error entry instead of failing the batch
+    assert "No route" in results[2]["error"]
+    assert "not found" in results[3]["error"]
+    assert results[4]["best_path"][0] == "A" and results[4]["best_path"][-1] == "H"
+
+
+def test_batch_routes_are_not_stored(client):
+    response = client.post('/optimize/batch', json={
+        "queries": [{"start": "A", "end": "H"}, {"start": "B", "end": "G"}]
+    })
+    assert all(entry["result_id"] is None for entry in response.get_json()["results"])
+    assert "iterations" not in response.get_json()["results"][0]
+    assert client.get('/metrics').get_json()["results"]["entries"] == 0
+
+
+@pytest.mark.parametrize("body, message", [
+    ({"queries": "x"}, "'queries' must be a list of objects"),
+    ({"queries": []}, "At least one query must be provided"),
+    ({"queries": [{"start": "A", "end": "H", "deadline_ms": -1}]},
+     "'deadline_ms' must be a positive number"),
+])
+def test_invalid_batches_are_rejected(client, body, message):
+    response = client.post('/optimize/batch', json=body)
+    assert response.status_code == 400
+    assert response.get_json()["error"] == message
+
+
+def test_too_many_queries_are_rejected(client):
+    response = client.post('/optimize/batch', json={
+        "queries": [{"start": "A", "end": "H"}] * 501
+    })
+    assert response.status_code == 400
+    assert "At most" in response.get_json()["error"]
@@ -0,0 +1,61 @@
+"""
+CompiledGraph: CSR snapshot of a Graph
+"""
+from src.domain.entities import Edge
+
+
+def open_edges(compiled):
+    """(from, to, weight) of every open slot, with node IDs"""
+    node_ids = compiled.node_ids
+    return sorted(
+        (node_ids[source], node_ids[compiled.targets[slot]], compiled.weights[slot])
+        for source in range(compiled.node_count)
+        for slot in compiled.open_slots(source)
+    )
+
+
+def test_snapshot_matches_graph(grid):
+    grid.block_edge("0_0", "0_1")
+    compiled = grid.compile()
+    assert compiled.node_count == len(grid.nodes)
+    assert compiled.edge_count == len(grid.edges)
+    assert open_edges(compiled) == sorted(
+        (edge.from_node, edge.to_node, edge.weight)
+        for edge in grid.edges if not edge.is_blocked
+    )
+    for node_id, node in compiled.node_index.items():
+        assert compiled.node_ids[node] == node_id
+        assert [compiled.node_ids[compiled.targets[slot]]
+                for slot in range(compiled.offsets[node], compiled.offsets[node + 1])] == [
+            edge.to_node for edge in grid.get_out_edges(node_id)
+        ]
+
+
+def test_snapshot_is_cached_per_version(grid):
+    compiled = grid.compile()
+    assert grid.compile() is compiled
+    grid.add_edge(Edge("0_0", "7_7", 9.0))
+    rebuilt = grid.compile()
+    assert rebuilt is not compiled
+    assert rebuilt.version == grid.version
+    assert rebuilt.find_slot(rebuilt.node_index["0_0"], rebuilt.node_index["7_7"]) >= 0
+
+
+def test_with_blocked_shares_arrays_and_hides_slots(grid):
+    compiled = grid.compile()
+    start = compiled.node_index["3_3"]
+    slot = compiled.open_slots(start)[0]
+    view = compiled.with_blocked([slot])
+    assert view.targets is compiled.targets
+    assert view.is_blocked(slot) and not compiled.is_blocked(slot)
+    assert slot not in view.open_slots(start)
+    assert slot in compiled.open_slots(start)
+    assert compiled.with_blocked([]) is compiled
+
+
+def test_heuristic_is_inverse_weight_power(grid):
+    compiled = grid.compile()
+    table = compiled.heuristic(2.0)
+    assert compiled.heuristic(2.0) is table
+    for slot, weight in enumerate(compiled.weights):
+        assert abs(table[slot] - (1.0 / weight) ** 2) < 1e-9
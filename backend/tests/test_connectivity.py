@@ -0,0 +1,65 @@
+"""
+Connectivity index: component labels against reference reachability
+"""
+import pytest
+from conftest import make_random_graph, reference_distances
+from src.domain.entities import Edge, Graph, GraphOverlay, Node
+from src.infrastructure.algorithms import ConnectivityIndex
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_reachability_matches_reference(seed):
+    graph = make_random_graph(40, 60, seed=seed)
+    index = ConnectivityIndex()
+    compiled = graph.compile()
+    labels = index.get(compiled)
+    reachable = {source: reference_distances(graph, source) for source in graph.nodes}
+    strong = {node_id: labels.strong[node] for node_id, node in compiled.node_index.items()}
+    for source in graph.nodes:
+        for target in graph.nodes:
+            assert index.is_reachable(graph, source, target) == (target in reachable[source])
+            # Same strong component exactly when both reach each other
+            assert (strong[source] == strong[target]) == (
+                target in reachable[source] and source in reachable[target]
+            )
+
+
+def test_overlays_get_their_own_labels(grid):
+    index = ConnectivityIndex()
+    # Cut the corner node 0_0 off in both directions
+    blocked = [("0_0", "0_1"), ("0_0", "1_0")]
+    overlay = GraphOverlay.over(grid, blocked)
+    assert index.is_reachable(grid, "0_0", "7_7")
+    assert not index.is_reachable(overlay, "0_0", "7_7")
+    assert not index.is_reachable(overlay, "7_7", "0_0")
+    assert index.is_reachable(overlay, "0_1", "7_7")
+    assert index.is_reachable(GraphOverlay.over(grid, blocked), "1_1", "7_7")
+    assert index.stats()["overlay_hits"] >= 1
+
+
+def test_mutations_rebuild_the_labels():
+    graph = Graph()
+    for node_id in "ABC":
+        graph.add_node(Node(node_id, 0.0, 0.0, node_id))
+    graph.add_edge(Edge("A", "B", 1.0))
+    index = ConnectivityIndex()
+    assert index.is_reachable(graph, "A", "B")
+    assert not index.is_reachable(graph, "A", "C")
+    assert not index.is_reachable(graph, "B", "A")
+    graph.add_edge(Edge("B", "C", 1.0))
+    assert index.is_reachable(graph, "A", "C")
+    graph.block_edge("A", "B")
+    assert not index.is_reachable(graph, "A", "C")
+    assert index.stats()["builds"] == 3
+
+
+def test_long_chains_do_not_recurse():
+    graph = Graph()
+    size = 5000
+    for index in range(size):
+        graph.add_node(Node(f"n{index}", 0.0, 0.0, ""))
+    for index in range(size - 1):
+        graph.add_edge(Edge(f"n{index}", f"n{index + 1}", 1.0))
+    index = ConnectivityIndex()
+    assert index.is_reachable(graph, "n0", f"n{size - 1}")
+    assert not index.is_reachable(graph, f"n{size - 1}", "n0")
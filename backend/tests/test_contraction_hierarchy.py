@@ -0,0 +1,67 @@
+"""
+Contraction hierarchy queries against a reference Dijkstra
+"""
+import pytest
+from conftest import make_random_graph, path_length, reference_distances
+from src.infrastructure.algorithms import (
+    ContractionHierarchyAlgorithm,
+    ContractionHierarchyProvider
+)
+
+
+def ch_algorithm():
+    return ContractionHierarchyAlgorithm(hierarchies=ContractionHierarchyProvider())
+
+
+def test_grid_matches_reference(grid):
+    grid.block_edge("3_3", "3_4")
+    algorithm = ch_algorithm()
+    for source in list(grid.nodes)[::7]:
+        distances = reference_distances(grid, source)
+        for target in list(grid.nodes)[::3]:
+            if target == source:
+                continue
+            path = algorithm.find_optimal_path(grid, source, target)
+            assert path.distance == pytest.approx(distances[target])
+            assert path_length(grid, path.nodes) == pytest.approx(distances[target])
+            assert algorithm.get_run_info()["ch_fallback"] is False
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_random_graphs_match_reference(seed):
+    graph = make_random_graph(50, 120, seed=seed)
+    algorithm = ch_algorithm()
+    for source in list(graph.nodes)[:10]:
+        distances = reference_distances(graph, source)
+        for target in graph.nodes:
+            if target == source:
+                continue
+            if target not in distances:
+                with pytest.raises(ValueError):
+                    algorithm.find_optimal_path(graph, source, target)
+                continue
+            path = algorithm.find_optimal_path(graph, source, target)
+            assert path.distance == pytest.approx(distances[target])
+
+
+def test_blocked_overlays_fall_back_to_exact_search(grid):
+    algorithm = ch_algorithm()
+    unblocked = algorithm.find_optimal_path(grid, "0_0", "7_7")
+    # Block the first edge of the unblocked route so the hierarchy's answer is invalid
+    blocked = [(unblocked.nodes[0], unblocked.nodes[1]), ("4_4", "4_5")]
+    path = algorithm.find_optimal_path(grid, "0_0", "7_7", blocked_edges=blocked)
+    expected = reference_distances(grid, "0_0", blocked)["7_7"]
+    assert path.distance == pytest.approx(expected)
+    assert path_length(grid, path.nodes, blocked) == pytest.approx(expected)
+    assert algorithm.get_run_info()["ch_fallback"] is True
+
+
+def test_hierarchy_is_built_once_per_version(grid):
+    provider = ContractionHierarchyProvider()
+    algorithm = ContractionHierarchyAlgorithm(hierarchies=provider)
+    algorithm.find_optimal_path(grid, "0_0", "7_7")
+    algorithm.find_optimal_path(grid, "7_7", "0_0", blocked_edges=[("1_1", "1_2")])
+    assert provider.stats()["builds"] == 1
+    grid.block_edge("5_5", "5_6")
+    algorithm.find_optimal_path(grid, "0_0", "7_7")
+    assert provider.stats()["builds"] == 2
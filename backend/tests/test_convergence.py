@@ -0,0 +1,79 @@
+"""
+Convergence detection and early termination
+"""
+from src.infrastructure.algorithms import AntColonyOptimization, ConvergenceCriteria
+from src.infrastructure.algorithms.convergence import (
+    MAX_ITERATIONS,
+    SAME_PATH,
+    STAGNATION,
+    ConvergenceMonitor,
+    branching_factor,
+    dominant_path
+)
+
+
+def test_stagnation_counts_iterations_without_improvement():
+    monitor = ConvergenceMonitor(ConvergenceCriteria(stagnation_limit=2), n_ants=10)
+    assert monitor.update(5.0, 1) is None
+    assert monitor.update(4.0, 1) is None
+    assert monitor.update(4.0, 1) is None
+    assert monitor.update(4.0, 1) == STAGNATION
+
+
+def test_stagnation_waits_for_a_first_path():
+    monitor = ConvergenceMonitor(ConvergenceCriteria(stagnation_limit=1), n_ants=10)
+    for _ in range(5):
+        assert monitor.update(float("inf"), 0) is None
+
+
+def test_same_path_share_and_min_iterations():
+    criteria = ConvergenceCriteria(same_path_ratio=0.8, min_iterations=2)
+    monitor = ConvergenceMonitor(criteria, n_ants=10)
+    assert monitor.update(3.0, 9) is None
+    assert monitor.update(3.0, 7) is None
+    assert monitor.update(3.0, 8) == SAME_PATH
+
+
+def test_no_criteria_never_stops():
+    monitor = ConvergenceMonitor(None, n_ants=10)
+    assert not monitor.needs_branching_factor
+    for _ in range(50):
+        assert monitor.update(1.0, 10, branching=1.0) is None
+
+
+def test_dominant_path_counts_slot_sequences():
+    paths = [([0, 1], [3], 1.0), ([0, 1], [3], 1.0), ([0, 2, 1], [4, 7], 2.0)]
+    assert dominant_path(paths) == ((3,), 2)
+    assert dominant_path([]) == ((), 0)
+
+
+def test_branching_factor_counts_strong_edges(grid):
+    compiled = grid.compile()
+    node = compiled.node_index["1_1"]
+    slots = compiled.open_slots(node)
+    pheromone = [1.0] * compiled.edge_count
+    # All levels equal: every open edge is a branch
+    assert branching_factor(compiled, pheromone, [node], 0.05) == len(slots)
+    pheromone[slots[0]] = 100.0
+    assert branching_factor(compiled, pheromone, [node], 0.05) == 1.0
+
+
+def test_run_stops_early_once_converged(grid):
+    aco = AntColonyOptimization(
+        n_ants=10,
+        n_iterations=200,
+        convergence=ConvergenceCriteria(stagnation_limit=5)
+    )
+    path = aco.find_optimal_path(grid, "0_0", "3_3")
+    info = aco.get_run_info()
+    assert path.is_valid()
+    assert info["stop_reason"] == STAGNATION
+    assert info["iterations_used"] < 200
+
+
+def test_run_without_criteria_uses_every_iteration(grid):
+    aco = AntColonyOptimization(n_ants=5, n_iterations=7)
+    aco.find_optimal_path(grid, "0_0", "3_3")
+    info = aco.get_run_info()
+    assert info["stop_reason"] == MAX_ITERATIONS
+    assert info["iterations_used"] == 7
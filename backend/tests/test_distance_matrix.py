@@ -0,0 +1,77 @@
+"""
+Distance matrix: one-to-many searches and POST /matrix
+"""
+import pytest
+from conftest import make_random_graph, path_length, reference_distances
+from src.domain.entities import GraphOverlay
+from src.infrastructure.algorithms import DistanceMatrixCalculator
+
+
+def cells(matrix):
+    width = len(matrix.targets)
+    return {
+        (source, target): matrix.distances[row * width + column]
+        for row, source in enumerate(matrix.sources)
+        for column, target in enumerate(matrix.targets)
+    }
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_matches_reference(seed):
+    graph = make_random_graph(40, 100, seed=seed)
+    node_ids = sorted(graph.nodes)
+    sources, targets = node_ids[:6] + node_ids[:1], node_ids[3:15]
+    matrix = DistanceMatrixCalculator(max_workers=3).compute(
+        graph, sources, targets, include_paths=True
+    )
+    assert len(matrix.distances) == len(sources) * len(targets)
+    for (source, target), distance in cells(matrix).items():
+        expected = reference_distances(graph, source).get(target)
+        if expected is None:
+            assert distance is None
+        else:
+            assert distance == pytest.approx(expected)
+    for path, distance in zip(matrix.paths, matrix.distances):
+        if distance is None:
+            assert path is None
+        else:
+            assert path_length(graph, path) == pytest.approx(distance)
+
+
+def test_blocked_overlay_matches_reference(grid):
+    blocked = [("0_0", "0_1"), ("3_3", "3_4")]
+    overlay = GraphOverlay.over(grid, blocked)
+    matrix = DistanceMatrixCalculator().compute(overlay, ["0_0", "7_7"], ["3_4", "7_0", "0_0"])
+    for (source, target), distance in cells(matrix).items():
+        assert distance == pytest.approx(reference_distances(grid, source, blocked)[target])
+
+
+def test_unknown_node_is_rejected(grid):
+    with pytest.raises(ValueError):
+        DistanceMatrixCalculator().compute(grid, ["0_0"], ["missing"])
+
+
+def test_endpoint_returns_row_major_distances(client):
+    response = client.post('/matrix', json={
+        "sources": ["A", "H"],
+        "targets": ["H", "A"],
+        "include_paths": True
+    })
+    assert response.status_code == 200
+    body = response.get_json()
+    single = client.post('/optimize', json={"start": "A", "end": "H", "algorithm": "dijkstra"})
+    assert body["distances"][0] == pytest.approx(single.get_json()["distance"])
+    assert body["paths"][0] == single.get_json()["best_path"]
+    assert body["distances"][1] == 0.0
+    # H has no way back to A in the demo graph
+    assert body["distances"][3] is None and body["paths"][3] is None
+
+
+@pytest.mark.parametrize("body", [
+    {"sources": "A", "targets": ["H"]},
+    {"sources": [], "targets": ["H"]},
+    {"sources": ["A"], "targets": ["nowhere"]},
+    {"sources": ["A"] * 101, "targets": ["H"] * 100},
+])
+def test_endpoint_rejects_invalid_requests(client, body):
+    assert client.post('/matrix', json=body).status_code == 400
@@ -0,0 +1,88 @@
+"""
+Exact engines and ACO checked against a reference Dijkstra
+"""
+import random
+import pytest
+from conftest import make_random_graph, path_length, reference_distances
+from src.infrastructure.algorithms import (
+    AntColonyOptimization,
+    AStarAlgorithm,
+    DijkstraAlgorithm
+)
+
+ENGINES = [DijkstraAlgorithm, AStarAlgorithm]
+
+
+def pairs(graph, count, seed):
+    rng = random.Random(seed)
+    node_ids = sorted(graph.nodes)
+    return [tuple(rng.sample(node_ids, 2)) for _ in range(count)]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_grid_distances_match_reference(grid, engine):
+    algorithm = engine()
+    for start, end in pairs(grid, 25, seed=1):
+        expected = reference_distances(grid, start)[end]
+        path = algorithm.find_optimal_path(grid, start, end)
+        assert path.distance == pytest.approx(expected)
+        assert (path.nodes[0], path.nodes[-1]) == (start, end)
+        assert path_length(grid, path.nodes) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_blocked_edges_match_reference(grid, engine):
+    blocked = [("1_1", "1_2"), ("2_2", "3_2"), ("0_3", "0_4"), ("4_4", "4_5")]
+    algorithm = engine()
+    for start, end in pairs(grid, 25, seed=2):
+        expected = reference_distances(grid, start, blocked)[end]
+        path = algorithm.find_optimal_path(grid, start, end, blocked_edges=blocked)
+        assert path.distance == pytest.approx(expected)
+        assert path_length(grid, path.nodes, blocked) == pytest.approx(expected)
+    # The caller's graph is left as it was
+    assert not any(edge.is_blocked for edge in grid.edges)
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_random_graphs_match_reference(engine):
+    algorithm = engine()
+    for seed in range(5):
+        graph = make_random_graph(40, 90, seed=seed)
+        for start, end in pairs(graph, 20, seed=seed):
+            expected = reference_distances(graph, start).get(end)
+            if expected is None:
+                # Unreachable: no path can be built
+                with pytest.raises(ValueError):
+                    algorithm.find_optimal_path(graph, start, end)
+                continue
+            path = algorithm.find_optimal_path(graph, start, end)
+            assert path.distance == pytest.approx(expected)
+
+
+def test_unknown_node_is_rejected(grid):
+    with pytest.raises(ValueError):
+        DijkstraAlgorithm().find_optimal_path(grid, "0_0", "missing")
+
+
+def test_a_star_settles_no_more_nodes_than_dijkstra(grid):
+    dijkstra, a_star = DijkstraAlgorithm(), AStarAlgorithm()
+    dijkstra.find_optimal_path(grid, "0_0", "7_7")
+    a_star.find_optimal_path(grid, "0_0", "7_7")
+    assert a_star.get_run_info()["settled_nodes"] <= dijkstra.get_run_info()["settled_nodes"]
+
+
+def test_aco_paths_are_valid_and_never_beat_the_optimum(grid):
+    aco = AntColonyOptimization(n_ants=10, n_iterations=10)
+    for start, end in pairs(grid, 5, seed=3):
+        expected = reference_distances(grid, start)[end]
+        path = aco.find_optimal_path(grid, start, end)
+        assert (path.nodes[0], path.nodes[-1]) == (start, end)
+        assert path_length(grid, path.nodes) <= path.distance + 1e-9
+        assert path.distance >= expected - 1e-9
+
+
+def test_seeded_aco_finds_the_optimum(grid):
+    aco = AntColonyOptimization(n_ants=5, n_iterations=3, seed_with_shortest_path=True)
+    for start, end in pairs(grid, 5, seed=4):
+        path = aco.find_optimal_path(grid, start, end)
+        assert path.distance == pytest.approx(reference_distances(grid, start)[end])
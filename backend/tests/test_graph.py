@@ -0,0 +1,77 @@
+"""
+Graph entity: adjacency index and versioning
+"""
+from src.domain.entities import Edge, Graph, Node
+
+
+def scan_edge(graph: Graph, from_node: str, to_node: str):
+    """First matching edge by list scan, as before the index existed"""
+    return next((edge for edge in graph.edges
+                 if edge.from_node == from_node and edge.to_node == to_node), None)
+
+
+def small_graph() -> Graph:
+    graph = Graph()
+    for node_id in "ABCD":
+        graph.add_node(Node(node_id, 0.0, 0.0, node_id))
+    graph.add_edge(Edge("A", "B", 1.0))
+    graph.add_edge(Edge("B", "A", 1.0))
+    graph.add_edge(Edge("A", "B", 5.0))  # duplicate pair
+    graph.add_edge(Edge("B", "C", 2.0))
+    graph.add_edge(Edge("C", "D", 3.0))
+    return graph
+
+
+def test_index_matches_list_scan(grid):
+    for edge in grid.edges:
+        assert grid.get_edge(edge.from_node, edge.to_node) == scan_edge(
+            grid, edge.from_node, edge.to_node
+        )
+        assert grid.get_out_edges(edge.from_node) == [
+            other for other in grid.edges if other.from_node == edge.from_node
+        ]
+    assert grid.get_edge("0_0", "7_7") is None
+
+
+def test_block_edge_blocks_both_directions_and_duplicates():
+    graph = small_graph()
+    version = graph.version
+    graph.block_edge("A", "B")
+
+    assert [edge.is_blocked for edge in graph.edges] == [True, True, True, False, False]
+    assert graph.get_edge("A", "B").is_blocked
+    assert all(edge.is_blocked for edge in graph.get_out_edges("A"))
+    assert graph.get_neighbors("A") == []
+    assert graph.get_neighbors("B") == ["C"]
+    assert graph.get_edge_weight("A", "B") == 1.0
+    assert graph.version != version
+
+
+def test_block_missing_edge_is_a_no_op():
+    graph = small_graph()
+    version = graph.version
+    graph.block_edge("A", "D")
+    assert graph.version == version
+    assert not any(edge.is_blocked for edge in graph.edges)
+
+
+def test_index_survives_removals():
+    graph = small_graph()
+    graph.remove_edge("A", "B")
+    graph.block_edge("C", "D")
+    assert graph.get_edge("A", "B") is None
+    assert graph.get_edge("C", "D").is_blocked
+    graph.remove_node("C")
+    assert graph.get_out_edges("B") == []
+    graph.add_edge(Edge("B", "D", 4.0))
+    assert graph.get_neighbors("B") == ["D"]
+
+
+def test_copy_is_independent_and_has_its_own_version():
+    graph = small_graph()
+    copy = graph.copy()
+    assert copy.version != graph.version
+    copy.block_edge("B", "C")
+    assert copy.get_edge("B", "C").is_blocked
+    assert not graph.get_edge("B", "C").is_blocked
+    assert graph.compile().version != copy.compile().version
@@ -0,0 +1,67 @@
+"""
+GraphOverlay: per-request blocked edges compared to the deepcopy baseline
+"""
+import random
+import pytest
+from src.domain.entities import GraphOverlay
+from test_compiled_graph import open_edges
+
+
+def blocked_copy(graph, blocked_edges):
+    """What requests did before overlays: deepcopy, then block"""
+    copy = graph.copy()
+    for from_node, to_node in blocked_edges:
+        copy.block_edge(from_node, to_node)
+    return copy
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_overlay_matches_deepcopy_baseline(grid, seed):
+    rng = random.Random(seed)
+    blocked = [edge.as_tuple() for edge in rng.sample(grid.edges, 10)]
+    # Also edges that do not exist and repeated pairs
+    blocked += [("0_0", "7_7"), blocked[0]]
+    baseline = blocked_copy(grid, blocked)
+    overlay = GraphOverlay.over(grid, blocked)
+
+    assert overlay.edges == baseline.edges
+    for node_id in grid.nodes:
+        assert overlay.get_neighbors(node_id) == baseline.get_neighbors(node_id)
+        assert overlay.get_out_edges(node_id) == baseline.get_out_edges(node_id)
+    for edge in grid.edges:
+        assert overlay.get_edge(*edge.as_tuple()) == baseline.get_edge(*edge.as_tuple())
+    assert open_edges(overlay.compile()) == open_edges(baseline.compile())
+
+
+def test_overlay_leaves_base_untouched(grid):
+    version = grid.version
+    before = list(grid.edges)
+    compiled = grid.compile()
+    overlay = GraphOverlay.over(grid, [("0_0", "0_1")])
+    overlay.compile()
+    assert grid.edges == before
+    assert grid.version == version
+    assert grid.compile() is compiled
+    assert not any(compiled.is_blocked(slot) for slot in range(compiled.edge_count))
+
+
+def test_overlay_of_overlay_extends_blocks(grid):
+    first = GraphOverlay.over(grid, [("0_0", "0_1")])
+    second = GraphOverlay.over(first, [("1_1", "1_2")])
+    assert first.blocked_edges < second.blocked_edges
+    assert ("0_1", "0_0") in second.blocked_edges
+    assert second.base is grid
+    assert open_edges(second.compile()) == open_edges(
+        blocked_copy(grid, [("0_0", "0_1"), ("1_1", "1_2")]).compile()
+    )
+
+
+def test_overlay_recompiles_after_base_mutation(grid):
+    overlay = GraphOverlay.over(grid, [("0_0", "0_1")])
+    first = overlay.compile()
+    grid.block_edge("5_5", "5_6")
+    second = overlay.compile()
+    assert second.version == grid.version != first.version
+    assert open_edges(second) == open_edges(
+        blocked_copy(grid, [("0_0", "0_1")]).compile()
+    )
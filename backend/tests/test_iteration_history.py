@@ -0,0 +1,48 @@
+"""
+Iteration history levels and the cap on recorded iterations
+"""
+import pytest
+from src.config.settings import Config
+from src.infrastructure.algorithms import AntColonyOptimization
+
+
+@pytest.mark.parametrize("level, keys", [
+    ("summary", {"iteration", "best_distance", "paths_found"}),
+    ("paths", {"iteration", "best_distance", "paths_found", "paths", "best_path"}),
+    ("full", {
+        "iteration", "best_distance", "paths_found", "paths", "best_path", "pheromone_levels"
+    }),
+])
+def test_history_keeps_only_the_last_iterations(grid, level, keys):
+    aco = AntColonyOptimization(n_ants=3, n_iterations=12, history_limit=5)
+    aco.find_optimal_path(grid, "0_0", "7_7", history=level)
+    iterations = aco.get_iterations_history()
+    assert [entry["iteration"] for entry in iterations] == list(range(8, 13))
+    assert all(set(entry) == keys for entry in iterations)
+
+
+def test_no_history_by_default(grid):
+    aco = AntColonyOptimization(n_ants=3, n_iterations=4)
+    aco.find_optimal_path(grid, "0_0", "7_7")
+    assert aco.get_iterations_history() == []
+
+
+def test_endpoint_caps_full_history(client):
+    response = client.post('/optimize', json={"start": "A", "end": "H", "history": "full"})
+    assert response.status_code == 200
+    iterations = response.get_json()["iterations"]
+    assert 0 < len(iterations) <= Config.ACO_HISTORY_LIMIT
+    assert all("pheromone_levels" in entry for entry in iterations)
+
+
+def test_endpoint_paths_history_has_no_pheromone(client):
+    response = client.post('/optimize', json={"start": "A", "end": "H", "history": "paths"})
+    iterations = response.get_json()["iterations"]
+    assert iterations and all("pheromone_levels" not in entry for entry in iterations)
+    assert all(entry["paths"] for entry in iterations)
+
+
+@pytest.mark.parametrize("history", ["everything", 3])
+def test_endpoint_rejects_unknown_levels(client, history):
+    response = client.post('/optimize', json={"start": "A", "end": "H", "history": history})
+    assert response.status_code == 400
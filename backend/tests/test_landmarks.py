@@ -0,0 +1,57 @@
+"""
+Landmark (ALT) lower bounds and A* guided by them
+"""
+import pytest
+from conftest import make_random_graph, reference_distances
+from src.config.dependency_container import DependencyContainer
+from src.config.settings import Config
+from src.infrastructure.algorithms import AStarAlgorithm, LandmarkProvider
+
+
+def test_bounds_never_overestimate(grid):
+    compiled = grid.compile()
+    index = LandmarkProvider(count=4).get(compiled)
+    assert len(index.landmarks) == 4
+    for source in list(grid.nodes)[::5]:
+        distances = reference_distances(grid, source)
+        for target, distance in distances.items():
+            bound = index.lower_bound(compiled.node_index[source], compiled.node_index[target])
+            assert bound <= distance + 1e-9
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_a_star_with_landmarks_matches_reference(seed):
+    graph = make_random_graph(40, 100, seed=seed)
+    blocked = [(edge.from_node, edge.to_node) for edge in graph.edges[:3]]
+    algorithm = AStarAlgorithm(landmarks=LandmarkProvider(count=3))
+    for source in list(graph.nodes)[:8]:
+        for blocking in ([], blocked):
+            distances = reference_distances(graph, source, blocking)
+            for target in list(graph.nodes)[-8:]:
+                if target == source or target not in distances:
+                    continue
+                path = algorithm.find_optimal_path(
+                    graph, source, target, blocked_edges=blocking
+                )
+                assert path.distance == pytest.approx(distances[target])
+
+
+def test_index_is_persisted_and_reloaded(grid, tmp_path):
+    path = str(tmp_path / "landmarks.json")
+    compiled = grid.compile()
+    built = LandmarkProvider(count=3, path=path)
+    first = built.get(compiled)
+    loaded = LandmarkProvider(count=3, path=path)
+    second = loaded.get(compiled)
+    assert loaded.stats()["loads"] == 1 and loaded.stats()["builds"] == 0
+    assert second.landmarks == first.landmarks
+    assert [list(table) for table in second.forward] == [list(table) for table in first.forward]
+
+
+def test_disabled_by_default_without_preprocessing():
+    container = DependencyContainer(Config())
+    assert Config.LANDMARK_COUNT == 0
+    assert container.get_landmark_provider() is None
+    # The hierarchy is only built at load when it is the default engine
+    if Config.PATH_ALGORITHM != 'ch':
+        assert container.get_contraction_hierarchy_provider().stats()["builds"] == 0
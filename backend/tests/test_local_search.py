@@ -0,0 +1,66 @@
+"""
+Local search on ant paths and its place in the pheromone update
+"""
+import random
+import pytest
+from conftest import path_length
+from src.infrastructure.algorithms import AntColonyOptimization
+from src.infrastructure.algorithms.local_search import improve_path, remove_loops
+
+
+def random_walk(compiled, start, end, rng):
+    """Ant-like walk that wanders until it happens to reach end"""
+    nodes, slots = [start], []
+    while nodes[-1] != end:
+        slot = rng.choice(list(compiled.open_slots(nodes[-1])))
+        slots.append(slot)
+        nodes.append(compiled.targets[slot])
+    return nodes, slots, sum(compiled.weights[slot] for slot in slots)
+
+
+def test_remove_loops_keeps_first_visits():
+    nodes, slots = remove_loops([0, 1, 2, 1, 3, 0, 4], [10, 11, 12, 13, 14, 15])
+    assert nodes == [0, 4]
+    assert slots == [15]
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_improved_walks_are_valid_and_shorter(grid, seed):
+    compiled = grid.compile()
+    start, end = compiled.node_index["0_0"], compiled.node_index["7_7"]
+    walk = random_walk(compiled, start, end, random.Random(seed))
+    nodes, slots, distance = improve_path(compiled, walk)
+    assert nodes[0] == start and nodes[-1] == end
+    assert len(set(nodes)) == len(nodes)
+    assert [compiled.targets[slot] for slot in slots] == nodes[1:]
+    assert distance <= walk[2]
+    ids = [compiled.node_ids[node] for node in nodes]
+    assert path_length(grid, ids) == pytest.approx(distance)
+
+
+class RecordingACO(AntColonyOptimization):
+    """Records what local search saw and what the pheromone update got"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.calls = []
+
+    def _improve_iteration_best(self, compiled, paths):
+        self.calls.append(("improve", min(distance for _, _, distance in paths)))
+        super()._improve_iteration_best(compiled, paths)
+
+    def _update_pheromone(self, pheromone, paths):
+        self.calls.append(("update", min(distance for _, _, distance in paths)))
+        super()._update_pheromone(pheromone, paths)
+
+
+def test_pheromone_update_reinforces_the_improved_paths(grid):
+    random.seed(3)
+    aco = RecordingACO(n_ants=5, n_iterations=6, local_search=True)
+    aco.find_optimal_path(grid, "0_0", "7_7")
+    steps = [name for name, _ in aco.calls]
+    assert steps == ["improve", "update"] * 6
+    raw = [distance for name, distance in aco.calls if name == "improve"]
+    reinforced = [distance for name, distance in aco.calls if name == "update"]
+    assert all(after <= before for before, after in zip(raw, reinforced))
+    assert any(after < before for before, after in zip(raw, reinforced))
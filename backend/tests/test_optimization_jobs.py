@@ -0,0 +1,123 @@
+"""
+Background route searches: the job queue and POST/GET /jobs
+"""
+import threading
+import time
+import pytest
+from src.app import create_app
+from src.application.use_cases import (
+    FindOptimalPathUseCase,
+    GetOptimizationJobUseCase,
+    JobQueueFullError,
+    SubmitOptimizationJobUseCase
+)
+from src.config.settings import TestingConfig
+from src.infrastructure.algorithms import DijkstraAlgorithm
+from src.infrastructure.repositories import InMemoryGraphRepository, InMemoryJobRepository
+
+
+def wait_for(get, job_id, timeout=5.0):
+    """Poll a job until it is done or failed"""
+    stop = time.monotonic() + timeout
+    while time.monotonic() < stop:
+        job = get(job_id)
+        if job["status"] in ("done", "failed"):
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+@pytest.fixture
+def release(monkeypatch):
+    """Hold every search until the returned event is set"""
+    event = threading.Event()
+    execute = FindOptimalPathUseCase.execute
+
+    def held(self, *args, **kwargs):
+        event.wait(5.0)
+        return execute(self, *args, **kwargs)
+
+    monkeypatch.setattr(FindOptimalPathUseCase, "execute", held)
+    yield event
+    event.set()
+
+
+def test_queue_rejects_beyond_max_pending(release):
+    find = FindOptimalPathUseCase(
+        graph_repository=InMemoryGraphRepository(),
+        path_finder=DijkstraAlgorithm(),
+        default_algorithm="dijkstra"
+    )
+    jobs = InMemoryJobRepository()
+    submit = SubmitOptimizationJobUseCase(find, jobs, max_workers=1, max_pending=2)
+    get = GetOptimizationJobUseCase(jobs)
+    try:
+        first = submit.execute("A", "H")
+        second = submit.execute("A", "nowhere")
+        with pytest.raises(JobQueueFullError):
+            submit.execute("A", "H")
+        assert submit.stats()["rejected"] == 1
+        release.set()
+        done = wait_for(lambda job_id: get.execute(job_id).to_dict(), first.job_id)
+        failed = wait_for(lambda job_id: get.execute(job_id).to_dict(), second.job_id)
+        assert done["result"]["best_path"] == find.execute("A", "H").best_path.nodes
+        assert done["submitted_at"] <= done["started_at"] <= done["finished_at"]
+        # Invalid arguments fail the job, not the submission
+        assert failed["result"] is None and "nowhere" in failed["error"]
+        assert submit.stats()["pending"] == 0
+        submit.execute("A", "H")
+    finally:
+        submit.shutdown()
+
+
+def test_endpoint_runs_a_job(client):
+    response = client.post('/jobs', json={"start": "A", "end": "H", "history": "summary"})
+    assert response.status_code == 202
+    body = response.get_json()
+    assert body["status"] in ("queued", "running", "done")
+    assert response.headers["Location"] == f"/jobs/{body['job_id']}"
+    job = wait_for(lambda job_id: client.get(f'/jobs/{job_id}').get_json(), body["job_id"])
+    assert job["status"] == "done"
+    assert job["result"]["best_path"][0] == "A" and job["result"]["best_path"][-1] == "H"
+    assert job["result"]["iterations"] and "graph_edges" in job["result"]
+
+
+def test_endpoint_answers_429_when_the_queue_is_full(monkeypatch, release):
+    monkeypatch.setattr(TestingConfig, "JOB_MAX_WORKERS", 1)
+    monkeypatch.setattr(TestingConfig, "JOB_MAX_PENDING", 1)
+    client = create_app('testing').test_client()
+    accepted = client.post('/jobs', json={"start": "A", "end": "H"})
+    assert accepted.status_code == 202
+    rejected = client.post('/jobs', json={"start": "A", "end": "H"})
+    assert rejected.status_code == 429
+    assert rejected.headers["Retry-After"] == "1"
+    assert client.get('/metrics').get_json()["jobs"]["rejected"] == 1
+    release.set()
+    job_id = accepted.get_json()["job_id"]
+    job = wait_for(lambda job_id: client.get(f'/jobs/{job_id}').get_json(), job_id)
+    assert job["status"] == "done"
+    assert client.post('/jobs', json={"start": "A", "end": "H"}).status_code == 202
+
+
+def test_unknown_job_is_not_found(client):
+    assert client.get('/jobs/missing').status_code == 404
+
+
+@pytest.mark.parametrize("body", [
+    {},
+    {"start": "A"},
+    {"start": "A", "end": "H", "history": 3},
+    {"start": "A", "end": "H", "deadline_ms": "soon"},
+])
+def test_endpoint_rejects_invalid_requests(client, body):
+    assert client.post('/jobs', json=body).status_code == 400
+
+
+def test_endpoint_fails_jobs_with_invalid_arguments(client):
+    # Well-formed requests are queued; the search itself rejects the level
+    response = client.post('/jobs', json={"start": "A", "end": "H", "history": "everything"})
+    assert response.status_code == 202
+    job = wait_for(
+        lambda job_id: client.get(f'/jobs/{job_id}').get_json(), response.get_json()["job_id"]
+    )
+    assert job["status"] == "failed" and "everything" in job["error"]
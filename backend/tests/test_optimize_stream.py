@@ -0,0 +1,143 @@
+"""
+Streaming iterations: pheromone deltas and POST /optimize/stream
+"""
+import json
+import random
+import threading
+import time
+import pytest
+from src.infrastructure.algorithms import (
+    AntColonyOptimization,
+    IslandModelACO,
+    VectorizedAntColonyOptimization
+)
+from src.infrastructure.algorithms import aco_algorithm
+from src.infrastructure.algorithms.iteration_history import IterationHistory
+
+
+def sse_events(text):
+    events = []
+    for block in text.strip().split("\n\n"):
+        name, data = block.split("\n")
+        assert name.startswith("event: ") and data.startswith("data: ")
+        events.append((name[len("event: "):], json.loads(data[len("data: "):])))
+    return events
+
+
+def test_deltas_rebuild_the_buffered_levels(grid):
+    aco = AntColonyOptimization(n_ants=4, n_iterations=6)
+    random.seed(7)
+    streamed = []
+    aco.find_optimal_path(grid, "0_0", "7_7", history="full", on_iteration=streamed.append)
+    random.seed(7)
+    aco.find_optimal_path(grid, "0_0", "7_7", history="full")
+    buffered = aco.get_iterations_history()
+    assert len(streamed) == len(buffered) == 6
+
+    levels = streamed[0]["pheromone_levels"]
+    assert "pheromone_delta" not in streamed[0]
+    for entry, expected in zip(streamed, buffered):
+        if "pheromone_delta" in entry:
+            delta = entry["pheromone_delta"]
+            levels = {key: level * delta["decay"] for key, level in levels.items()}
+            levels.update(delta["levels"])
+        assert entry["best_distance"] == expected["best_distance"]
+        assert levels == pytest.approx(expected["pheromone_levels"])
+
+
+class TruthRecorder(IterationHistory):
+    """Keeps a dense copy of the pheromone the engine hands over per iteration"""
+
+    tables = []
+
+    def record(self, *args, **kwargs):
+        pheromone = args[4] if len(args) > 4 else kwargs.get("pheromone")
+        # PheromoneStore has no bounded iteration, so index it
+        TruthRecorder.tables.append([pheromone[slot] for slot in range(len(pheromone))])
+        super().record(*args, **kwargs)
+
+
+@pytest.mark.parametrize("engine", [
+    lambda: AntColonyOptimization(n_ants=4, n_iterations=6),
+    lambda: VectorizedAntColonyOptimization(n_ants=4, n_iterations=6),
+    lambda: IslandModelACO(n_ants=4, n_iterations=6, n_colonies=2, migration_interval=2),
+])
+def test_deltas_follow_the_recorded_pheromone(grid, monkeypatch, engine):
+    monkeypatch.setattr(aco_algorithm, "IterationHistory", TruthRecorder)
+    TruthRecorder.tables = []
+    aco = engine()
+    streamed = []
+    try:
+        aco.find_optimal_path(grid, "0_0", "7_7", history="full", on_iteration=streamed.append)
+    finally:
+        if isinstance(aco, IslandModelACO):
+            aco.shutdown()
+    compiled = grid.compile()
+    keys = {
+        str((compiled.node_ids[source], compiled.node_ids[compiled.targets[slot]])): slot
+        for source in range(compiled.node_count) for slot in compiled.open_slots(source)
+    }
+    assert len(streamed) == len(TruthRecorder.tables) == 6
+    levels = {}
+    for entry, table in zip(streamed, TruthRecorder.tables):
+        if "pheromone_levels" in entry:
+            levels = dict(entry["pheromone_levels"])
+        else:
+            delta = entry["pheromone_delta"]
+            levels = {key: level * delta["decay"] for key, level in levels.items()}
+            levels.update(delta["levels"])
+        assert levels == pytest.approx({key: table[slot] for key, slot in keys.items()})
+
+
+def test_endpoint_streams_iterations_then_the_result(client):
+    response = client.post('/optimize/stream', json={"start": "A", "end": "H"})
+    assert response.status_code == 200
+    assert response.mimetype == "text/event-stream"
+    events = sse_events(response.get_data(as_text=True))
+    names = [name for name, _ in events]
+    assert names[-1] == "result" and set(names[:-1]) == {"iteration"}
+    assert [payload["iteration"] for _, payload in events[:-1]] == list(range(1, len(events)))
+    assert "pheromone_levels" in events[0][1]
+    result = events[-1][1]
+    assert result["best_path"][0] == "A" and result["best_path"][-1] == "H"
+    assert "iterations" not in result and "graph_edges" in result
+
+
+def test_endpoint_sends_ndjson_when_accepted(client):
+    response = client.post(
+        '/optimize/stream', json={"start": "A", "end": "H", "history": "summary"},
+        headers={"Accept": "application/x-ndjson"}
+    )
+    assert response.mimetype == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert lines[-1]["event"] == "result"
+    assert all(set(line["data"]) == {"iteration", "best_distance", "paths_found"}
+               for line in lines[:-1])
+
+
+def test_exact_algorithms_send_only_the_result(client):
+    response = client.post('/optimize/stream', json={
+        "start": "A", "end": "H", "algorithm": "dijkstra"
+    })
+    assert [name for name, _ in sse_events(response.get_data(as_text=True))] == ["result"]
+
+
+def test_closing_the_stream_stops_the_search(client):
+    response = client.post(
+        '/optimize/stream', json={"start": "A", "end": "H", "deadline_ms": 3000},
+        buffered=False
+    )
+    next(iter(response.response))
+    response.close()
+    time.sleep(0.5)
+    assert not [thread for thread in threading.enumerate() if thread.name == "route-stream"]
+
+
+@pytest.mark.parametrize("body", [
+    {},
+    {"start": "A", "end": "nowhere"},
+    {"start": "A", "end": "H", "history": "everything"},
+    {"start": "A", "end": "H", "deadline_ms": -1},
+])
+def test_endpoint_rejects_invalid_requests(client, body):
+    assert client.post('/optimize/stream', json=body).status_code == 400
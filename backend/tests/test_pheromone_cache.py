@@ -0,0 +1,80 @@
+"""
+Warm-start pheromone cache: sparse entries and seeding
+"""
+import random
+from array import array
+import numpy as np
+import pytest
+from src.infrastructure.algorithms import (
+    AntColonyOptimization,
+    VectorizedAntColonyOptimization
+)
+from src.infrastructure.algorithms.pheromone_store import PheromoneStore
+from src.infrastructure.caching import PheromoneCache
+
+KEY = (1, 0, 5, frozenset())
+
+
+def evaporated_store(size=50, seed=4):
+    """A store after a few iterations of evaporation and deposits"""
+    rng = random.Random(seed)
+    store = PheromoneStore(size)
+    for _ in range(6):
+        store.evaporate(0.5)
+        store.deposit(rng.sample(range(size), 4), rng.uniform(0.1, 2.0))
+    return store
+
+
+def levels(pheromone):
+    """Every level of a PheromoneStore or NumPy table"""
+    return [float(pheromone[slot]) for slot in range(len(pheromone))]
+
+
+def dense_blend(initial, table, retention):
+    """Seeding as it was before entries were sparse"""
+    return [level + (cached - level) * retention for level, cached in zip(initial, table)]
+
+
+def test_entries_only_keep_deposited_slots():
+    store = evaporated_store()
+    cache = PheromoneCache(half_life_s=0)
+    cache.store(KEY, store)
+    seed = cache.lookup(KEY)
+    unscaled, _ = store.unscaled
+    assert seed.size == len(store)
+    assert seed.levels.keys() == unscaled.keys()
+    table = store.to_array()
+    for slot in range(len(store)):
+        assert seed.levels.get(slot, seed.background) == pytest.approx(table[slot])
+
+
+def test_dense_tables_are_stored_sparse():
+    table = array('d', [0.25] * 40)
+    table[3] = 2.0
+    table[17] = 0.5
+    cache = PheromoneCache(half_life_s=0)
+    cache.store(KEY, np.frombuffer(table, dtype=np.float64))
+    seed = cache.lookup(KEY)
+    assert (seed.size, seed.background, seed.levels) == (40, 0.25, {3: 2.0, 17: 0.5})
+
+
+@pytest.mark.parametrize("fresh", [True, False])
+def test_store_blend_matches_dense_blend(fresh):
+    initial = PheromoneStore(50) if fresh else evaporated_store(seed=9)
+    cached = evaporated_store()
+    expected = dense_blend(initial.to_array(), cached.to_array(), 0.3)
+    initial.blend(*cached.sparse(), 0.3)
+    assert initial.to_array().tolist() == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("engine", [AntColonyOptimization, VectorizedAntColonyOptimization])
+def test_warm_start_seeds_like_dense_blend(grid, engine):
+    cached = evaporated_store(size=grid.compile().edge_count)
+    cache = PheromoneCache(half_life_s=0, nearby_retention=0.5)
+    cache.store(KEY, cached)
+    aco = engine(pheromone_cache=cache)
+    pheromone = aco._initialize_pheromone(grid.compile())
+    expected = dense_blend(levels(pheromone), cached.to_array(), 0.5)
+    # Same route with other blocked edges: a nearby match at half retention
+    assert aco._warm_start((1, 0, 5, frozenset({2})), pheromone) == 'nearby'
+    assert levels(pheromone) == pytest.approx(expected)
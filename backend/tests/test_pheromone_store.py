@@ -0,0 +1,59 @@
+"""
+PheromoneStore: lazy evaporation against an eagerly updated table
+"""
+import random
+import pytest
+from src.infrastructure.algorithms.pheromone_store import PheromoneStore
+
+
+def levels(store):
+    return [store[slot] for slot in range(len(store))]
+
+
+@pytest.mark.parametrize("retention", [0.9, 0.5, 1e-3])
+def test_matches_dense_table(retention):
+    rng = random.Random(7)
+    size = 30
+    store = PheromoneStore(size)
+    dense = [1.0] * size
+    # 1e-3 ** 60 underflows min_scale, so the store renormalizes on the way
+    for _ in range(60):
+        store.evaporate(retention)
+        dense = [level * retention for level in dense]
+        slots = rng.sample(range(size), 5)
+        amount = rng.uniform(0.01, 1.0)
+        store.deposit(slots, amount)
+        for slot in slots:
+            dense[slot] += amount
+        slot = rng.randrange(size)
+        store[slot] = dense[slot] = rng.uniform(0.0, 2.0)
+        assert levels(store) == pytest.approx(dense, rel=1e-9)
+    assert store.to_array().tolist() == pytest.approx(dense, rel=1e-9)
+
+
+def test_full_evaporation_clears_every_level():
+    store = PheromoneStore(4)
+    store.deposit([1, 2], 3.0)
+    store.evaporate(0.0)
+    assert levels(store) == [0.0] * 4
+    store.deposit([2], 1.5)
+    assert levels(store) == [0.0, 0.0, 1.5, 0.0]
+
+
+def test_from_levels_copies_the_table():
+    table = [0.5, 1.5, 2.5]
+    store = PheromoneStore.from_levels(table)
+    store.evaporate(0.5)
+    assert levels(store) == [0.25, 0.75, 1.25]
+    assert table == [0.5, 1.5, 2.5]
+
+
+def test_take_changes_reports_deposits_not_evaporation():
+    store = PheromoneStore(10)
+    assert store.take_changes() is None
+    store.evaporate(0.5)
+    assert store.take_changes() == set()
+    store.deposit([3, 4], 1.0)
+    store[7] = 2.0
+    assert store.take_changes() == {3, 4, 7}
+    assert store.take_changes() == set()
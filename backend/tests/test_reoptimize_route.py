@@ -0,0 +1,147 @@
+"""
+Re-optimization after edges are blocked: repair splicing and POST /reoptimize
+"""
+import pytest
+from conftest import path_length, reference_distances
+from src.application.use_cases import FindOptimalPathUseCase, ReoptimizeRouteUseCase
+from src.domain.entities import Edge, Graph, Node, Path, RouteRecord
+from src.infrastructure.algorithms import DijkstraAlgorithm
+from src.infrastructure.repositories import InMemoryGraphRepository
+from src.infrastructure.repositories.in_memory_result_repository import InMemoryResultRepository
+
+# Both ways: S-A-B-C-T is the route, A-X-C a detour around B-C, S-Y-T a
+# long way around everything
+EDGES = [
+    ("S", "A", 1.0), ("A", "B", 1.0), ("B", "C", 1.0), ("C", "T", 1.0),
+    ("A", "X", 1.5), ("X", "C", 1.5), ("S", "Y", 10.0), ("Y", "T", 10.0),
+]
+# One way only: S-Z-T, where Z has no other way out
+ONE_WAY = [("S", "Z", 20.0), ("Z", "T", 20.0)]
+ROUTE = ["S", "A", "B", "C", "T"]
+
+
+class DetourGraphRepository(InMemoryGraphRepository):
+    """Repository holding the detour graph instead of the demo one"""
+
+    # Edges added ahead of the others, so get_edge() returns them for a pair
+    first_edges = []
+
+    def _initialize_default_graph(self) -> Graph:
+        graph = Graph()
+        for node_id in "SABCTXYZ":
+            graph.add_node(Node(node_id, 21.0, 105.0, node_id))
+        for edge in self.first_edges:
+            graph.add_edge(edge)
+        for from_node, to_node, weight in EDGES:
+            graph.add_edge(Edge(from_node, to_node, weight))
+            graph.add_edge(Edge(to_node, from_node, weight))
+        for from_node, to_node, weight in ONE_WAY:
+            graph.add_edge(Edge(from_node, to_node, weight))
+        return graph
+
+
+class ParallelEdgeRepository(DetourGraphRepository):
+    """Detour graph with a blocked B-C and a longer C-T in parallel"""
+
+    first_edges = [Edge("B", "C", 0.5, is_blocked=True), Edge("C", "T", 3.0)]
+
+
+def reoptimize_on(repository):
+    results = InMemoryResultRepository()
+    find = FindOptimalPathUseCase(
+        graph_repository=repository,
+        path_finder=DijkstraAlgorithm(),
+        default_algorithm="dijkstra",
+        result_repository=results
+    )
+    return ReoptimizeRouteUseCase(repository, find, results)
+
+
+@pytest.fixture
+def reoptimize():
+    return reoptimize_on(DetourGraphRepository())
+
+
+def previous(nodes=ROUTE):
+    return RouteRecord(
+        start=nodes[0], end=nodes[-1], blocked_edges=frozenset(),
+        path=Path(nodes=nodes, distance=float(len(nodes) - 1)), algorithm="dijkstra"
+    )
+
+
+def test_route_avoiding_the_blocks_is_kept(reoptimize):
+    result = reoptimize.execute(previous=previous(), blocked_edges=[("X", "C")])
+    assert result.reoptimized == "unchanged"
+    assert result.best_path.nodes == ROUTE
+    assert result.best_path.distance == pytest.approx(4.0)
+
+
+def test_parallel_edges_use_the_cheapest_open_one():
+    result = reoptimize_on(ParallelEdgeRepository()).execute(previous=previous())
+    assert result.reoptimized == "unchanged"
+    assert result.best_path.distance == pytest.approx(4.0)
+
+
+def test_repair_is_spliced_without_loops(reoptimize):
+    # The repair from B to C backtracks through A, which the kept head
+    # already visits: the spliced route must not walk A-B-A
+    result = reoptimize.execute(previous=previous(), blocked_edges=[("B", "C")])
+    graph = DetourGraphRepository().get_graph()
+    assert result.reoptimized == "repaired"
+    assert result.best_path.nodes == ["S", "A", "X", "C", "T"]
+    assert result.best_path.distance == pytest.approx(5.0)
+    assert result.best_path.distance == pytest.approx(
+        path_length(graph, result.best_path.nodes, [("B", "C")])
+    )
+    assert result.best_path.distance == pytest.approx(
+        reference_distances(graph, "S", [("B", "C")])["T"]
+    )
+
+
+def test_repair_through_the_start_collapses_to_the_detour(reoptimize):
+    # B reaches C only back through S and around by Y and T
+    result = reoptimize.execute(previous=previous(), blocked_edges=[("B", "C"), ("X", "C")])
+    assert result.reoptimized == "repaired"
+    assert result.best_path.nodes == ["S", "Y", "T"]
+    assert result.best_path.distance == pytest.approx(20.0)
+
+
+def test_unrepairable_stretch_recomputes_the_route(reoptimize):
+    result = reoptimize.execute(previous=previous(["S", "Z", "T"]), blocked_edges=[("Z", "T")])
+    assert result.reoptimized == "recomputed"
+    assert result.best_path.nodes == ROUTE
+
+
+def test_blocks_accumulate_over_stored_results(reoptimize):
+    first = reoptimize.execute(previous=previous(), blocked_edges=[("B", "C")])
+    assert first.result_id is not None
+    second = reoptimize.execute(result_id=first.result_id, blocked_edges=[("X", "C")])
+    # B-C is still blocked from the first call
+    assert second.best_path.nodes == ["S", "Y", "T"]
+    with pytest.raises(ValueError):
+        reoptimize.execute(result_id="missing")
+
+
+def test_endpoint_repairs_a_stored_route(client):
+    route = client.post('/optimize', json={"start": "A", "end": "H", "algorithm": "dijkstra"})
+    body = route.get_json()
+    nodes = body["best_path"]
+    broken = [nodes[1], nodes[2]]
+    response = client.post('/reoptimize', json={
+        "result_id": body["result_id"], "blocked_edges": [broken]
+    })
+    assert response.status_code == 200
+    repaired = response.get_json()
+    assert repaired["reoptimized"] in ("repaired", "recomputed")
+    assert tuple(broken) not in zip(repaired["best_path"], repaired["best_path"][1:])
+    assert repaired["best_path"][0] == "A" and repaired["best_path"][-1] == "H"
+    assert repaired["result_id"] not in (None, body["result_id"])
+
+
+@pytest.mark.parametrize("body", [
+    {},
+    {"result_id": "missing"},
+    {"previous": {"start": "A"}},
+])
+def test_endpoint_rejects_invalid_requests(client, body):
+    assert client.post('/reoptimize', json=body).status_code == 400
@@ -0,0 +1,98 @@
+"""
+RouletteSampler: cumulative-table draws follow pheromone^alpha * heuristic^beta
+"""
+import random
+from collections import Counter
+import pytest
+from src.domain.entities import Edge, Graph, Node
+from src.infrastructure.algorithms.pheromone_store import PheromoneStore
+from src.infrastructure.algorithms.roulette_sampler import RouletteSampler
+
+DRAWS = 40000
+
+
+def star(weights):
+    """Node "S" with one edge of each weight to "T0", "T1", ..."""
+    graph = Graph()
+    graph.add_node(Node("S", 0.0, 0.0, "S"))
+    for index, weight in enumerate(weights):
+        graph.add_node(Node(f"T{index}", 0.0, 0.0, f"T{index}"))
+        graph.add_edge(Edge("S", f"T{index}", weight))
+    return graph.compile()
+
+
+def frequencies(sampler, pheromone, node):
+    sampler.refresh(pheromone)
+    counts = Counter(sampler.draw(pheromone, node) for _ in range(DRAWS))
+    return {slot: count / DRAWS for slot, count in counts.items()}
+
+
+def expected(compiled, pheromone, node, alpha, beta, slots=None):
+    slots = slots or compiled.open_slots(node)
+    weights = {
+        slot: pheromone[slot] ** alpha * (1.0 / compiled.weights[slot]) ** beta
+        for slot in slots
+    }
+    total = sum(weights.values())
+    return {slot: weight / total for slot, weight in weights.items()}
+
+
+def assert_close(observed, wanted):
+    assert observed.keys() <= wanted.keys()
+    for slot, probability in wanted.items():
+        assert observed.get(slot, 0.0) == pytest.approx(probability, abs=0.01)
+
+
+@pytest.mark.parametrize("alpha, beta", [(1.0, 1.0), (1.0, 2.0), (2.0, 1.0)])
+def test_draws_follow_the_weights(alpha, beta):
+    random.seed(11)
+    compiled = star([1.0, 2.0, 4.0, 8.0])
+    node = compiled.node_index["S"]
+    pheromone = PheromoneStore(compiled.edge_count)
+    pheromone.deposit([compiled.open_slots(node)[3]], 2.0)
+    sampler = RouletteSampler(compiled, alpha, beta)
+    assert_close(
+        frequencies(sampler, pheromone, node),
+        expected(compiled, pheromone, node, alpha, beta)
+    )
+
+
+def test_deposits_refresh_stale_tables():
+    random.seed(12)
+    compiled = star([1.0, 1.0, 1.0])
+    node = compiled.node_index["S"]
+    pheromone = PheromoneStore(compiled.edge_count)
+    sampler = RouletteSampler(compiled, 1.0, 1.0)
+    assert_close(
+        frequencies(sampler, pheromone, node),
+        expected(compiled, pheromone, node, 1.0, 1.0)
+    )
+    # Evaporation leaves the proportions (and the tables) as they were
+    pheromone.evaporate(0.5)
+    pheromone.deposit([compiled.open_slots(node)[0]], 1.5)
+    assert_close(
+        frequencies(sampler, pheromone, node),
+        expected(compiled, pheromone, node, 1.0, 1.0)
+    )
+
+
+def test_candidate_list_keeps_the_shortest_slots():
+    random.seed(13)
+    compiled = star([5.0, 1.0, 3.0, 2.0, 4.0])
+    node = compiled.node_index["S"]
+    pheromone = PheromoneStore(compiled.edge_count)
+    sampler = RouletteSampler(compiled, 1.0, 1.0, candidate_list_size=2)
+    shortest = sorted(compiled.open_slots(node), key=lambda slot: compiled.weights[slot])[:2]
+    assert sorted(sampler.candidates(node)) == sorted(shortest)
+    assert_close(
+        frequencies(sampler, pheromone, node),
+        expected(compiled, pheromone, node, 1.0, 1.0, shortest)
+    )
+
+
+def test_node_without_open_slots_draws_nothing():
+    compiled = star([1.0])
+    pheromone = PheromoneStore(compiled.edge_count)
+    sampler = RouletteSampler(compiled, 1.0, 1.0)
+    sampler.refresh(pheromone)
+    assert sampler.draw(pheromone, compiled.node_index["T0"]) is None
@@ -0,0 +1,41 @@
+"""
+Lockstep NumPy ACO engine and its selection through ACO_ENGINE
+"""
+import pytest
+from conftest import path_length, reference_distances
+from src.config.dependency_container import DependencyContainer
+from src.config.settings import Config
+from src.infrastructure.algorithms import (
+    AntColonyOptimization,
+    IslandModelACO,
+    VectorizedAntColonyOptimization
+)
+
+
+@pytest.mark.parametrize("engine, expected", [
+    ("standard", AntColonyOptimization),
+    ("vectorized", VectorizedAntColonyOptimization),
+    ("island", IslandModelACO),
+])
+def test_engine_is_selected_by_config(engine, expected):
+    config = type("EngineConfig", (Config,), {"ACO_ENGINE": engine})
+    assert type(DependencyContainer(config()).get_aco_algorithm()) is expected
+
+
+def test_standard_engine_is_the_default():
+    assert Config.ACO_ENGINE == "standard"
+
+
+def test_unknown_engine_is_rejected():
+    config = type("EngineConfig", (Config,), {"ACO_ENGINE": "quantum"})
+    with pytest.raises(ValueError):
+        DependencyContainer(config()).get_aco_algorithm()
+
+
+def test_paths_are_valid_and_avoid_blocks(grid):
+    blocked = [("0_0", "0_1")]
+    aco = VectorizedAntColonyOptimization(n_ants=20, n_iterations=10)
+    path = aco.find_optimal_path(grid, "0_0", "5_5", blocked_edges=blocked)
+    assert path.nodes[0] == "0_0" and path.nodes[-1] == "5_5"
+    assert path_length(grid, path.nodes, blocked) == pytest.approx(path.distance)
+    assert path.distance >= reference_distances(grid, "0_0", blocked)["5_5"] - 1e-9
@@ -192,7 +192,9 @@ function App() {
       const response = await axios.post("http://localhost:5000/optimize", {
         start,
         end,
-        blocked_edges: blockedEdges
+        blocked_edges: blockedEdges,
+        // Pheromone snapshots are only needed to draw the trails
+        history: showPheromone ? "full" : "paths"
       }, {
         timeout: 30000, // 30 seconds timeout
         maxContentLength: 10 * 1024 * 1024, // 10MB max
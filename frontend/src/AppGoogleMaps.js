@@ -151,7 +151,9 @@ function App() {
       const response = await axios.post("http://localhost:5000/optimize", {
         start,
         end,
-        blocked_edges: blockedEdges
+        blocked_edges: blockedEdges,
+        // Pheromone snapshots are only needed to draw the trails
+        history: showPheromone ? "full" : "paths"
       });
       setResult(response.data);
       setGraph({